@@ -2,167 +2,22 @@ import pandas as pd
 import numpy as np
 from collections import deque
 from textwrap import shorten
-from datetime import datetime, timedelta
 
+from dados.calendario_copas import carregar_calendario_copas
+from dados.carregador import padronizar_partidas
 
-anos = list(range(2006, 2021))  # 2006 até 2012
-df_copa_brasil_list = []
-df_libertadores_list = []
-df_sudamericana_list = []
+
+anos = list(range(2006, 2021))  # 2006 até 2020
 
 # ============================================================================
-# 1. FUNÇÕES AUXILIARES E MOTOR DE CÁLCULO
+# 1. CALENDÁRIO DE COPAS (cada CSV lido uma vez; cache em dados/armazem/cache)
 # ============================================================================
-for ano in anos:
-    caminho_copa_brasil = f'dados/copadobrasil/copadobrasil{ano}.csv'
-    caminho_libertadores = f'dados/libertadores/libertadores{ano}.csv'
-    caminho_sudamericana = f'dados/sudamericana/sudamericana{ano}.csv'
-    try:
-        df_copa_brasil = pd.read_csv(caminho_copa_brasil)
-        df_libertadores = pd.read_csv(caminho_libertadores)
-        df_sudamericana = pd.read_csv(caminho_sudamericana)
-        
-        df_cb = pd.read_csv(caminho_copa_brasil)
-        df_cb['Ano'] = ano
-        df_copa_brasil_list.append(df_cb)
-        
-        df_lib = pd.read_csv(caminho_libertadores)
-        df_lib['Ano'] = ano
-        df_libertadores_list.append(df_lib)
-        
-        df_sud = pd.read_csv(caminho_sudamericana)
-        df_sud['Ano'] = ano
-        df_sudamericana_list.append(df_sud)
-    except FileNotFoundError:
-        continue
-
-# Concatena todos os DataFrames
-try:
-    df_copa_brasil = pd.concat(df_copa_brasil_list, ignore_index=True)
-    df_libertadores = pd.concat(df_libertadores_list, ignore_index=True)
-    df_sudamericana = pd.concat(df_sudamericana_list, ignore_index=True)
-    
-except Exception as e:
-    print(f"❌ Erro ao concatenar DataFrames: {e}")
-    exit()
-
-# --- ETAPA 2: PROCESSAMENTO DOS DADOS DE COPA ---
-# --- FUNÇÃO PARA PROCESSAR JOGOS DE COPA ---
-def processar_jogos_copa(df_copa, competicao):
-    """Processa os jogos de copa e retorna um dicionário com informações por time"""
-    jogos_por_time = {}
-    
-    # Verifica os nomes das colunas e ajusta conforme necessário
-    coluna_mandante = None
-    coluna_visitante = None
-    coluna_data = None
-    coluna_fase = None
-    
-    # Mapeia possíveis nomes de colunas
-    possiveis_colunas = {
-        'mandante': ['Time Mandante', 'Mandante', 'Time da Casa', 'Casa'],
-        'visitante': ['Time Visitante', 'Visitante', 'Time de Fora', 'Fora'],
-        'data': ['Data', 'Date', 'Dia'],
-        'fase': ['Fase', 'Phase', 'Stage', 'Rodada']
-    }
-    
-    for col in df_copa.columns:
-        col_lower = col.lower()
-        if any(x.lower() in col_lower for x in possiveis_colunas['mandante']):
-            coluna_mandante = col
-        elif any(x.lower() in col_lower for x in possiveis_colunas['visitante']):
-            coluna_visitante = col
-        elif any(x.lower() in col_lower for x in possiveis_colunas['data']):
-            coluna_data = col
-        elif any(x.lower() in col_lower for x in possiveis_colunas['fase']):
-            coluna_fase = col
-    
-    if not all([coluna_mandante, coluna_visitante, coluna_data]):
-        print(f"❌ Colunas não encontradas em {competicao}")
-        return jogos_por_time
-    
-    for _, jogo in df_copa.iterrows():
-        try:
-            # Converte a data para formato datetime (tenta diferentes formatos)
-            data_str = str(jogo[coluna_data])
-            data_jogo = None
-            
-            # Tenta diferentes formatos de data
-            formatos_data = ['%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y']
-            for formato in formatos_data:
-                try:
-                    data_jogo = datetime.strptime(data_str, formato)
-                    break
-                except ValueError:
-                    continue
-            
-            if data_jogo is None:
-                continue
-            
-            # Adiciona informações para o time mandante
-            mandante = str(jogo[coluna_mandante]).strip()
-            if mandante and mandante != 'nan':
-                if mandante not in jogos_por_time:
-                    jogos_por_time[mandante] = []
-                
-                fase = str(jogo[coluna_fase]).strip() if coluna_fase else 'F'
-                jogos_por_time[mandante].append({
-                    'data': data_jogo,
-                    'competicao': competicao,
-                    'fase': fase,
-                    'adversario': str(jogo[coluna_visitante]).strip(),
-                    'local': 'casa'
-                })
-            
-            # Adiciona informações para o time visitante
-            visitante = str(jogo[coluna_visitante]).strip()
-            if visitante and visitante != 'nan':
-                if visitante not in jogos_por_time:
-                    jogos_por_time[visitante] = []
-                
-                fase = str(jogo[coluna_fase]).strip() if coluna_fase else 'F'
-                jogos_por_time[visitante].append({
-                    'data': data_jogo,
-                    'competicao': competicao,
-                    'fase': fase,
-                    'adversario': str(jogo[coluna_mandante]).strip(),
-                    'local': 'fora'
-                })
-            
-        except (ValueError, KeyError) as e:
-            continue
-    
-    return jogos_por_time
-
-# Processa os jogos de copa
-jogos_copa_brasil = processar_jogos_copa(df_copa_brasil, 'Copa do Brasil')
-jogos_libertadores = processar_jogos_copa(df_libertadores, 'Libertadores')
-jogos_sudamericana = processar_jogos_copa(df_sudamericana, 'Sudamericana')
-    
-# Combina os dois dicionários
-todos_jogos_copa = {}
-for time in set(list(jogos_copa_brasil.keys()) + list(jogos_libertadores.keys()) + list(jogos_sudamericana.keys())):
-    todos_jogos_copa[time] = (jogos_copa_brasil.get(time, []) + 
-                             jogos_libertadores.get(time, []) + 
-                             jogos_sudamericana.get(time, []))
-
-# Ordena os jogos por data para cada time
-for time in todos_jogos_copa:
-    if todos_jogos_copa[time]:  # Verifica se há jogos
-        todos_jogos_copa[time].sort(key=lambda x: x['data'])
+todos_jogos_copa = carregar_calendario_copas(anos)
     
 # ============================================================================
 # FUNÇÕES AUXILIARES
 # ============================================================================
 
-def extrair_gols(placar):
-    """Extrai gols do placar no formato 'X-Y'."""
-    try:
-        gols = str(placar).replace('–', '-').split('-')
-        return int(gols[0]), int(gols[1])
-    except:
-        return 0, 0
-
 def calcular_momentum_ia(deque_resultados):
     """Calcula momentum ponderado dos últimos resultados (V/E/D)."""
     if not deque_resultados:
@@ -223,12 +78,8 @@ def gerar_features_completas(df_jogos, df_times, df_copas=None, stats_h2h=None):
     if stats_h2h is None:
         stats_h2h = {}
     
-    df_jogos['Data_Datetime'] = pd.to_datetime(
-        df_jogos['Data'], 
-        format='%d/%m/%y', 
-        dayfirst=True, 
-        errors='coerce'
-    )
+    # Datas e placares numa única passada vetorizada (ver dados/carregador.py)
+    df_jogos = padronizar_partidas(df_jogos)
     # Mapeamento região
     
     df_jogos['Rodada'] = pd.to_numeric(df_jogos['Rodada'], errors='coerce')
@@ -239,12 +90,10 @@ def gerar_features_completas(df_jogos, df_times, df_copas=None, stats_h2h=None):
     df_jogos = df_jogos.dropna(subset=['Data']).copy()
     df_jogos = df_jogos.sort_values(by='Rodada').reset_index(drop=True)
     
-    df_jogos['Gols_Mandante'] = df_jogos['Placar'].apply(lambda p: extrair_gols(p)[0])
-    df_jogos['Gols_Visitante'] = df_jogos['Placar'].apply(lambda p: extrair_gols(p)[1])
-        
-        
-    # Média de gols da liga
-    media_gols_liga = df_jogos['Gols_Mandante'].mean() if not df_jogos.empty else 1.2
+
+    # Média de gols da liga (só placares válidos: 'vs', 'ANU', 'WO' não contam como 0-0)
+    placar_valido = df_jogos['Placar_Valido']
+    media_gols_liga = df_jogos.loc[placar_valido, 'Gols_Mandante'].mean() if placar_valido.any() else 1.2
     
     mapa_time_regiao = df_times.set_index('time')['região'].to_dict()
     
@@ -307,7 +156,7 @@ def gerar_features_completas(df_jogos, df_times, df_copas=None, stats_h2h=None):
             
             # Preenchemos as listas com o histórico ACUMULADO até aqui
             # Após registrar, atualizamos o histórico com o resultado do jogo atual
-            g_m, g_v = jogo['Gols_Mandante'], jogo['Gols_Visitante']
+            g_m, g_v = int(jogo['Gols_Mandante']), int(jogo['Gols_Visitante'])
             if eh_serie_b == 1: 
                 listas_features['H2H_Vits_M_Casa'].append(0)    # Quantas vezes M ganhou de V em casa
                 listas_features['H2H_Derrotas_M_Casa'].append(0) # Quantas vezes M perdeu de V em casa
@@ -327,7 +176,9 @@ def gerar_features_completas(df_jogos, df_times, df_copas=None, stats_h2h=None):
                 if confronto_direto not in stats_h2h:
                     stats_h2h[confronto_direto] = {'v_m': 0, 'v_v': 0, 'e': 0}
                 
-                if g_m > g_v:
+                if not jogo['Placar_Valido']:
+                    pass  # Jogo sem placar (vs/ANU/WO): não entra no histórico
+                elif g_m > g_v:
                     stats_h2h[confronto_direto]['v_m'] += 3
                 elif g_v > g_m:
                     stats_h2h[confronto_direto]['v_v'] += 3
@@ -402,7 +253,10 @@ def gerar_features_completas(df_jogos, df_times, df_copas=None, stats_h2h=None):
             listas_features['Delta_Soberba'].append(sob_m - sob_v)
             
             # --- ATUALIZAÇÃO PÓS-JOGO (Mantém o estado do time) ---
-            g_m, g_v = jogo['Gols_Mandante'], jogo['Gols_Visitante']
+            # Placar inválido (vs/ANU/WO): o jogo tem features, mas não mexe na tabela nem na forma
+            if not jogo['Placar_Valido']:
+                continue
+            g_m, g_v = int(jogo['Gols_Mandante']), int(jogo['Gols_Visitante'])
             res_m, res_v = ('V', 'D') if g_m > g_v else (('D', 'V') if g_v > g_m else ('E', 'E'))
             
             stats_m['ultimos_5_saldos_casa'].append(g_m - g_v)
@@ -458,9 +312,9 @@ df_lista_treino = []
 for ano in range(2006, 2021):
     
     # Carregue seus dados aqui (exemplo de nomes de arquivos)
-    df_a = pd.read_csv(f'dados/brasileiraoA/brasileiraoA{ano}.csv')
-    df_b = pd.read_csv(f'dados/brasileiraoB/brasileiraoB{ano}.csv')
-    df_t = pd.read_csv(f'dados/times/times{ano}.csv')
+    df_a = pd.read_csv(f'dados/brasil/brasileiraoA/brasileiraoA{ano}.csv')
+    df_b = pd.read_csv(f'dados/brasil/brasileiraoB/brasileiraoB{ano}.csv')
+    df_t = pd.read_csv(f'dados/brasil/times/times{ano}.csv')
     
     # Marcando as séries
     df_a['Eh_Serie_B'] = 0
@@ -549,9 +403,9 @@ while True:
         
         ano = int(entrada_ano)
         # Carregando arquivos (Ajuste os caminhos conforme seu Linux)
-        df_a = pd.read_csv(f'dados/brasileiraoA/brasileiraoA{ano}.csv')
-        df_b = pd.read_csv(f'dados/brasileiraoB/brasileiraoB{ano}.csv')
-        df_t = pd.read_csv(f'dados/times/times{ano}.csv')
+        df_a = pd.read_csv(f'dados/brasil/brasileiraoA/brasileiraoA{ano}.csv')
+        df_b = pd.read_csv(f'dados/brasil/brasileiraoB/brasileiraoB{ano}.csv')
+        df_t = pd.read_csv(f'dados/brasil/times/times{ano}.csv')
         
         df_a['Eh_Serie_B'] = 0
         df_b['Eh_Serie_B'] = 1
@@ -0,0 +1,226 @@
+import os
+import re
+import shutil
+import sys
+import time
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from dados.manifesto import arquivos_alterados, carregar_manifesto, salvar_manifesto
+from dados.registro_times import codificar_times
+
+# ============================================================================
+# ARMAZÉM COLUNAR DE PARTIDAS
+# ----------------------------------------------------------------------------
+# Consolida os ~1.700 CSVs por temporada (dados/<pais>/.../<competicao><ano>.csv)
+# num único dataset Parquet particionado por país e competição. Dentro de cada
+# partição as linhas ficam ordenadas por temporada, com um row group por
+# temporada, então um filtro de temporada só lê os row groups necessários.
+# O manifesto da etapa 'armazem' faz com que só as partições com algum CSV
+# alterado sejam regravadas.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m dados.armazem                  -> atualiza o armazém (incremental)
+#   python -m dados.armazem --completo       -> reconstrói tudo do zero
+#   carregar_partidas(['brasileiraoA', 'brasileiraoB'], 2006, 2022)
+# ============================================================================
+
+PASTA_DADOS = 'dados'
+PASTA_ARMAZEM = os.path.join('dados', 'armazem', 'partidas')
+
+# Pastas que não contêm partidas (listas de times, Loteca, saída do próprio armazém)
+PASTAS_IGNORADAS = {'times', 'loteca', 'armazem'}
+
+COLUNAS_PARTIDA = ['Fase', 'Rodada', 'Data', 'Time da Casa', 'Placar', 'Time Visitante']
+
+ESQUEMA_PARTIDAS = pa.schema(
+    [(coluna, pa.string()) for coluna in COLUNAS_PARTIDA] + [('Temporada', pa.int16())]
+)
+
+PADRAO_ARQUIVO = re.compile(r'^(?P<competicao>.+?)(?P<temporada>\d{4})\.csv$')
+
+
+def descobrir_csvs(raiz=PASTA_DADOS, pastas=None):
+    """Lista os CSVs de partidas com país, competição e temporada extraídos do caminho."""
+    arquivos = []
+    raizes = [os.path.join(raiz, p) for p in pastas] if pastas else [raiz]
+
+    for base in raizes:
+        for diretorio, subpastas, nomes in os.walk(base):
+            subpastas[:] = sorted(p for p in subpastas if p not in PASTAS_IGNORADAS)
+            for nome in sorted(nomes):
+                encontrado = PADRAO_ARQUIVO.match(nome)
+                if not encontrado:
+                    continue
+                relativo = os.path.relpath(diretorio, raiz).split(os.sep)
+                arquivos.append({
+                    'caminho': os.path.join(diretorio, nome),
+                    'pais': relativo[0],
+                    'competicao': encontrado.group('competicao'),
+                    'temporada': int(encontrado.group('temporada')),
+                })
+    return arquivos
+
+
+def ler_csv_partidas(caminho, temporada):
+    """Lê um CSV de temporada como tabela Arrow no esquema padrão do armazém."""
+    try:
+        tabela = pacsv.read_csv(
+            caminho,
+            read_options=pacsv.ReadOptions(encoding='utf-8'),
+            convert_options=pacsv.ConvertOptions(
+                column_types={c: pa.string() for c in COLUNAS_PARTIDA},
+                strings_can_be_null=True,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # Arquivo vazio (temporada ainda não raspada)
+        return ESQUEMA_PARTIDAS.empty_table()
+
+    colunas = []
+    for campo in ESQUEMA_PARTIDAS:
+        if campo.name == 'Temporada':
+            colunas.append(pa.array([temporada] * tabela.num_rows, type=pa.int16()))
+        elif campo.name in tabela.column_names:
+            colunas.append(tabela[campo.name].cast(pa.string()))
+        else:
+            colunas.append(pa.nulls(tabela.num_rows, type=pa.string()))
+    return pa.Table.from_arrays(colunas, schema=ESQUEMA_PARTIDAS)
+
+
+def _descrever_caminho(caminho, raiz=PASTA_DADOS):
+    """País/competição/temporada de um caminho de CSV (mesma regra de descobrir_csvs)."""
+    encontrado = PADRAO_ARQUIVO.match(os.path.basename(caminho))
+    if not encontrado:
+        return None
+    return {
+        'caminho': caminho,
+        'pais': os.path.relpath(caminho, raiz).split(os.sep)[0],
+        'competicao': encontrado.group('competicao'),
+        'temporada': int(encontrado.group('temporada')),
+    }
+
+
+def _gravar_particao(lista, destino):
+    """Regrava o Parquet de uma partição (país, competição) com um row group por temporada."""
+    pais, competicao = lista[0]['pais'], lista[0]['competicao']
+    pasta_particao = os.path.join(destino, f'pais={pais}', f'competicao={competicao}')
+    os.makedirs(pasta_particao, exist_ok=True)
+    caminho_tmp = os.path.join(pasta_particao, 'parte-0.parquet.tmp')
+
+    linhas = 0
+    with pq.ParquetWriter(caminho_tmp, ESQUEMA_PARTIDAS, compression='zstd') as escritor:
+        for arq in sorted(lista, key=lambda a: a['temporada']):
+            tabela = ler_csv_partidas(arq['caminho'], arq['temporada'])
+            if tabela.num_rows == 0:
+                continue
+            # Um row group por temporada: as estatísticas de 'Temporada' permitem o pushdown
+            escritor.write_table(tabela, row_group_size=max(tabela.num_rows, 1))
+            linhas += tabela.num_rows
+
+    os.replace(caminho_tmp, os.path.join(pasta_particao, 'parte-0.parquet'))
+    return linhas
+
+
+def consolidar_csvs(raiz=PASTA_DADOS, destino=PASTA_ARMAZEM, completo=False):
+    """
+    Ingestão: converte a árvore de CSVs em um dataset Parquet particionado.
+
+    Por padrão é incremental: só as partições com algum CSV novo, alterado ou
+    removido (segundo o manifesto 'armazem') são regravadas.
+    """
+    inicio = time.perf_counter()
+    arquivos = descobrir_csvs(raiz)
+    manifesto = {} if completo else carregar_manifesto('armazem')
+    alterados, removidos, atuais = arquivos_alterados([a['caminho'] for a in arquivos], manifesto)
+
+    # Agrupa por partição (país, competição) mantendo as temporadas em ordem
+    particoes = {}
+    for arq in arquivos:
+        particoes.setdefault((arq['pais'], arq['competicao']), []).append(arq)
+
+    sujas = set()
+    for caminho in alterados + removidos:
+        arq = _descrever_caminho(caminho, raiz)
+        if arq:
+            sujas.add((arq['pais'], arq['competicao']))
+    for pais, competicao in particoes:
+        if not os.path.exists(os.path.join(destino, f'pais={pais}', f'competicao={competicao}', 'parte-0.parquet')):
+            sujas.add((pais, competicao))
+
+    total_linhas = 0
+    for chave in sorted(sujas):
+        if chave in particoes:
+            total_linhas += _gravar_particao(particoes[chave], destino)
+        else:
+            # Competição cujos CSVs foram todos removidos
+            shutil.rmtree(os.path.join(destino, f'pais={chave[0]}', f'competicao={chave[1]}'), ignore_errors=True)
+
+    salvar_manifesto(atuais, 'armazem')
+
+    duracao = time.perf_counter() - inicio
+    if not sujas:
+        print(f"✅ Armazém '{destino}' já está atualizado ({len(arquivos)} arquivos, {duracao:.1f}s).")
+    else:
+        print(f"✅ Armazém atualizado em '{destino}': {len(alterados)} arquivos alterados, "
+              f"{len(sujas)} de {len(particoes)} partições regravadas, {total_linhas} partidas ({duracao:.1f}s).")
+    return sorted(sujas)
+
+
+def _filtro_partidas(paises=None, competicoes=None, ano_inicio=None, ano_fim=None, nome_time=None):
+    """Monta a expressão de filtro usada no pushdown do Arrow."""
+    filtro = None
+
+    def juntar(atual, novo):
+        return novo if atual is None else atual & novo
+
+    if paises:
+        filtro = juntar(filtro, ds.field('pais').isin(list(paises)))
+    if competicoes:
+        filtro = juntar(filtro, ds.field('competicao').isin(list(competicoes)))
+    if ano_inicio is not None:
+        filtro = juntar(filtro, ds.field('Temporada') >= ano_inicio)
+    if ano_fim is not None:
+        filtro = juntar(filtro, ds.field('Temporada') <= ano_fim)
+    if nome_time is not None:
+        times = [nome_time] if isinstance(nome_time, str) else list(nome_time)
+        filtro = juntar(filtro, ds.field('Time da Casa').isin(times) | ds.field('Time Visitante').isin(times))
+    return filtro
+
+
+def carregar_partidas(competicoes=None, ano_inicio=None, ano_fim=None, nome_time=None,
+                      paises=None, colunas=None, codificar=False, pasta=PASTA_ARMAZEM):
+    """
+    Carrega partidas do armazém com pushdown de competição, faixa de temporadas e
+    time (`nome_time`: um nome ou uma lista, como mandante ou visitante).
+
+    Com `codificar=True` as colunas de times voltam categóricas (ordem do registro
+    global) junto com 'Id_Mandante' / 'Id_Visitante' em int32.
+
+    Ex.: carregar_partidas(['brasileiraoA', 'brasileiraoB', 'copadobrasil',
+                            'libertadores', 'sudamericana'], 2006, 2022)
+    """
+    if not os.path.isdir(pasta):
+        raise FileNotFoundError(
+            f"❌ Armazém não encontrado em '{pasta}'. Rode 'python -m dados.armazem' antes."
+        )
+
+    dataset = ds.dataset(pasta, format='parquet', partitioning='hive')
+    filtro = _filtro_partidas(paises, competicoes, ano_inicio, ano_fim, nome_time)
+    tabela = dataset.to_table(columns=colunas, filter=filtro)
+
+    df = tabela.to_pandas()
+    for coluna in ('pais', 'competicao'):
+        if coluna in df.columns:
+            df[coluna] = df[coluna].astype(str)
+    df = df.rename(columns={'pais': 'Pais', 'competicao': 'Competicao'})
+    if codificar:
+        df = codificar_times(df)
+    return df
+
+
+if __name__ == "__main__":
+    consolidar_csvs(completo='--completo' in sys.argv)
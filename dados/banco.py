@@ -0,0 +1,174 @@
+import os
+import sqlite3
+
+import pandas as pd
+
+from dados.armazem import carregar_partidas
+from dados.carregador import padronizar_partidas
+
+# ============================================================================
+# BANCO SQLITE DE PARTIDAS (arquivo local, sem servidor)
+# ----------------------------------------------------------------------------
+# Construído a partir do armazém Parquet. Os índices cobrem as consultas
+# usadas pelo motor de features e pela simulação, então cada busca é um
+# range scan no índice em vez de um filtro O(N) sobre o DataFrame inteiro.
+#
+#   python -m dados.banco                     -> (re)constrói o banco
+#   jogos_do_time_antes('Flamengo', '2019-08-01', limite=5)
+#   confronto('Flamengo', 'Vasco', temporada=2019)
+#   jogos_da_rodada('brasileiraoA', 2019, 10)
+# ============================================================================
+
+ARQUIVO_BANCO = os.path.join('dados', 'armazem', 'partidas.db')
+
+ESQUEMA_SQL = """
+CREATE TABLE partidas (
+    id              INTEGER PRIMARY KEY,
+    pais            TEXT NOT NULL,
+    competicao      TEXT NOT NULL,
+    temporada       INTEGER NOT NULL,
+    fase            TEXT,
+    rodada          TEXT,
+    data            TEXT,
+    mandante        TEXT NOT NULL,
+    visitante       TEXT NOT NULL,
+    placar          TEXT,
+    gols_mandante   INTEGER,
+    gols_visitante  INTEGER
+);
+CREATE INDEX idx_mandante_data ON partidas
+    (mandante, data, visitante, gols_mandante, gols_visitante, competicao, temporada, rodada);
+CREATE INDEX idx_visitante_data ON partidas
+    (visitante, data, mandante, gols_mandante, gols_visitante, competicao, temporada, rodada);
+CREATE INDEX idx_confronto ON partidas
+    (mandante, visitante, temporada, data, gols_mandante, gols_visitante, competicao, rodada);
+CREATE INDEX idx_rodada ON partidas
+    (competicao, temporada, rodada, data, mandante, visitante, gols_mandante, gols_visitante);
+"""
+
+COLUNAS_BANCO = ['pais', 'competicao', 'temporada', 'fase', 'rodada', 'data',
+                 'mandante', 'visitante', 'placar', 'gols_mandante', 'gols_visitante']
+
+
+def _preparar_linhas(df):
+    """Converte o DataFrame do armazém para as colunas/tipos do banco."""
+    df = padronizar_partidas(df)
+    return pd.DataFrame({
+        'pais': df['Pais'],
+        'competicao': df['Competicao'],
+        'temporada': df['Temporada'].astype(int),
+        'fase': df['Fase'],
+        'rodada': df['Rodada'],
+        'data': df['Data_Datetime'].dt.strftime('%Y-%m-%d'),
+        'mandante': df['Time da Casa'],
+        'visitante': df['Time Visitante'],
+        'placar': df['Placar'],
+        'gols_mandante': df['Gols_Mandante'].astype('Int64').where(df['Placar_Valido']),
+        'gols_visitante': df['Gols_Visitante'].astype('Int64').where(df['Placar_Valido']),
+    }, columns=COLUNAS_BANCO)
+
+
+def construir_banco(caminho=ARQUIVO_BANCO, **filtros):
+    """(Re)constrói o banco SQLite a partir do armazém. `filtros` vai para carregar_partidas."""
+    df = carregar_partidas(**filtros)
+    df = df.dropna(subset=['Time da Casa', 'Time Visitante'])
+    linhas = _preparar_linhas(df).astype(object).where(lambda d: d.notna(), None)
+
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    caminho_tmp = caminho + '.tmp'
+    if os.path.exists(caminho_tmp):
+        os.remove(caminho_tmp)
+
+    with sqlite3.connect(caminho_tmp) as conexao:
+        conexao.executescript(ESQUEMA_SQL)
+        conexao.executemany(
+            f"INSERT INTO partidas ({', '.join(COLUNAS_BANCO)}) "
+            f"VALUES ({', '.join('?' * len(COLUNAS_BANCO))})",
+            linhas.itertuples(index=False, name=None),
+        )
+        conexao.execute("ANALYZE")
+    conexao.close()
+    os.replace(caminho_tmp, caminho)
+
+    print(f"✅ Banco '{caminho}' gerado com {len(linhas)} partidas.")
+    return caminho
+
+
+def conectar(caminho=ARQUIVO_BANCO):
+    """Abre o banco em modo somente leitura (seguro para várias threads/processos)."""
+    if not os.path.exists(caminho):
+        raise FileNotFoundError(
+            f"❌ Banco não encontrado em '{caminho}'. Rode 'python -m dados.banco' antes."
+        )
+    return sqlite3.connect(f'file:{caminho}?mode=ro', uri=True, check_same_thread=False)
+
+
+def _consultar(sql, parametros, conexao):
+    fechar = conexao is None
+    conexao = conexao or conectar()
+    try:
+        return pd.read_sql_query(sql, conexao, params=parametros)
+    finally:
+        if fechar:
+            conexao.close()
+
+
+def jogos_do_time_antes(time, data, limite=None, competicoes=None, conexao=None):
+    """Jogos do time (mandante ou visitante) estritamente antes de `data`, mais recentes primeiro."""
+    data = pd.Timestamp(data).strftime('%Y-%m-%d')
+    filtro_comp, params_comp = '', []
+    if competicoes:
+        filtro_comp = f" AND competicao IN ({', '.join('?' * len(competicoes))})"
+        params_comp = list(competicoes)
+
+    sql = f"""
+        SELECT * FROM (
+            SELECT competicao, temporada, rodada, data, mandante, visitante,
+                   gols_mandante, gols_visitante, 'casa' AS local
+            FROM partidas INDEXED BY idx_mandante_data
+            WHERE mandante = ? AND data < ?{filtro_comp}
+            UNION ALL
+            SELECT competicao, temporada, rodada, data, mandante, visitante,
+                   gols_mandante, gols_visitante, 'fora' AS local
+            FROM partidas INDEXED BY idx_visitante_data
+            WHERE visitante = ? AND data < ?{filtro_comp}
+        )
+        ORDER BY data DESC
+    """
+    parametros = [time, data, *params_comp, time, data, *params_comp]
+    if limite is not None:
+        sql += " LIMIT ?"
+        parametros.append(int(limite))
+    return _consultar(sql, parametros, conexao)
+
+
+def confronto(mandante, visitante, temporada=None, conexao=None):
+    """Último jogo mandante x visitante (na temporada, se informada). DataFrame vazio se não houver."""
+    sql = """
+        SELECT competicao, temporada, rodada, data, mandante, visitante,
+               gols_mandante, gols_visitante
+        FROM partidas
+        WHERE mandante = ? AND visitante = ?
+    """
+    parametros = [mandante, visitante]
+    if temporada is not None:
+        sql += " AND temporada = ?"
+        parametros.append(int(temporada))
+    sql += " ORDER BY temporada DESC, data DESC LIMIT 1"
+    return _consultar(sql, parametros, conexao)
+
+
+def jogos_da_rodada(competicao, temporada, rodada, conexao=None):
+    """Todos os jogos da rodada R da competição C na temporada informada (respondido só pelo idx_rodada)."""
+    sql = """
+        SELECT competicao, temporada, rodada, data, mandante, visitante,
+               gols_mandante, gols_visitante
+        FROM partidas
+        WHERE competicao = ? AND temporada = ? AND rodada = ?
+        ORDER BY data, mandante
+    """
+    return _consultar(sql, [competicao, int(temporada), str(rodada)], conexao)
+
+
+if __name__ == "__main__":
+    construir_banco()
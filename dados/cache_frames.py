@@ -0,0 +1,102 @@
+import glob
+import hashlib
+import inspect
+import os
+import time
+
+import pandas as pd
+
+from dados.armazem import consolidar_csvs, descobrir_csvs
+from dados.carregador import carregar_jogos
+from dados.manifesto import arquivos_alterados, carregar_manifesto, hash_combinado, salvar_manifesto
+from dados.padronizar import normalizar_serie
+
+# ============================================================================
+# CACHE DE QUADROS PRONTOS (partida a quente do notebook e dos scripts)
+# ----------------------------------------------------------------------------
+# Guarda DataFrames já normalizados e tipados em Parquet (categorias, int8 e
+# datetime sobrevivem à ida e volta). A chave combina:
+#   - o hash do conteúdo dos CSVs de origem (manifesto da etapa do cache);
+#   - a versão do código que monta o quadro (hash do fonte dos módulos).
+# Mudou um CSV ou a lógica de normalização -> chave nova -> o quadro é refeito
+# sozinho; caso contrário a leitura é só um read_parquet.
+#
+# No notebook:
+#   from dados.cache_frames import carregar_temporadas
+#   df_jogos = carregar_temporadas(2006, 2020)
+# ============================================================================
+
+PASTA_CACHE = os.path.join('dados', 'armazem', 'cache')
+
+COMPETICOES_MODELO = ['brasileiraoA', 'brasileiraoB', 'copadobrasil', 'libertadores', 'sudamericana']
+
+
+def versao_codigo(*objetos):
+    """Hash do código-fonte dos módulos que definem os objetos (funções, módulos)."""
+    sha = hashlib.sha256()
+    arquivos = sorted({inspect.getsourcefile(obj) for obj in objetos})
+    for arquivo in arquivos:
+        with open(arquivo, 'rb') as fonte:
+            sha.update(fonte.read())
+    return sha.hexdigest()[:12]
+
+
+def quadro_em_cache(nome, caminhos, construtor, dependencias=(), pasta=PASTA_CACHE):
+    """
+    Devolve `construtor()` a partir do cache quando origem e código não mudaram.
+
+    `caminhos` são os arquivos de origem cujo conteúdo entra na chave;
+    `dependencias` são funções/módulos extras cujo fonte também entra.
+    """
+    inicio = time.perf_counter()
+    manifesto = carregar_manifesto(f'cache_{nome}')
+    _, _, atuais = arquivos_alterados(caminhos, manifesto)
+    chave = f"{hash_combinado(atuais, caminhos)[:16]}_{versao_codigo(construtor, *dependencias)}"
+    caminho_cache = os.path.join(pasta, f'{nome}_{chave}.parquet')
+
+    if os.path.exists(caminho_cache):
+        df = pd.read_parquet(caminho_cache)
+        print(f"⚡ '{nome}' carregado do cache ({len(df)} linhas, {time.perf_counter() - inicio:.2f}s).")
+        return df
+
+    df = construtor()
+
+    os.makedirs(pasta, exist_ok=True)
+    df.to_parquet(caminho_cache + '.tmp', index=False, engine='pyarrow')
+    os.replace(caminho_cache + '.tmp', caminho_cache)
+    salvar_manifesto(atuais, f'cache_{nome}')
+
+    # Remove versões antigas do mesmo quadro
+    for antigo in glob.glob(os.path.join(pasta, f'{nome}_*.parquet')):
+        if antigo != caminho_cache:
+            os.remove(antigo)
+
+    print(f"✅ '{nome}' montado e salvo em cache ({len(df)} linhas, {time.perf_counter() - inicio:.2f}s).")
+    return df
+
+
+def _normalizar_times(df):
+    """Normaliza os times só nos valores únicos (ver padronizar.normalizar_serie) e guarda como categoria."""
+    for coluna in ('Time da Casa', 'Time Visitante'):
+        df[coluna] = normalizar_serie(df[coluna])
+    return df
+
+
+def carregar_temporadas(ano_inicio, ano_fim, competicoes=COMPETICOES_MODELO):
+    """
+    Partidas das competições/temporadas pedidas, com nomes normalizados e
+    Data_Datetime / Gols_* / Placar_Valido prontos (ver dados/carregador.py).
+    """
+    caminhos = [arq['caminho'] for arq in descobrir_csvs()
+                if arq['competicao'] in competicoes and ano_inicio <= arq['temporada'] <= ano_fim]
+
+    def construir():
+        consolidar_csvs()  # incremental: só regrava partições alteradas
+        df = carregar_jogos(list(competicoes), ano_inicio, ano_fim)
+        df['Competicao'] = df['Competicao'].astype('category')
+        df['Pais'] = df['Pais'].astype('category')
+        return _normalizar_times(df)
+
+    nome = f"temporadas_{ano_inicio}_{ano_fim}_{hashlib.sha1(','.join(sorted(competicoes)).encode()).hexdigest()[:8]}"
+    return quadro_em_cache(nome, caminhos, construir,
+                           dependencias=(carregar_jogos, normalizar_serie, consolidar_csvs))
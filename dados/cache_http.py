@@ -0,0 +1,201 @@
+import gzip
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import requests
+
+# ============================================================================
+# CACHE DE RESPOSTAS HTTP (JSON da Caixa, HTML do ogol)
+# ----------------------------------------------------------------------------
+# Toda resposta baixada pelos raspadores fica guardada em disco, para que uma
+# mudança no parser não exija baixar tudo de novo: reprocessar o acervo vira
+# um trabalho offline, só de CPU.
+#
+#   dados/armazem/http/indice/<ch>/<chave>.json -> url, status, headers,
+#                                                  buscado_em, expira_em, sha256
+#   dados/armazem/http/corpos/<sh>/<sha256>.gz  -> corpo bruto (gzip)
+#
+# A chave é o hash da requisição (método + URL + parâmetros); o corpo é
+# endereçado pelo próprio conteúdo, então páginas idênticas ocupam um só
+# arquivo. Regras de validade (TTL):
+#   - NUNCA_EXPIRA para concursos apurados e temporadas encerradas;
+#   - segundos para o que ainda pode mudar (temporada atual, concurso aberto).
+# `validade` também aceita uma função que recebe a resposta e devolve o TTL.
+# ============================================================================
+
+PASTA_CACHE_HTTP = os.path.join('dados', 'armazem', 'http')
+
+NUNCA_EXPIRA = None
+VALIDADE_TEMPORADA_ATUAL = 6 * 3600
+
+_desativado = False
+
+
+@contextmanager
+def sem_cache():
+    """Dentro do bloco o cache não é lido nem gravado (benchmarks, servidor de replay)."""
+    global _desativado
+    anterior, _desativado = _desativado, True
+    try:
+        yield
+    finally:
+        _desativado = anterior
+
+
+def validade_temporada(ano, validade_atual=VALIDADE_TEMPORADA_ATUAL):
+    """Temporadas passadas não mudam mais; a atual expira em `validade_atual` segundos."""
+    return NUNCA_EXPIRA if int(ano) < datetime.now().year else validade_atual
+
+
+def chave_requisicao(url, metodo='GET', params=None):
+    texto = f"{metodo.upper()} {url}"
+    if params:
+        texto += ' ' + json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+def _caminho_indice(chave, pasta):
+    return os.path.join(pasta, 'indice', chave[:2], f'{chave}.json')
+
+
+def _caminho_corpo(sha, pasta):
+    return os.path.join(pasta, 'corpos', sha[:2], f'{sha}.gz')
+
+
+def _gravar_atomico(caminho, dados):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho + '.tmp', 'wb') as arquivo:
+        arquivo.write(dados)
+    os.replace(caminho + '.tmp', caminho)
+
+
+def ler_cache(url, metodo='GET', params=None, aceitar_expirado=False, pasta=PASTA_CACHE_HTTP):
+    """
+    Resposta guardada para a requisição, ou None se não há (ou expirou).
+
+    A resposta é um dict com url, status, headers, corpo (bytes), buscado_em,
+    expira_em e do_cache=True.
+    """
+    if _desativado:
+        return None
+    caminho = _caminho_indice(chave_requisicao(url, metodo, params), pasta)
+    if not os.path.exists(caminho):
+        return None
+    with open(caminho, encoding='utf-8') as arquivo:
+        entrada = json.load(arquivo)
+
+    if not aceitar_expirado and entrada['expira_em'] is not None and entrada['expira_em'] < time.time():
+        return None
+
+    caminho_corpo = _caminho_corpo(entrada['sha256'], pasta)
+    if not os.path.exists(caminho_corpo):
+        return None
+    with gzip.open(caminho_corpo, 'rb') as arquivo:
+        entrada['corpo'] = arquivo.read()
+    entrada['do_cache'] = True
+    return entrada
+
+
+def gravar_cache(url, status, headers, corpo, validade=NUNCA_EXPIRA, metodo='GET', params=None,
+                 pasta=PASTA_CACHE_HTTP):
+    """Guarda uma resposta. `corpo` em bytes (str é convertido para UTF-8). Retorna a entrada."""
+    if isinstance(corpo, str):
+        corpo = corpo.encode('utf-8')
+    sha = hashlib.sha256(corpo).hexdigest()
+    buscado_em = time.time()
+    if _desativado:
+        return {'url': url, 'status': status, 'headers': dict(headers or {}), 'corpo': corpo,
+                'buscado_em': buscado_em, 'expira_em': None, 'sha256': sha, 'do_cache': False}
+
+    caminho_corpo = _caminho_corpo(sha, pasta)
+    if not os.path.exists(caminho_corpo):
+        _gravar_atomico(caminho_corpo, gzip.compress(corpo, compresslevel=6))
+
+    entrada = {
+        'url': url,
+        'metodo': metodo.upper(),
+        'params': params,
+        'status': status,
+        'headers': dict(headers or {}),
+        'buscado_em': buscado_em,
+        'expira_em': None if validade is None else buscado_em + validade,
+        'sha256': sha,
+    }
+    indice = json.dumps(entrada, ensure_ascii=False, indent=1).encode('utf-8')
+    _gravar_atomico(_caminho_indice(chave_requisicao(url, metodo, params), pasta), indice)
+
+    entrada['corpo'] = corpo
+    entrada['do_cache'] = False
+    return entrada
+
+
+def buscar(url, validade=NUNCA_EXPIRA, params=None, sessao=None, offline=False,
+           pasta=PASTA_CACHE_HTTP, **kwargs):
+    """
+    GET com cache. Só respostas 200 são guardadas.
+
+    `validade`: segundos, NUNCA_EXPIRA, ou função(resposta) -> um dos dois.
+    `offline=True` nunca vai à rede: usa o cache mesmo expirado e devolve
+    None quando não há nada guardado. `kwargs` vão para requests.get.
+    """
+    resposta = ler_cache(url, params=params, aceitar_expirado=offline, pasta=pasta)
+    if resposta is not None or offline:
+        return resposta
+
+    http = (sessao or requests).get(url, params=params, **kwargs)
+    resposta = {
+        'url': url,
+        'status': http.status_code,
+        'headers': dict(http.headers),
+        'corpo': http.content,
+        'buscado_em': time.time(),
+        'expira_em': None,
+        'do_cache': False,
+    }
+    if http.status_code == 200:
+        ttl = validade(resposta) if callable(validade) else validade
+        resposta = gravar_cache(url, http.status_code, http.headers, http.content,
+                                validade=ttl, params=params, pasta=pasta)
+    return resposta
+
+
+def entradas_cache(pasta=PASTA_CACHE_HTTP):
+    """Itera (entrada do índice, corpo) de todas as respostas guardadas."""
+    for raiz, _, arquivos in os.walk(os.path.join(pasta, 'indice')):
+        for nome in sorted(arquivos):
+            if not nome.endswith('.json'):
+                continue
+            with open(os.path.join(raiz, nome), encoding='utf-8') as arquivo:
+                entrada = json.load(arquivo)
+            caminho_corpo = _caminho_corpo(entrada['sha256'], pasta)
+            if os.path.exists(caminho_corpo):
+                with gzip.open(caminho_corpo, 'rb') as arquivo:
+                    yield entrada, arquivo.read()
+
+
+def texto(resposta, codificacao='utf-8'):
+    return resposta['corpo'].decode(codificacao, errors='replace')
+
+
+def como_json(resposta):
+    return json.loads(resposta['corpo'])
+
+
+def resumo_cache(pasta=PASTA_CACHE_HTTP):
+    """Quantidade de respostas, corpos distintos e bytes ocupados."""
+    resumo = {'respostas': 0, 'corpos': 0, 'bytes': 0}
+    for sub, campo in (('indice', 'respostas'), ('corpos', 'corpos')):
+        for raiz, _, arquivos in os.walk(os.path.join(pasta, sub)):
+            for nome in arquivos:
+                resumo[campo] += 1
+                resumo['bytes'] += os.path.getsize(os.path.join(raiz, nome))
+    return resumo
+
+
+if __name__ == "__main__":
+    r = resumo_cache()
+    print(f"🗄️ {r['respostas']} respostas / {r['corpos']} corpos distintos / {r['bytes'] / 1e6:.1f} MB em '{PASTA_CACHE_HTTP}'")
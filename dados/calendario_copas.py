@@ -0,0 +1,195 @@
+import glob
+import os
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from dados.carregador import parsear_datas
+from dados.manifesto import arquivos_alterados, carregar_manifesto, hash_combinado, salvar_manifesto
+
+# ============================================================================
+# CALENDÁRIO DE COPAS POR TIME (Copa do Brasil, Libertadores, Sul-Americana)
+# ----------------------------------------------------------------------------
+# Etapa de carga usada pelo motor de features (get_proxima_copa):
+#   - cada CSV de copa é lido UMA vez, em paralelo entre anos/competições;
+#   - competição ausente num ano só é ignorada (os outros torneios do ano entram);
+#   - o calendário final {time: [jogos ordenados por data]} fica em cache no disco,
+#     com chave no hash do conteúdo dos CSVs, então as execuções seguintes
+#     não releem nem reprocessam nada.
+# ============================================================================
+
+COPAS = {
+    'Copa do Brasil': os.path.join('dados', 'brasil', 'copadobrasil', 'copadobrasil{ano}.csv'),
+    'Libertadores': os.path.join('dados', 'internacional', 'libertadores', 'libertadores{ano}.csv'),
+    'Sudamericana': os.path.join('dados', 'internacional', 'sudamericana', 'sudamericana{ano}.csv'),
+}
+
+PASTA_CACHE = os.path.join('dados', 'armazem', 'cache')
+
+# Mude quando a lógica de processar_jogos_copa mudar, para invalidar o cache
+VERSAO_CALENDARIO = 1
+
+
+def processar_jogos_copa(df_copa, competicao):
+    """Processa os jogos de copa e retorna um dicionário com informações por time"""
+    jogos_por_time = {}
+    
+    # Verifica os nomes das colunas e ajusta conforme necessário
+    coluna_mandante = None
+    coluna_visitante = None
+    coluna_data = None
+    coluna_fase = None
+    
+    # Mapeia possíveis nomes de colunas
+    possiveis_colunas = {
+        'mandante': ['Time Mandante', 'Mandante', 'Time da Casa', 'Casa'],
+        'visitante': ['Time Visitante', 'Visitante', 'Time de Fora', 'Fora'],
+        'data': ['Data', 'Date', 'Dia'],
+        'fase': ['Fase', 'Phase', 'Stage', 'Rodada']
+    }
+    
+    for col in df_copa.columns:
+        col_lower = col.lower()
+        if any(x.lower() in col_lower for x in possiveis_colunas['mandante']):
+            coluna_mandante = col
+        elif any(x.lower() in col_lower for x in possiveis_colunas['visitante']):
+            coluna_visitante = col
+        elif any(x.lower() in col_lower for x in possiveis_colunas['data']):
+            coluna_data = col
+        elif any(x.lower() in col_lower for x in possiveis_colunas['fase']):
+            coluna_fase = col
+    
+    if not all([coluna_mandante, coluna_visitante, coluna_data]):
+        print(f"❌ Colunas não encontradas em {competicao}")
+        return jogos_por_time
+    
+    # Converte todas as datas de uma vez (tenta diferentes formatos, ver dados/carregador.py)
+    datas_copa = parsear_datas(df_copa[coluna_data], temporadas=df_copa.get('Ano'))
+    
+    for (_, jogo), data_jogo in zip(df_copa.iterrows(), datas_copa):
+        try:
+            if pd.isna(data_jogo):
+                continue
+            data_jogo = data_jogo.to_pydatetime()
+            
+            # Adiciona informações para o time mandante
+            mandante = str(jogo[coluna_mandante]).strip()
+            if mandante and mandante != 'nan':
+                if mandante not in jogos_por_time:
+                    jogos_por_time[mandante] = []
+                
+                fase = str(jogo[coluna_fase]).strip() if coluna_fase else 'F'
+                jogos_por_time[mandante].append({
+                    'data': data_jogo,
+                    'competicao': competicao,
+                    'fase': fase,
+                    'adversario': str(jogo[coluna_visitante]).strip(),
+                    'local': 'casa'
+                })
+            
+            # Adiciona informações para o time visitante
+            visitante = str(jogo[coluna_visitante]).strip()
+            if visitante and visitante != 'nan':
+                if visitante not in jogos_por_time:
+                    jogos_por_time[visitante] = []
+                
+                fase = str(jogo[coluna_fase]).strip() if coluna_fase else 'F'
+                jogos_por_time[visitante].append({
+                    'data': data_jogo,
+                    'competicao': competicao,
+                    'fase': fase,
+                    'adversario': str(jogo[coluna_mandante]).strip(),
+                    'local': 'fora'
+                })
+            
+        except (ValueError, KeyError):
+            continue
+    
+    return jogos_por_time
+
+
+def _ler_copa(competicao, ano, caminho):
+    try:
+        df = pd.read_csv(caminho)
+    except (FileNotFoundError, pd.errors.EmptyDataError):
+        return competicao, ano, None
+    df['Ano'] = ano
+    return competicao, ano, df
+
+
+def carregar_jogos_copa(anos, copas=COPAS, trabalhadores=8):
+    """Lê cada CSV de copa uma única vez (em paralelo) e concatena por competição."""
+    tarefas = [(comp, ano, modelo.format(ano=ano)) for comp, modelo in copas.items() for ano in anos]
+    por_competicao = {comp: [] for comp in copas}
+    ausentes = []
+
+    with ThreadPoolExecutor(max_workers=trabalhadores) as executor:
+        for competicao, ano, df in executor.map(lambda t: _ler_copa(*t), tarefas):
+            if df is None:
+                ausentes.append(f'{competicao} {ano}')
+            else:
+                por_competicao[competicao].append(df)
+
+    if ausentes:
+        print(f"⚠️ Copas ausentes (ignoradas): {', '.join(ausentes)}")
+    return {comp: pd.concat(lista, ignore_index=True) if lista else pd.DataFrame()
+            for comp, lista in por_competicao.items()}
+
+
+def montar_calendario(dfs_por_competicao):
+    """Junta os jogos de todas as copas por time, ordenados por data."""
+    todos_jogos_copa = {}
+    for competicao, df_copa in dfs_por_competicao.items():
+        if df_copa.empty:
+            continue
+        for time_copa, jogos in processar_jogos_copa(df_copa, competicao).items():
+            todos_jogos_copa.setdefault(time_copa, []).extend(jogos)
+
+    for jogos in todos_jogos_copa.values():
+        jogos.sort(key=lambda x: x['data'])
+    return todos_jogos_copa
+
+
+def carregar_calendario_copas(anos, copas=COPAS, usar_cache=True):
+    """
+    Calendário de copas por time para os anos pedidos.
+
+    Na primeira execução lê os CSVs e grava o resultado em dados/armazem/cache;
+    nas seguintes só confere o hash dos arquivos e carrega o pickle. Ao gravar
+    um novo, apaga os pickles antigos da mesma faixa de anos.
+    """
+    inicio = time.perf_counter()
+    caminhos = [modelo.format(ano=ano) for modelo in copas.values() for ano in anos]
+    existentes = [c for c in caminhos if os.path.exists(c)]
+
+    manifesto = carregar_manifesto('calendario_copas')
+    _, _, atuais = arquivos_alterados(existentes, manifesto)
+    chave = hash_combinado(atuais, existentes)
+    chave = f"v{VERSAO_CALENDARIO}_{min(anos)}_{max(anos)}_{chave[:16]}"
+    caminho_cache = os.path.join(PASTA_CACHE, f'calendario_copas_{chave}.pkl')
+
+    if usar_cache and os.path.exists(caminho_cache):
+        with open(caminho_cache, 'rb') as arquivo:
+            todos_jogos_copa = pickle.load(arquivo)
+        print(f"⚡ Calendário de copas carregado do cache ({len(todos_jogos_copa)} times, "
+              f"{time.perf_counter() - inicio:.2f}s).")
+        return todos_jogos_copa
+
+    todos_jogos_copa = montar_calendario(carregar_jogos_copa(anos, copas))
+
+    os.makedirs(PASTA_CACHE, exist_ok=True)
+    with open(caminho_cache + '.tmp', 'wb') as arquivo:
+        pickle.dump(todos_jogos_copa, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(caminho_cache + '.tmp', caminho_cache)
+    salvar_manifesto(atuais, 'calendario_copas')
+
+    # Remove versões antigas do calendário dos mesmos anos (outra VERSAO_CALENDARIO ou CSVs mudados)
+    for antigo in glob.glob(os.path.join(PASTA_CACHE, f'calendario_copas_v*_{min(anos)}_{max(anos)}_*.pkl')):
+        if antigo != caminho_cache:
+            os.remove(antigo)
+
+    print(f"✅ Calendário de copas montado: {len(todos_jogos_copa)} times "
+          f"({time.perf_counter() - inicio:.2f}s, salvo em cache).")
+    return todos_jogos_copa
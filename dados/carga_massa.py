@@ -0,0 +1,106 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+from dados.armazem import PASTA_DADOS, descobrir_csvs, ler_csv_partidas
+
+# ============================================================================
+# CARGA EM MASSA DOS ACERVOS (estaduais, Inglaterra, Espanha, internacionais)
+# ----------------------------------------------------------------------------
+# Descobre os diretórios uma única vez e lê as centenas de temporadas com um
+# pool de threads (o parser CSV do Arrow libera o GIL), montando uma única
+# tabela tipada com competição e temporada. Mede o throughput para comparar
+# com o laço sequencial de pd.read_csv usado hoje:
+#
+#   python -m dados.carga_massa            -> benchmark paralelo x sequencial
+# ============================================================================
+
+PASTAS_ACERVO = [
+    os.path.join('brasil', 'estaduais'),
+    'inglaterra',
+    'espanha',
+    'internacional',
+]
+
+TRABALHADORES_PADRAO = min(32, (os.cpu_count() or 1) + 4)  # mesmo padrão do ThreadPoolExecutor
+
+
+def _relatorio(modo, arquivos, linhas, bytes_lidos, duracao):
+    duracao = max(duracao, 1e-9)
+    relatorio = {
+        'modo': modo,
+        'arquivos': arquivos,
+        'linhas': linhas,
+        'segundos': round(duracao, 3),
+        'arquivos_por_s': round(arquivos / duracao, 1),
+        'linhas_por_s': round(linhas / duracao, 1),
+        'mb_por_s': round(bytes_lidos / duracao / 1e6, 2),
+    }
+    print(f"⚡ [{modo}] {arquivos} arquivos / {linhas} linhas em {relatorio['segundos']}s "
+          f"-> {relatorio['arquivos_por_s']} arquivos/s, {relatorio['linhas_por_s']:.0f} linhas/s, "
+          f"{relatorio['mb_por_s']} MB/s")
+    return relatorio
+
+
+def _ler_tagueado(arq):
+    tabela = ler_csv_partidas(arq['caminho'], arq['temporada'])
+    n = tabela.num_rows
+    return tabela.append_column('Competicao', pa.array([arq['competicao']] * n, type=pa.string())) \
+                 .append_column('Pais', pa.array([arq['pais']] * n, type=pa.string()))
+
+
+def carregar_em_massa(pastas=PASTAS_ACERVO, trabalhadores=TRABALHADORES_PADRAO,
+                      raiz=PASTA_DADOS, como_pandas=True):
+    """
+    Lê todas as temporadas das `pastas` em paralelo e devolve (tabela, relatório).
+
+    'Competicao' e 'Pais' saem como categorias (dictionary no Arrow) e
+    'Temporada' como int16.
+    """
+    arquivos = descobrir_csvs(raiz, pastas)
+    bytes_lidos = sum(os.path.getsize(a['caminho']) for a in arquivos)
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=trabalhadores) as executor:
+        tabelas = list(executor.map(_ler_tagueado, arquivos))
+
+    tabela = pa.concat_tables(tabelas) if tabelas else pa.table({})
+    if tabela.num_columns:
+        for nome in ('Competicao', 'Pais'):
+            indice = tabela.schema.get_field_index(nome)
+            tabela = tabela.set_column(indice, nome, tabela[nome].dictionary_encode())
+    duracao = time.perf_counter() - inicio
+
+    relatorio = _relatorio(f'paralelo x{trabalhadores}', len(arquivos), tabela.num_rows, bytes_lidos, duracao)
+    return (tabela.to_pandas() if como_pandas else tabela), relatorio
+
+
+def carregar_sequencial(pastas=PASTAS_ACERVO, raiz=PASTA_DADOS):
+    """Referência: o laço `for arquivo: pd.read_csv(...)` usado nos scripts atuais."""
+    arquivos = descobrir_csvs(raiz, pastas)
+    bytes_lidos = sum(os.path.getsize(a['caminho']) for a in arquivos)
+
+    inicio = time.perf_counter()
+    lista = []
+    for arq in arquivos:
+        try:
+            df = pd.read_csv(arq['caminho'])
+        except pd.errors.EmptyDataError:
+            continue
+        df['Competicao'] = arq['competicao']
+        df['Temporada'] = arq['temporada']
+        lista.append(df)
+    df_total = pd.concat(lista, ignore_index=True) if lista else pd.DataFrame()
+    duracao = time.perf_counter() - inicio
+
+    relatorio = _relatorio('sequencial pandas', len(arquivos), len(df_total), bytes_lidos, duracao)
+    return df_total, relatorio
+
+
+if __name__ == "__main__":
+    _, rel_seq = carregar_sequencial()
+    _, rel_par = carregar_em_massa()
+    print(f"\n🏁 Ganho: {rel_seq['segundos'] / max(rel_par['segundos'], 1e-9):.1f}x mais rápido")
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+from dados.armazem import carregar_partidas
+
+# ============================================================================
+# CARREGADOR CANÔNICO DE PARTIDAS
+# ----------------------------------------------------------------------------
+# Uma única passada vetorizada para datas e placares, usada por todos os
+# motores de features (analisemanual.py, chronos.ipynb, testes/analisefeatures*).
+#   - 'Data'   -> 'Data_Datetime' (detecta o formato, converte cada string única uma vez)
+#   - 'Placar' -> 'Gols_Mandante' / 'Gols_Visitante' (int8) + 'Placar_Valido'
+# Placares como 'vs', 'ANU', 'WO' ou vazios ficam com Placar_Valido == False
+# em vez de virarem 0-0 sem aviso.
+# ============================================================================
+
+# Mesma ordem de prioridade usada antes em processar_jogos_copa
+FORMATOS_DATA = ['%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d', '%m/%d/%Y']
+
+# Captura o placar do tempo normal; pênaltis "(4-3 Pen.)" são ignorados
+PADRAO_PLACAR = r'^\s*(\d{1,2})\s*[-–]\s*(\d{1,2})'
+
+
+def parsear_datas(datas, temporadas=None, formatos=FORMATOS_DATA):
+    """
+    Converte uma coluna de datas em datetime64 testando os formatos em ordem.
+
+    Cada string distinta é convertida uma única vez (os ~380 jogos de uma
+    temporada costumam ter só ~100 datas diferentes) e o resultado é
+    propagado de volta pelos códigos do factorize. Com `temporadas`, anos
+    de dois dígitos que caem no século errado são corrigidos: uma data mais
+    de 50 anos depois da temporada volta 100 anos (2088 -> 1988).
+    """
+    datas = pd.Series(datas)
+    codigos, unicos = pd.factorize(datas.astype('str').str.strip())
+
+    convertidas = pd.Series(pd.NaT, index=range(len(unicos)), dtype='datetime64[ns]')
+    pendentes = pd.Series(unicos)
+    for formato in formatos:
+        if pendentes.empty:
+            break
+        tentativa = pd.to_datetime(pendentes, format=formato, errors='coerce')
+        ok = tentativa.notna()
+        convertidas[pendentes.index[ok]] = tentativa[ok].values
+        pendentes = pendentes[~ok]
+
+    valores = convertidas.to_numpy()
+    resultado = pd.Series(
+        np.where(codigos >= 0, valores[np.maximum(codigos, 0)], np.datetime64('NaT')),
+        index=datas.index, dtype='datetime64[ns]',
+    )
+
+    if temporadas is not None:
+        temporadas = pd.Series(temporadas, index=datas.index)
+        seculo_errado = (resultado.dt.year - temporadas) > 50
+        resultado = resultado.where(~seculo_errado, resultado - pd.DateOffset(years=100))
+
+    return resultado
+
+
+def separar_placar(placares):
+    """Divide 'X-Y' em gols (int8) com um único regex vetorizado. Retorna (gm, gv, valido)."""
+    gols = pd.Series(placares).astype('str').str.extract(PADRAO_PLACAR)
+    valido = gols[0].notna() & gols[1].notna()
+
+    gols_mandante = pd.to_numeric(gols[0], errors='coerce').fillna(0).astype('int8')
+    gols_visitante = pd.to_numeric(gols[1], errors='coerce').fillna(0).astype('int8')
+    return gols_mandante, gols_visitante, valido
+
+
+def padronizar_partidas(df, temporada=None):
+    """Adiciona 'Data_Datetime', 'Gols_Mandante', 'Gols_Visitante' e 'Placar_Valido' ao DataFrame."""
+    if temporada is None and 'Temporada' in df.columns:
+        temporada = df['Temporada']
+    elif temporada is not None and np.isscalar(temporada):
+        temporada = pd.Series(temporada, index=df.index)
+
+    df['Data_Datetime'] = parsear_datas(df['Data'], temporadas=temporada)
+    df['Gols_Mandante'], df['Gols_Visitante'], df['Placar_Valido'] = separar_placar(df['Placar'])
+
+    invalidos = int((~df['Placar_Valido']).sum())
+    if invalidos:
+        print(f"⚠️ {invalidos} jogos com placar não numérico (marcados em 'Placar_Valido').")
+    return df
+
+
+def carregar_jogos(competicoes=None, ano_inicio=None, ano_fim=None, caminhos=None, **filtros):
+    """
+    Ponto de entrada único: lê do armazém (ou de CSVs soltos em `caminhos`)
+    e devolve as partidas já padronizadas.
+    """
+    if caminhos is not None:
+        caminhos = [caminhos] if isinstance(caminhos, str) else list(caminhos)
+        df = pd.concat([pd.read_csv(c, dtype={'Rodada': 'str', 'Placar': 'str'}) for c in caminhos],
+                       ignore_index=True)
+    else:
+        df = carregar_partidas(competicoes, ano_inicio, ano_fim, **filtros)
+    return padronizar_partidas(df)
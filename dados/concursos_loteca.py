@@ -0,0 +1,248 @@
+import gzip
+import json
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# ============================================================================
+# ARMAZÉM DE CONCURSOS DA LOTECA
+# ----------------------------------------------------------------------------
+# Uma única tabela colunar de jogos, com chave (Concurso, Jogo_Num), gerada a
+# partir do CSV do raspador. As colunas derivadas (classificações de torneio)
+# não duplicam mais o dataset inteiro: cada uma é uma tabela lateral
+# versionada em dados/loteca/classificacoes/<coluna>_v<N>.parquet, só com
+# (Concurso, Jogo_Num, <coluna>).
+#
+# O JSON completo de cada concurso (rateio por faixa, arrecadação, acumulado,
+# estimativa do próximo) também é guardado, compactado, em
+# dados/loteca/concursos_brutos.jsonl.gz pelo próprio raspador (sem
+# requisições extras). Dele sai a tabela de prêmios, uma linha por concurso.
+#
+#   python -m dados.concursos_loteca         -> (re)gera o armazém e os prêmios
+#   carregar_concursos(['Torneio_Exato'])     -> jogos + classificação mais recente
+#   carregar_premios()                        -> rateio / acumulado por concurso
+#   matriz_concursos(df, 'Resultado')         -> array (concursos x 14 jogos)
+# ============================================================================
+
+ARQUIVO_RASPAGEM = os.path.join('dados', 'loteca', 'dataset_loteca_2006_presente.csv')
+ARQUIVO_CONCURSOS = os.path.join('dados', 'armazem', 'loteca', 'concursos.parquet')
+PASTA_CLASSIFICACOES = os.path.join('dados', 'loteca', 'classificacoes')
+ARQUIVO_BRUTOS = os.path.join('dados', 'loteca', 'concursos_brutos.jsonl.gz')
+ARQUIVO_PREMIOS = os.path.join('dados', 'armazem', 'loteca', 'premios.parquet')
+
+CHAVE = ['Concurso', 'Jogo_Num']
+JOGOS_POR_CONCURSO = 14
+
+TIPOS_CONCURSOS = {
+    'Concurso': 'int32',
+    'Jogo_Num': 'int8',
+    'Gols_Mandante': 'int8',
+    'Gols_Visitante': 'int8',
+    'Mandante': 'category',
+    'Visitante': 'category',
+    'Campeonato': 'category',
+    'Dia_Semana': 'category',
+}
+
+# Campos do JSON da Caixa que vão para a tabela de prêmios (faixas de rateio à parte)
+CAMPOS_CONCURSO = {
+    'numero': 'Concurso',
+    'dataApuracao': 'Data',
+    'valorArrecadado': 'Arrecadado',
+    'acumulado': 'Acumulado',
+    'valorAcumuladoProximoConcurso': 'Acumulado_Proximo',
+    'valorAcumuladoConcursoEspecial': 'Acumulado_Especial',
+    'valorEstimadoProximoConcurso': 'Estimativa_Proximo',
+    'dataProximoConcurso': 'Data_Proximo',
+}
+
+
+def _tipar(df):
+    """Aplica os tipos compactos e adiciona Data_Datetime e Resultado (1 casa, 0 empate, 2 fora)."""
+    df = df.astype({c: t for c, t in TIPOS_CONCURSOS.items() if c in df.columns})
+    df['Data_Datetime'] = pd.to_datetime(df['Data'], format='%d/%m/%Y', errors='coerce')
+    df['Resultado'] = np.select(
+        [df['Gols_Mandante'] > df['Gols_Visitante'], df['Gols_Mandante'] < df['Gols_Visitante']],
+        [1, 2], default=0,
+    ).astype('int8')
+    return df.sort_values(CHAVE).reset_index(drop=True)
+
+
+def _desatualizado(destino, origem):
+    """True se o arquivo gerado não existe ou é mais antigo que a sua origem."""
+    if not os.path.exists(destino):
+        return True
+    return os.path.exists(origem) and os.path.getmtime(origem) > os.path.getmtime(destino)
+
+
+def consolidar_loteca(origem=ARQUIVO_RASPAGEM, destino=ARQUIVO_CONCURSOS):
+    """Converte o CSV do raspador na tabela colunar de concursos."""
+    df = pd.read_csv(origem)
+    df = df.drop_duplicates(subset=CHAVE, keep='last')
+    df = _tipar(df)
+
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    df.to_parquet(destino + '.tmp', index=False, engine='pyarrow')
+    os.replace(destino + '.tmp', destino)
+    print(f"✅ {df['Concurso'].nunique()} concursos / {len(df)} jogos salvos em '{destino}'.")
+    return df
+
+
+def versoes_classificacao(coluna, pasta=PASTA_CLASSIFICACOES):
+    """Versões disponíveis de uma tabela lateral, em ordem crescente."""
+    if not os.path.isdir(pasta):
+        return []
+    padrao = re.compile(rf'^{re.escape(coluna.lower())}_v(\d+)\.parquet$')
+    return sorted(int(m.group(1)) for m in map(padrao.match, os.listdir(pasta)) if m)
+
+
+def salvar_classificacao(df, coluna, pasta=PASTA_CLASSIFICACOES):
+    """Grava (Concurso, Jogo_Num, coluna) como nova versão da tabela lateral. Retorna a versão."""
+    versao = (versoes_classificacao(coluna, pasta) or [0])[-1] + 1
+    lateral = df[CHAVE + [coluna]].copy()
+    lateral[coluna] = lateral[coluna].astype('category')
+
+    os.makedirs(pasta, exist_ok=True)
+    caminho = os.path.join(pasta, f'{coluna.lower()}_v{versao}.parquet')
+    lateral.sort_values(CHAVE).to_parquet(caminho, index=False, engine='pyarrow')
+    print(f"💾 Classificação '{coluna}' salva como v{versao} em '{caminho}'.")
+    return versao
+
+
+def carregar_classificacao(coluna, versao=None, pasta=PASTA_CLASSIFICACOES):
+    """Lê uma tabela lateral (a versão mais recente, se não informada)."""
+    versoes = versoes_classificacao(coluna, pasta)
+    if not versoes:
+        raise FileNotFoundError(f"❌ Nenhuma classificação '{coluna}' em '{pasta}'.")
+    versao = versoes[-1] if versao is None else versao
+    return pd.read_parquet(os.path.join(pasta, f'{coluna.lower()}_v{versao}.parquet'))
+
+
+def carregar_concursos(classificacoes=(), caminho=ARQUIVO_CONCURSOS, origem=ARQUIVO_RASPAGEM):
+    """
+    Jogos da Loteca com as classificações pedidas já unidas pela chave.
+
+    `classificacoes` aceita nomes ('Torneio_Exato') ou pares ('Torneio_Exato', 2)
+    para fixar uma versão. O armazém é regerado se o CSV do raspador for mais novo.
+    """
+    if _desatualizado(caminho, origem):
+        df = consolidar_loteca(origem, caminho)
+    else:
+        df = pd.read_parquet(caminho)
+
+    for item in classificacoes:
+        coluna, versao = (item, None) if isinstance(item, str) else item
+        df = df.merge(carregar_classificacao(coluna, versao), on=CHAVE, how='left')
+    return df
+
+
+def matriz_concursos(df, coluna, preencher=-1):
+    """
+    Visão (concursos x 14 jogos) de uma coluna, para operações por concurso.
+
+    Retorna (numeros_concurso, matriz). Jogos ausentes (concursos com 13 jogos
+    válidos) ficam com `preencher`.
+    """
+    concursos, linhas = np.unique(df['Concurso'].to_numpy(), return_inverse=True)
+    colunas = df['Jogo_Num'].to_numpy().astype(np.intp) - 1
+
+    valores = df[coluna]
+    if isinstance(valores.dtype, pd.CategoricalDtype):
+        valores = valores.cat.codes
+    valores = valores.to_numpy()
+
+    matriz = np.full((len(concursos), JOGOS_POR_CONCURSO), preencher, dtype=np.result_type(valores, np.asarray(preencher)))
+    matriz[linhas, colunas] = valores
+    return concursos, matriz
+
+
+# ============================================================================
+# JSON COMPLETO DOS CONCURSOS E TABELA DE PRÊMIOS
+# ============================================================================
+
+def gravar_brutos(jsons, caminho=ARQUIVO_BRUTOS):
+    """
+    Junta os JSONs de concursos ao arquivo bruto (uma linha por concurso,
+    gzip), sem repetir concurso: o que já estava guardado com o mesmo número
+    é substituído pela versão nova. Grava num temporário e troca com
+    os.replace, como o CSV do raspador.
+    """
+    if not jsons:
+        return 0
+    concursos = ler_brutos(caminho)
+    concursos.update((int(json_dados['numero']), json_dados) for json_dados in jsons)
+
+    temporario = caminho + '.tmp'
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    with gzip.open(temporario, 'wt', encoding='utf-8') as arquivo:
+        for numero in sorted(concursos):
+            arquivo.write(json.dumps(concursos[numero], ensure_ascii=False, separators=(',', ':')) + '\n')
+    os.replace(temporario, caminho)
+    return len(jsons)
+
+
+def ler_brutos(caminho=ARQUIVO_BRUTOS):
+    """{numero: JSON} de todos os concursos guardados (a versão mais recente de cada)."""
+    concursos = {}
+    if not os.path.exists(caminho):
+        return concursos
+    with gzip.open(caminho, 'rt', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            json_dados = json.loads(linha)
+            concursos[int(json_dados['numero'])] = json_dados
+    return dict(sorted(concursos.items()))
+
+
+def _acertos_da_faixa(faixa):
+    """'14 acertos' -> '14'; sem número na descrição, usa o nº da faixa."""
+    achado = re.search(r'\d+', faixa.get('descricaoFaixa') or '')
+    return achado.group(0) if achado else f"faixa{faixa.get('faixa')}"
+
+
+def linha_premios(json_dados):
+    """Uma linha da tabela de prêmios: campos do concurso + Ganhadores_<n>/Premio_<n> por faixa."""
+    linha = {coluna: json_dados.get(campo) for campo, coluna in CAMPOS_CONCURSO.items()}
+    for faixa in json_dados.get('listaRateioPremio') or []:
+        acertos = _acertos_da_faixa(faixa)
+        linha[f'Ganhadores_{acertos}'] = faixa.get('numeroDeGanhadores')
+        linha[f'Premio_{acertos}'] = faixa.get('valorPremio')
+    return linha
+
+
+def consolidar_premios(origem=ARQUIVO_BRUTOS, destino=ARQUIVO_PREMIOS):
+    """Gera a tabela de prêmios (uma linha por concurso) a partir dos JSONs brutos."""
+    df = pd.DataFrame([linha_premios(j) for j in ler_brutos(origem).values()])
+    if df.empty:
+        print(f"⚠️ Nenhum concurso em '{origem}'.")
+        return df
+
+    df['Concurso'] = df['Concurso'].astype('int32')
+    df['Acumulado'] = df['Acumulado'].astype('boolean')
+    for coluna in ('Data', 'Data_Proximo'):
+        df[coluna] = pd.to_datetime(df[coluna], format='%d/%m/%Y', errors='coerce')
+    for coluna in df.columns:
+        if coluna.startswith('Ganhadores_'):
+            df[coluna] = df[coluna].astype('Int32')
+        elif coluna.startswith(('Premio_', 'Acumulado_', 'Arrecadado', 'Estimativa_')):
+            df[coluna] = pd.to_numeric(df[coluna], errors='coerce').astype('float64')
+    df = df.sort_values('Concurso').reset_index(drop=True)
+
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    df.to_parquet(destino + '.tmp', index=False, engine='pyarrow')
+    os.replace(destino + '.tmp', destino)
+    print(f"✅ {len(df)} concursos com rateio salvos em '{destino}'.")
+    return df
+
+
+def carregar_premios(caminho=ARQUIVO_PREMIOS, origem=ARQUIVO_BRUTOS):
+    """Tabela de prêmios por concurso (regerada do arquivo bruto se não existe ou se ele for mais novo)."""
+    if _desatualizado(caminho, origem):
+        return consolidar_premios(origem, caminho)
+    return pd.read_parquet(caminho)
+
+
+if __name__ == "__main__":
+    consolidar_loteca()
+    consolidar_premios()
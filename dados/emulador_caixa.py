@@ -0,0 +1,256 @@
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from datetime import date, timedelta
+
+from aiohttp import web
+
+from dados.cache_http import entradas_cache, sem_cache
+from dados.metricas_raspagem import percentil
+from dados.raspagemloteca import CONCURSO_INICIAL, raspar_loteca_async
+from dados.replay import ServidorReplay, carregar_arquivo
+
+# ============================================================================
+# EMULADOR LOCAL DA API DA LOTECA (CAIXA) E TESTE DE CARGA DO RASPADOR
+# ----------------------------------------------------------------------------
+# Sobe um servidor que imita /portaldeloterias/api/loteca/{n}:
+#   - os JSONs vêm de um arquivo de replay (dados/replay.py), do cache HTTP
+#     ou são sintéticos (14 jogos em listaResultadoEquipeEsportiva, rateio,
+#     arrecadação...), gerados de forma determinística a partir do número;
+#   - /api/loteca sem número devolve o último concurso, como a API real;
+#   - passou do último concurso -> 404 (é assim que o raspador acha o fim);
+#   - falhas injetadas: timeouts (resposta pendurada) e rajadas de 5xx, em que
+#     o servidor responde 503 para tudo durante alguns segundos.
+#
+# O teste de carga roda raspar_loteca_async contra o emulador (cache HTTP
+# desligado) em vários níveis de concorrência e mede vazão, retentativas e
+# percentis de latência por tentativa.
+#
+#   python -m dados.emulador_caixa servir --porta 8000 --quantidade 800 --taxa-rajada 0.01
+#   python -m dados.raspagemloteca --url-base http://127.0.0.1:8000/portaldeloterias/api/loteca
+#   python -m dados.emulador_caixa carga --concorrencias 1 4 8 16 32 --latencia 0.1
+# ============================================================================
+
+CAMINHO_API = '/portaldeloterias/api/loteca'
+_NUMERO_NO_CAMINHO = re.compile(r'/api/loteca/(\d+)$')
+
+EQUIPES = ['FLAMENGO/RJ', 'PALMEIRAS/SP', 'CORINTHIANS/SP', 'SAO PAULO/SP', 'SANTOS/SP', 'GREMIO/RS',
+           'INTERNACIONAL/RS', 'CRUZEIRO/MG', 'ATLETICO/MG', 'VASCO/RJ', 'FLUMINENSE/RJ', 'BOTAFOGO/RJ',
+           'BAHIA/BA', 'VITORIA/BA', 'SPORT/PE', 'NAUTICO/PE', 'CEARA/CE', 'FORTALEZA/CE', 'GOIAS/GO',
+           'CORITIBA/PR', 'ATHLETICO/PR', 'FIGUEIRENSE/SC', 'AVAI/SC', 'PAYSANDU/PA', 'REMO/PA']
+CAMPEONATOS = ['CAMPEONATO BRASILEIRO', 'COPA DO BRASIL', 'CAMPEONATO PAULISTA', 'CAMPEONATO CARIOCA',
+               'CAMPEONATO GAUCHO', 'CAMPEONATO MINEIRO', 'SERIE B']
+DIAS = ['Sábado', 'Domingo', 'Quarta-feira']
+
+
+def concurso_sintetico(numero, aberto=False):
+    """JSON de um concurso no formato da API. `aberto=True`: jogos ainda sem placar."""
+    sorteio = random.Random(numero)
+    data = date(2006, 1, 7) + timedelta(weeks=numero - CONCURSO_INICIAL)
+    jogos = []
+    for i in range(14):
+        casa, fora = sorteio.sample(EQUIPES, 2)
+        jogos.append({
+            'nuSequencial': i + 1,
+            'nomeEquipeUm': casa,
+            'nuGolEquipeUm': None if aberto else sorteio.choice([0, 0, 1, 1, 1, 2, 2, 3, 4]),
+            'nomeEquipeDois': fora,
+            'nuGolEquipeDois': None if aberto else sorteio.choice([0, 0, 1, 1, 1, 2, 2, 3]),
+            'nomeCampeonato': sorteio.choice(CAMPEONATOS),
+            'diaSemana': sorteio.choice(DIAS),
+            'dtJogo': data.strftime('%d/%m/%Y'),
+        })
+    ganhadores = 0 if aberto else sorteio.choice([0, 0, 1, 2, 5])
+    arrecadado = round(sorteio.uniform(2e6, 9e6), 2)
+    return {
+        'tipoJogo': 'LOTECA',
+        'numero': numero,
+        'dataApuracao': data.strftime('%d/%m/%Y'),
+        'acumulado': ganhadores == 0,
+        'listaResultadoEquipeEsportiva': jogos,
+        'listaRateioPremio': [
+            {'faixa': 1, 'descricaoFaixa': '14 acertos', 'numeroDeGanhadores': ganhadores,
+             'valorPremio': round(arrecadado * 0.35 / ganhadores, 2) if ganhadores else 0.0},
+            {'faixa': 2, 'descricaoFaixa': '13 acertos', 'numeroDeGanhadores': ganhadores * 40 + sorteio.randint(5, 80),
+             'valorPremio': round(sorteio.uniform(200, 3000), 2)},
+        ],
+        'valorArrecadado': arrecadado,
+        'valorAcumuladoProximoConcurso': 0.0 if ganhadores else round(arrecadado * 0.35, 2),
+        'valorEstimadoProximoConcurso': round(arrecadado * 0.5, 2),
+        'numeroConcursoAnterior': numero - 1,
+        'numeroConcursoProximo': numero + 1,
+        'dataProximoConcurso': (data + timedelta(weeks=1)).strftime('%d/%m/%Y'),
+    }
+
+
+def carregar_concursos(nome_replay=None, do_cache=False, inicio=CONCURSO_INICIAL, quantidade=400,
+                       ultimo_aberto=False):
+    """
+    {numero: corpo JSON (bytes)} que o emulador vai servir: de um arquivo de
+    replay, das respostas da Loteca guardadas no cache HTTP ou sintéticos
+    (`inicio` .. `inicio + quantidade - 1`).
+    """
+    if nome_replay or do_cache:
+        if nome_replay:
+            trocas = ((t['url'], t['corpo']) for t in carregar_arquivo(nome_replay).values())
+        else:
+            trocas = ((entrada['url'], corpo) for entrada, corpo in entradas_cache())
+        concursos = {}
+        for url, corpo in trocas:
+            achado = _NUMERO_NO_CAMINHO.search(url)
+            if achado:
+                concursos[int(achado.group(1))] = corpo
+        return concursos
+
+    fim = inicio + quantidade - 1
+    return {n: json.dumps(concurso_sintetico(n, aberto=ultimo_aberto and n == fim), ensure_ascii=False).encode('utf-8')
+            for n in range(inicio, fim + 1)}
+
+
+def criar_app_caixa(concursos, latencia=0.0, variacao=0.0, taxa_timeout=0.0, atraso_timeout=30.0,
+                    taxa_rajada=0.0, duracao_rajada=2.0):
+    """
+    App aiohttp com a API emulada. Cada resposta espera `latencia` ± `variacao`;
+    `taxa_timeout` das requisições ficam penduradas por `atraso_timeout` s;
+    com probabilidade `taxa_rajada` por requisição começa uma rajada de 503 que
+    dura `duracao_rajada` s. O app guarda as contagens em app['contagem'].
+    """
+    ultimo = max(concursos) if concursos else 0
+    contagem = {'requisicoes': 0, 'timeouts': 0, 'erros_5xx': 0, 'rajadas': 0, 'nao_encontrados': 0}
+    rajada_ate = [0.0]
+
+    async def responder(numero):
+        contagem['requisicoes'] += 1
+        await asyncio.sleep(max(0.0, latencia + random.uniform(-variacao, variacao)))
+
+        agora = time.monotonic()
+        if agora >= rajada_ate[0] and random.random() < taxa_rajada:
+            rajada_ate[0] = agora + duracao_rajada
+            contagem['rajadas'] += 1
+        if agora < rajada_ate[0]:
+            contagem['erros_5xx'] += 1
+            return web.Response(status=503, text='Serviço indisponível')
+        if random.random() < taxa_timeout:
+            contagem['timeouts'] += 1
+            await asyncio.sleep(atraso_timeout)
+
+        corpo = concursos.get(numero)
+        if corpo is None:
+            contagem['nao_encontrados'] += 1
+            return web.Response(status=404)
+        return web.Response(body=corpo, content_type='application/json')
+
+    async def concurso(requisicao):
+        return await responder(int(requisicao.match_info['numero']))
+
+    async def mais_recente(requisicao):
+        return await responder(ultimo)
+
+    app = web.Application()
+    app['contagem'] = contagem
+    app.router.add_get(CAMINHO_API + r'/{numero:\d+}', concurso)
+    app.router.add_get(CAMINHO_API, mais_recente)
+    return app
+
+
+# ============================================================================
+# TESTE DE CARGA
+# ============================================================================
+
+def _rodar_nivel(base_url, inicio, concorrencia, timeout):
+    with tempfile.TemporaryDirectory() as pasta, contextlib.redirect_stdout(io.StringIO()):
+        return asyncio.run(raspar_loteca_async(
+            inicio=inicio, url_base=base_url + CAMINHO_API, arquivo_csv=os.path.join(pasta, 'loteca.csv'),
+            arquivo_brutos=os.path.join(pasta, 'brutos.jsonl.gz'), concorrencia=concorrencia,
+            taxa_por_segundo=10_000, timeout=timeout))
+
+
+def teste_carga(concursos, concorrencias=(1, 4, 8, 16, 32), timeout=5, **opcoes_servidor):
+    """
+    Raspa todos os `concursos` contra o emulador em cada nível de concorrência.
+    Retorna uma linha de métricas por nível (também impressas numa tabela).
+    """
+    inicio = min(concursos)
+    resultado = []
+    opcoes_servidor.setdefault('atraso_timeout', timeout * 2)
+    with sem_cache():
+        for concorrencia in concorrencias:
+            with ServidorReplay(concursos, fabrica=criar_app_caixa, **opcoes_servidor) as base_url:
+                estatisticas = _rodar_nivel(base_url, inicio, concorrencia, timeout)
+            segundos = max(estatisticas['segundos'], 1e-9)
+            latencias = estatisticas['latencias']
+            resultado.append({
+                'concorrencia': concorrencia,
+                'concursos': estatisticas['concursos'],
+                'segundos': estatisticas['segundos'],
+                'concursos_por_s': round(estatisticas['concursos'] / segundos, 1),
+                'requisicoes_por_s': round(estatisticas['requisicoes'] / segundos, 1),
+                'retentativas': estatisticas['retentativas'],
+                **{f'p{p}_ms': round(percentil(latencias, p) * 1000, 1) if latencias else None for p in (50, 90, 99)},
+            })
+
+    print(f"🏋️ Teste de carga: {len(concursos)} concursos, opções {opcoes_servidor}")
+    print(f"   {'conc.':>5} {'concursos/s':>12} {'req/s':>8} {'retent.':>8} {'p50 ms':>8} {'p90 ms':>8} "
+          f"{'p99 ms':>8} {'total s':>8}")
+    for linha in resultado:
+        print(f"   {linha['concorrencia']:>5} {linha['concursos_por_s']:>12} {linha['requisicoes_por_s']:>8} "
+              f"{linha['retentativas']:>8} {linha['p50_ms']!s:>8} {linha['p90_ms']!s:>8} {linha['p99_ms']!s:>8} "
+              f"{linha['segundos']:>8}")
+    return resultado
+
+
+def _gravar_relatorio(linhas, caminho):
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=list(linhas[0]))
+        escritor.writeheader()
+        escritor.writerows(linhas)
+    print(f"💾 Relatório salvo em '{caminho}'.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Emulador local da API da Loteca e teste de carga do raspador.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    for nome_comando in ('servir', 'carga'):
+        p = sub.add_parser(nome_comando)
+        p.add_argument('--replay', help="serve os concursos deste arquivo de replay")
+        p.add_argument('--do-cache', action='store_true', help="serve os concursos guardados no cache HTTP")
+        p.add_argument('--quantidade', type=int, default=400, help="concursos sintéticos")
+        p.add_argument('--ultimo-aberto', action='store_true', help="último concurso sintético ainda sem placares")
+        p.add_argument('--latencia', type=float, default=0.05, help="segundos por resposta")
+        p.add_argument('--variacao', type=float, default=0.02, help="± segundos sobre a latência")
+        p.add_argument('--taxa-timeout', type=float, default=0.0, help="fração de respostas penduradas")
+        p.add_argument('--taxa-rajada', type=float, default=0.0, help="chance, por requisição, de começar uma rajada de 503")
+        p.add_argument('--duracao-rajada', type=float, default=2.0, help="segundos de cada rajada de 503")
+        if nome_comando == 'servir':
+            p.add_argument('--porta', type=int, default=8000)
+        else:
+            p.add_argument('--concorrencias', type=int, nargs='+', default=[1, 4, 8, 16, 32])
+            p.add_argument('--timeout', type=float, default=5, help="timeout do cliente (s)")
+            p.add_argument('--saida', help="grava as métricas neste CSV")
+
+    args = parser.parse_args()
+    concursos = carregar_concursos(args.replay, args.do_cache, quantidade=args.quantidade,
+                                   ultimo_aberto=args.ultimo_aberto)
+    if not concursos:
+        raise SystemExit("❌ Nenhum concurso da Loteca encontrado na fonte escolhida.")
+    opcoes = {'latencia': args.latencia, 'variacao': args.variacao, 'taxa_timeout': args.taxa_timeout,
+              'taxa_rajada': args.taxa_rajada, 'duracao_rajada': args.duracao_rajada}
+
+    if args.comando == 'servir':
+        print(f"📡 API da Loteca emulada com os concursos {min(concursos)}..{max(concursos)} em "
+              f"http://127.0.0.1:{args.porta}{CAMINHO_API}")
+        web.run_app(criar_app_caixa(concursos, **opcoes), host='127.0.0.1', port=args.porta, print=None)
+    else:
+        relatorio = teste_carga(concursos, args.concorrencias, timeout=args.timeout, **opcoes)
+        if args.saida:
+            _gravar_relatorio(relatorio, args.saida)
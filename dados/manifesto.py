@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+
+# ============================================================================
+# MANIFESTO DE CONTEÚDO (reprocessamento incremental da árvore dados/)
+# ----------------------------------------------------------------------------
+# Cada etapa do pipeline (padronização, armazém, caches) guarda o seu próprio
+# manifesto: caminho -> tamanho, mtime, sha256, nº de linhas e cabeçalho.
+# Uma etapa só reprocessa os arquivos cujo conteúdo mudou desde a última vez
+# que ELA rodou. Se tamanho e mtime não mudaram, o hash anterior é reaproveitado
+# sem reler o arquivo.
+# ============================================================================
+
+PASTA_MANIFESTOS = os.path.join('dados', 'armazem', 'manifestos')
+
+TAMANHO_BLOCO = 1 << 20
+
+
+def _caminho_manifesto(etapa, pasta=PASTA_MANIFESTOS):
+    return os.path.join(pasta, f'{etapa}.json')
+
+
+def carregar_manifesto(etapa, pasta=PASTA_MANIFESTOS):
+    """Lê o manifesto da etapa ({caminho: entrada}). Vazio se a etapa nunca rodou."""
+    caminho = _caminho_manifesto(etapa, pasta)
+    if not os.path.exists(caminho):
+        return {}
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)
+
+
+def salvar_manifesto(manifesto, etapa, pasta=PASTA_MANIFESTOS):
+    """Grava o manifesto de forma atômica."""
+    os.makedirs(pasta, exist_ok=True)
+    caminho = _caminho_manifesto(etapa, pasta)
+    with open(caminho + '.tmp', 'w', encoding='utf-8') as arquivo:
+        json.dump(manifesto, arquivo, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(caminho + '.tmp', caminho)
+
+
+def descrever_arquivo(caminho, anterior=None):
+    """Monta a entrada do manifesto para um arquivo (reaproveita o hash se tamanho/mtime baterem)."""
+    info = os.stat(caminho)
+    if anterior and anterior['tamanho'] == info.st_size and anterior['mtime'] == info.st_mtime_ns:
+        return anterior
+
+    sha = hashlib.sha256()
+    linhas = 0
+    cabecalho = ''
+    with open(caminho, 'rb') as arquivo:
+        ultimo = b''
+        while bloco := arquivo.read(TAMANHO_BLOCO):
+            if not ultimo:
+                cabecalho = bloco.split(b'\n', 1)[0].decode('utf-8-sig', errors='replace').strip()
+            sha.update(bloco)
+            linhas += bloco.count(b'\n')
+            ultimo = bloco[-1:]
+        if ultimo and ultimo != b'\n':
+            linhas += 1  # última linha sem quebra
+
+    return {
+        'tamanho': info.st_size,
+        'mtime': info.st_mtime_ns,
+        'sha256': sha.hexdigest(),
+        'linhas': max(linhas - 1, 0) if cabecalho else 0,  # desconta o cabeçalho
+        'esquema': cabecalho.split(',') if cabecalho else [],
+    }
+
+
+def arquivos_alterados(caminhos, manifesto):
+    """
+    Compara os arquivos atuais com o manifesto da etapa.
+
+    Retorna (alterados, removidos, atuais): caminhos novos ou com conteúdo
+    diferente, caminhos que sumiram do disco e as entradas atualizadas de
+    todos os arquivos (para gravar depois que a etapa terminar).
+    """
+    atuais = {}
+    alterados = []
+    for caminho in caminhos:
+        chave = os.path.normpath(caminho)
+        anterior = manifesto.get(chave)
+        entrada = descrever_arquivo(caminho, anterior)
+        atuais[chave] = entrada
+        if anterior is None or anterior['sha256'] != entrada['sha256']:
+            alterados.append(caminho)
+
+    removidos = sorted(set(manifesto) - set(atuais))
+    return alterados, removidos, atuais
+
+
+def hash_combinado(manifesto, caminhos=None):
+    """Hash único do conteúdo de um conjunto de arquivos (chave para caches derivados)."""
+    sha = hashlib.sha256()
+    chaves = sorted(manifesto) if caminhos is None else sorted(os.path.normpath(c) for c in caminhos)
+    for chave in chaves:
+        sha.update(chave.encode('utf-8'))
+        sha.update(manifesto[chave]['sha256'].encode('ascii'))
+    return sha.hexdigest()
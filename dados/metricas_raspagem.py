@@ -0,0 +1,215 @@
+import csv
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+# ============================================================================
+# MÉTRICAS DOS RASPADORES (Caixa, ogol via HTTP e via Selenium)
+# ----------------------------------------------------------------------------
+# Um objeto MetricasRaspagem por execução, compartilhado entre threads /
+# tarefas. Cada fonte ('caixa', 'ogol_http', 'ogol_selenium') acumula:
+#   - requisições que foram à rede, bytes, códigos de status;
+#   - histograma de latência (LIMITES_LATENCIA_MS) e percentis p50/p90/p99,
+#     calculados sobre uma amostra de tamanho fixo (AMOSTRA_LATENCIAS);
+#   - respostas servidas pelo cache HTTP;
+#   - retentativas por causa (timeout, http_5xx, conexao, sem_tabela, ...);
+#   - tempo de parser por página e linhas gravadas (linhas/s).
+#
+# Saídas:
+#   - `painel(metricas)`: imprime `linha_resumo()` a cada INTERVALO_PAINEL s
+#     enquanto a raspagem roda;
+#   - `exportar()`: relatório JSON (completo) e CSV (uma linha por fonte) em
+#     dados/armazem/metricas/<nome>_<data>.{json,csv}.
+# ============================================================================
+
+PASTA_RELATORIOS = os.path.join('dados', 'armazem', 'metricas')
+INTERVALO_PAINEL = 10
+
+FONTE_CAIXA = 'caixa'
+FONTE_OGOL_HTTP = 'ogol_http'
+FONTE_OGOL_SELENIUM = 'ogol_selenium'
+
+LIMITES_LATENCIA_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+AMOSTRA_LATENCIAS = 4096  # reservoir sampling: memória e custo do painel não crescem com a execução
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) por interpolação linear; None se não há valores."""
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    posicao = (len(ordenados) - 1) * p / 100
+    baixo = int(posicao)
+    alto = min(baixo + 1, len(ordenados) - 1)
+    return ordenados[baixo] + (ordenados[alto] - ordenados[baixo]) * (posicao - baixo)
+
+
+def causa_da_falha(erro):
+    """Classifica uma exceção (aiohttp, requests, Selenium ou do próprio raspador) numa causa curta."""
+    nome = type(erro).__name__
+    status = getattr(erro, 'status', None) or getattr(getattr(erro, 'response', None), 'status_code', None)
+    if 'Timeout' in nome:
+        return 'timeout'
+    if isinstance(status, int):
+        return 'http_5xx' if status >= 500 else 'http_4xx'
+    if nome == 'TabelaNaoEncontrada':
+        texto = str(erro)
+        if texto.startswith('HTTP'):
+            return 'http_5xx' if texto.startswith('HTTP 5') else 'http_4xx'
+        return 'sem_tabela'
+    if 'Connection' in nome or 'Connector' in nome or 'Disconnected' in nome:
+        return 'conexao'
+    if 'WebDriver' in nome or 'Session' in nome:
+        return 'navegador'
+    return 'outro'
+
+
+class MetricasRaspagem:
+    """Contadores thread-safe de uma execução de raspagem, separados por fonte."""
+
+    def __init__(self, nome='raspagem'):
+        self.nome = nome
+        self.iniciado_em = time.time()
+        self._inicio = time.perf_counter()
+        self._trava = threading.Lock()
+        self._sorteio = random.Random(0)
+        self.fontes = {}
+
+    def _fonte(self, fonte):
+        if fonte not in self.fontes:
+            self.fontes[fonte] = {
+                'requisicoes': 0, 'bytes': 0, 'cache': 0, 'status': {},
+                'histograma': [0] * (len(LIMITES_LATENCIA_MS) + 1), 'latencias': [],
+                'retentativas': {}, 'parse_s': 0.0, 'paginas': 0, 'linhas': 0,
+            }
+        return self.fontes[fonte]
+
+    def requisicao(self, fonte, segundos, tamanho=0, status=None):
+        """Uma ida à rede (também as que falharam: status None)."""
+        milis = segundos * 1000
+        faixa = next((i for i, limite in enumerate(LIMITES_LATENCIA_MS) if milis <= limite), len(LIMITES_LATENCIA_MS))
+        chave = str(status) if status is not None else 'erro'
+        with self._trava:
+            dados = self._fonte(fonte)
+            dados['requisicoes'] += 1
+            dados['bytes'] += tamanho
+            dados['status'][chave] = dados['status'].get(chave, 0) + 1
+            dados['histograma'][faixa] += 1
+            amostra = dados['latencias']
+            if len(amostra) < AMOSTRA_LATENCIAS:
+                amostra.append(segundos)
+            else:
+                # Cada requisição fica na amostra com a mesma probabilidade (algoritmo R)
+                posicao = self._sorteio.randrange(dados['requisicoes'])
+                if posicao < AMOSTRA_LATENCIAS:
+                    amostra[posicao] = segundos
+
+    def cache(self, fonte):
+        with self._trava:
+            self._fonte(fonte)['cache'] += 1
+
+    def retentativa(self, fonte, causa):
+        """`causa`: texto ou a exceção que provocou a nova tentativa."""
+        if isinstance(causa, BaseException):
+            causa = causa_da_falha(causa)
+        with self._trava:
+            retentativas = self._fonte(fonte)['retentativas']
+            retentativas[causa] = retentativas.get(causa, 0) + 1
+
+    def parse(self, fonte, segundos, paginas=1):
+        with self._trava:
+            dados = self._fonte(fonte)
+            dados['parse_s'] += segundos
+            dados['paginas'] += paginas
+
+    def linhas(self, fonte, quantidade):
+        with self._trava:
+            self._fonte(fonte)['linhas'] += quantidade
+
+    def resumo(self):
+        """Métricas calculadas por fonte, prontas para o relatório."""
+        segundos = max(time.perf_counter() - self._inicio, 1e-9)
+        fontes = {}
+        with self._trava:
+            for fonte, dados in self.fontes.items():
+                latencias = dados['latencias']
+                fontes[fonte] = {
+                    'requisicoes': dados['requisicoes'],
+                    'requisicoes_por_s': round(dados['requisicoes'] / segundos, 2),
+                    'bytes': dados['bytes'],
+                    'cache': dados['cache'],
+                    'status': dict(dados['status']),
+                    'latencia_ms': {f'p{p}': round(percentil(latencias, p) * 1000, 1) if latencias else None
+                                    for p in (50, 90, 99)},
+                    'histograma_ms': {f'<={limite}': n for limite, n in zip(LIMITES_LATENCIA_MS, dados['histograma'])}
+                                     | {f'>{LIMITES_LATENCIA_MS[-1]}': dados['histograma'][-1]},
+                    'retentativas': dict(dados['retentativas']),
+                    'paginas': dados['paginas'],
+                    'parse_ms_por_pagina': round(dados['parse_s'] / dados['paginas'] * 1000, 3) if dados['paginas'] else None,
+                    'linhas': dados['linhas'],
+                    'linhas_por_s': round(dados['linhas'] / segundos, 2),
+                }
+        return {'nome': self.nome, 'iniciado_em': datetime.fromtimestamp(self.iniciado_em).isoformat(timespec='seconds'),
+                'segundos': round(segundos, 2), 'fontes': fontes}
+
+    def linha_resumo(self):
+        """Uma linha curta para acompanhar a execução."""
+        resumo = self.resumo()
+        partes = []
+        for fonte, m in resumo['fontes'].items():
+            retentativas = sum(m['retentativas'].values())
+            latencia = m['latencia_ms']
+            p50, p99 = (f"{latencia[p]}ms" if latencia[p] is not None else '-' for p in ('p50', 'p99'))
+            partes.append(f"{fonte}: {m['requisicoes']} req ({m['requisicoes_por_s']}/s, {m['cache']} cache) "
+                          f"{m['bytes'] / 1e6:.1f} MB p50 {p50} p99 {p99} {retentativas} retent. "
+                          f"{m['linhas_por_s']} linhas/s")
+        return f"📊 {resumo['segundos']:.0f}s | " + (' | '.join(partes) or 'sem requisições ainda')
+
+    def exportar(self, pasta=PASTA_RELATORIOS):
+        """Grava o relatório em JSON e CSV. Retorna (caminho_json, caminho_csv)."""
+        resumo = self.resumo()
+        os.makedirs(pasta, exist_ok=True)
+        base = os.path.join(pasta, f"{self.nome}_{datetime.fromtimestamp(self.iniciado_em):%Y%m%d_%H%M%S}")
+
+        with open(base + '.json', 'w', encoding='utf-8') as arquivo:
+            json.dump(resumo, arquivo, ensure_ascii=False, indent=2)
+
+        linhas = []
+        for fonte, m in resumo['fontes'].items():
+            linha = {'fonte': fonte, 'segundos': resumo['segundos']}
+            linha.update({k: v for k, v in m.items() if not isinstance(v, dict)})
+            linha.update({f'latencia_{k}_ms': v for k, v in m['latencia_ms'].items()})
+            linha['retentativas'] = sum(m['retentativas'].values())
+            linha.update({f'retentativas_{k}': v for k, v in m['retentativas'].items()})
+            linhas.append(linha)
+        colunas = list(dict.fromkeys(c for linha in linhas for c in linha)) or ['fonte']
+        with open(base + '.csv', 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+            escritor.writeheader()
+            escritor.writerows(linhas)
+
+        print(f"📈 Relatório de métricas: '{base}.json' / '.csv'")
+        return base + '.json', base + '.csv'
+
+
+@contextmanager
+def painel(metricas, intervalo=INTERVALO_PAINEL):
+    """Imprime `metricas.linha_resumo()` a cada `intervalo` segundos dentro do bloco (e uma última ao sair)."""
+    parar = threading.Event()
+
+    def mostrar():
+        while not parar.wait(intervalo):
+            print(metricas.linha_resumo(), flush=True)
+
+    thread = threading.Thread(target=mostrar, daemon=True)
+    thread.start()
+    try:
+        yield metricas
+    finally:
+        parar.set()
+        thread.join()
+        print(metricas.linha_resumo())
@@ -0,0 +1,298 @@
+import argparse
+import csv
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# ============================================================================
+# MOTOR DE RASPAGEM GUIADO POR CONFIGURAÇÃO
+# ----------------------------------------------------------------------------
+# Substitui as cópias do raspagemgol (uma por campeonato, cada uma com URL,
+# ano e pasta fixos no código). Agora:
+#   - dados/campeonatos.csv lista os campeonatos: adicionar uma liga é
+#     acrescentar uma linha;
+#   - uma tabela de tarefas persistente (SQLite em dados/armazem) guarda uma
+#     linha por (campeonato, temporada) com estado pending/running/done/failed,
+#     nº de jogos gravados, tentativas e último erro;
+#   - todos usam o mesmo pipeline busca -> parser -> CSV (dados/raspagem_http.py,
+#     com o Selenium como plano B) e o pool de dados/pool_raspagem.py.
+# Ao rodar de novo, temporadas 'done' não são refeitas; 'failed' e as que
+# ficaram 'running' numa execução interrompida voltam para 'pending'.
+#
+# Agendamento por completude (ver `precisa_repetir`): uma temporada 'done'
+# volta para a fila só se o CSV sumiu, encolheu, tem jogos sem placar ('vs')
+# ou tem menos jogos que o esperado (times x rodadas). A temporada atual (e a
+# última conhecida de cada campeonato, onde a próxima edição aparece) é
+# reconsultada a cada INTERVALO_TEMPORADA_ATUAL; históricas incompletas, a
+# cada INTERVALO_HISTORICA_INCOMPLETA; históricas completas, nunca. Se já
+# existe um CSV completo de uma temporada passada, o trabalhador não a
+# raspa de novo: só descobre a URL da seguinte (cache ou 1 requisição; na
+# última conhecida, sempre da rede, já que o cache dela nunca expira).
+#
+#   python -m dados.motor_raspagem --trabalhadores 4
+#   python -m dados.motor_raspagem --apenas goiano capixaba
+#   python -m dados.motor_raspagem --status
+# ============================================================================
+
+ARQUIVO_CAMPEONATOS = os.path.join('dados', 'campeonatos.csv')
+ARQUIVO_TAREFAS = os.path.join('dados', 'armazem', 'tarefas_raspagem.db')
+
+PENDENTE, RODANDO, CONCLUIDA, FALHOU = 'pending', 'running', 'done', 'failed'
+
+INTERVALO_TEMPORADA_ATUAL = 6 * 3600
+INTERVALO_HISTORICA_INCOMPLETA = 7 * 24 * 3600
+PLACARES_PENDENTES = {'', 'vs', 'x', '-'}
+
+
+def eh_temporada_atual(temporada):
+    return int(temporada) >= datetime.now().year
+
+
+def caminho_temporada(pasta_destino, campeonato, temporada):
+    return os.path.join(pasta_destino, f'{campeonato}{temporada}.csv')
+
+
+def rodadas_pontos_corridos(times):
+    """Nº de rodadas de um turno e de turno e returno com `times` times (com folga se ímpar)."""
+    turno = times - 1 if times % 2 == 0 else times
+    return {turno, 2 * turno}
+
+
+def verificar_temporada(caminho, jogos_vistos=None):
+    """
+    Situação do CSV de uma temporada: {'existe', 'jogos', 'pendentes', 'esperados', 'completa'}.
+
+    'esperados' só é calculado quando as rodadas numeradas têm a forma de
+    pontos corridos (turno único ou turno e returno entre todos os times):
+    rodadas x (times // 2). Fases de grupos e mata-mata ('QF', 'SF', 'F',
+    grupos 'A'/'B') ficam sem essa conta, senão nunca pareceriam completas. `jogos_vistos` é a
+    contagem da última raspagem: o arquivo não pode ter menos que isso.
+    Arquivo só com cabeçalho conta como completo: o ogol não tem jogos
+    daquela edição (comum nos estaduais antigos).
+    """
+    situacao = {'existe': os.path.exists(caminho), 'jogos': 0, 'pendentes': 0, 'esperados': None, 'completa': False}
+    if not situacao['existe']:
+        return situacao
+
+    rodadas = {}
+    jogos_numerados = 0
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        for linha in csv.DictReader(arquivo):
+            situacao['jogos'] += 1
+            if (linha.get('Placar') or '').strip().lower() in PLACARES_PENDENTES:
+                situacao['pendentes'] += 1
+            rodada = (linha.get('Rodada') or '').strip()
+            if rodada.isdigit():
+                jogos_numerados += 1
+                rodadas.setdefault(int(rodada), set()).update((linha['Time da Casa'], linha['Time Visitante']))
+
+    if rodadas:
+        times = len(set().union(*rodadas.values()))
+        if max(rodadas) in rodadas_pontos_corridos(times):
+            situacao['esperados'] = max(rodadas) * (times // 2)
+
+    situacao['completa'] = (
+        situacao['pendentes'] == 0
+        and (situacao['esperados'] is None or jogos_numerados >= situacao['esperados'])
+        and (jogos_vistos is None or situacao['jogos'] >= jogos_vistos)
+    )
+    return situacao
+
+
+def precisa_repetir(temporada, situacao, atualizado_em, ultima_do_campeonato, agora=None):
+    """Decide se uma temporada já 'done' deve voltar para a fila."""
+    idade = (agora or time.time()) - (atualizado_em or 0)
+    if eh_temporada_atual(temporada) or ultima_do_campeonato:
+        return idade >= INTERVALO_TEMPORADA_ATUAL
+    if not situacao['existe']:
+        return True
+    if not situacao['completa']:
+        return idade >= INTERVALO_HISTORICA_INCOMPLETA
+    return False
+
+
+def carregar_config(caminho=ARQUIVO_CAMPEONATOS, apenas=None):
+    """Campeonatos do arquivo de configuração (filtrados por nome, se `apenas`)."""
+    with open(caminho, newline='', encoding='utf-8') as arquivo:
+        campeonatos = [{**linha, 'ano_inicial': int(linha['ano_inicial']),
+                        'pasta_destino': os.path.normpath(linha['pasta_destino'])}
+                       for linha in csv.DictReader(arquivo)]
+    if apenas:
+        campeonatos = [c for c in campeonatos if c['nome_arquivo_base'] in apenas]
+    return campeonatos
+
+
+class TabelaTarefas:
+    """Tabela persistente de temporadas a raspar, compartilhada pelos trabalhadores."""
+
+    def __init__(self, caminho=ARQUIVO_TAREFAS):
+        if os.path.dirname(caminho):
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False, isolation_level=None)
+        self._trava = threading.Lock()
+        self._conexao.execute("""
+            CREATE TABLE IF NOT EXISTS tarefas (
+                campeonato    TEXT NOT NULL,
+                temporada     INTEGER NOT NULL,
+                url           TEXT NOT NULL,
+                pasta_destino TEXT NOT NULL,
+                estado        TEXT NOT NULL DEFAULT 'pending',
+                linhas        INTEGER,
+                tentativas    INTEGER NOT NULL DEFAULT 0,
+                erro          TEXT,
+                atualizado_em REAL,
+                PRIMARY KEY (campeonato, temporada)
+            )
+        """)
+        self._conexao.execute("CREATE INDEX IF NOT EXISTS idx_estado ON tarefas (estado, campeonato, temporada)")
+
+    def _executar(self, sql, parametros=()):
+        with self._trava:
+            return self._conexao.execute(sql, parametros).fetchall()
+
+    def semear(self, campeonatos):
+        """Cria a primeira temporada de cada campeonato novo e reabre as interrompidas/falhas."""
+        for c in campeonatos:
+            self._executar(
+                "INSERT OR IGNORE INTO tarefas (campeonato, temporada, url, pasta_destino, atualizado_em) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (c['nome_arquivo_base'], c['ano_inicial'], c['url_inicial'], c['pasta_destino'], time.time()))
+        nomes = [c['nome_arquivo_base'] for c in campeonatos]
+        marcadores = ','.join('?' * len(nomes))
+        self._executar(
+            f"UPDATE tarefas SET estado = 'pending', tentativas = 0 "
+            f"WHERE estado IN ('running', 'failed') AND campeonato IN ({marcadores})", nomes)
+
+    def replanejar(self, campeonatos):
+        """Devolve para 'pending' as temporadas 'done' que precisam ser reconsultadas. Retorna quantas."""
+        nomes = [c['nome_arquivo_base'] for c in campeonatos]
+        if not nomes:
+            return 0
+        marcadores = ','.join('?' * len(nomes))
+        linhas = self._executar(
+            f"SELECT campeonato, temporada, pasta_destino, linhas, atualizado_em, "
+            f"       NOT EXISTS (SELECT 1 FROM tarefas t2 WHERE t2.campeonato = t.campeonato "
+            f"                   AND t2.temporada = t.temporada + 1) "
+            f"FROM tarefas t WHERE estado = 'done' AND campeonato IN ({marcadores})", nomes)
+
+        agora = time.time()
+        repetir = []
+        for campeonato, temporada, pasta, jogos_vistos, atualizado_em, ultima in linhas:
+            situacao = verificar_temporada(caminho_temporada(pasta, campeonato, temporada), jogos_vistos)
+            if precisa_repetir(temporada, situacao, atualizado_em, bool(ultima), agora):
+                repetir.append((campeonato, temporada))
+
+        for campeonato, temporada in repetir:
+            self._executar("UPDATE tarefas SET estado = 'pending', tentativas = 0 "
+                           "WHERE campeonato = ? AND temporada = ?", (campeonato, temporada))
+        return len(repetir)
+
+    def pegar(self, campeonatos=None):
+        """Marca a próxima tarefa pendente como 'running' e a devolve (None se não há)."""
+        filtro, parametros = '', []
+        if campeonatos:
+            filtro = f"AND campeonato IN ({','.join('?' * len(campeonatos))})"
+            parametros = list(campeonatos)
+        linhas = self._executar(
+            f"UPDATE tarefas SET estado = 'running', atualizado_em = ? "
+            f"WHERE rowid = (SELECT rowid FROM tarefas WHERE estado = 'pending' {filtro} "
+            f"               ORDER BY temporada, campeonato LIMIT 1) "
+            f"RETURNING campeonato, temporada, url, pasta_destino, tentativas",
+            [time.time()] + parametros)
+        if not linhas:
+            return None
+        campeonato, temporada, url, pasta_destino, tentativas = linhas[0]
+        return {'nome_arquivo_base': campeonato, 'ano': temporada, 'url': url,
+                'pasta_destino': pasta_destino, 'tentativas': tentativas}
+
+    def concluir(self, tarefa, linhas, url_proxima=None):
+        """Marca a temporada como 'done' e, se houver, enfileira a seguinte (antes, para a fila nunca parecer vazia)."""
+        if url_proxima:
+            self._executar(
+                "INSERT OR IGNORE INTO tarefas (campeonato, temporada, url, pasta_destino, atualizado_em) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (tarefa['nome_arquivo_base'], tarefa['ano'] + 1, url_proxima, tarefa['pasta_destino'], time.time()))
+        self._executar(
+            "UPDATE tarefas SET estado = 'done', linhas = ?, erro = NULL, atualizado_em = ? "
+            "WHERE campeonato = ? AND temporada = ?",
+            (linhas, time.time(), tarefa['nome_arquivo_base'], tarefa['ano']))
+
+    def falhar(self, tarefa, erro, max_tentativas):
+        """Devolve a temporada para 'pending' ou, esgotadas as tentativas, marca 'failed'. Retorna o estado."""
+        tentativas = tarefa.get('tentativas', 0) + 1
+        estado = PENDENTE if tentativas < max_tentativas else FALHOU
+        self._executar(
+            "UPDATE tarefas SET estado = ?, tentativas = ?, erro = ?, atualizado_em = ? "
+            "WHERE campeonato = ? AND temporada = ?",
+            (estado, tentativas, str(erro)[:500], time.time(), tarefa['nome_arquivo_base'], tarefa['ano']))
+        return estado
+
+    def jogos_vistos(self, tarefa):
+        """Jogos gravados na última vez que a temporada foi concluída (None se nunca foi)."""
+        linhas = self._executar("SELECT linhas FROM tarefas WHERE campeonato = ? AND temporada = ?",
+                                (tarefa['nome_arquivo_base'], tarefa['ano']))
+        return linhas[0][0] if linhas else None
+
+    def ultima_do_campeonato(self, tarefa):
+        """True se ainda não há a temporada seguinte na tabela (é nela que a próxima edição aparece)."""
+        linhas = self._executar("SELECT 1 FROM tarefas WHERE campeonato = ? AND temporada = ?",
+                                (tarefa['nome_arquivo_base'], tarefa['ano'] + 1))
+        return not linhas
+
+    def em_andamento(self, campeonatos=None):
+        """Nº de tarefas 'running' (podem ainda gerar a temporada seguinte)."""
+        linhas = self._executar("SELECT campeonato FROM tarefas WHERE estado = 'running'")
+        return sum(1 for (c,) in linhas if not campeonatos or c in campeonatos)
+
+    def resumo(self):
+        """Lista de (campeonato, estado, temporadas, jogos)."""
+        return self._executar(
+            "SELECT campeonato, estado, COUNT(*), COALESCE(SUM(linhas), 0) FROM tarefas "
+            "GROUP BY campeonato, estado ORDER BY campeonato, estado")
+
+    def fechar(self):
+        self._conexao.close()
+
+
+def imprimir_status(tabela):
+    print(f"{'campeonato':<20}{'estado':<10}{'temporadas':>12}{'jogos':>10}")
+    for campeonato, estado, temporadas, jogos in tabela.resumo():
+        print(f"{campeonato:<20}{estado:<10}{temporadas:>12}{jogos:>10}")
+
+
+def executar(trabalhadores=4, apenas=None, config=ARQUIVO_CAMPEONATOS, caminho_tarefas=ARQUIVO_TAREFAS,
+             **opcoes_pool):
+    """Semeia a tabela a partir da configuração e roda o pool até não haver mais pendências."""
+    from dados.pool_raspagem import raspar_fila
+
+    campeonatos = carregar_config(config, apenas)
+    tabela = TabelaTarefas(caminho_tarefas)
+    try:
+        tabela.semear(campeonatos)
+        repetidas = tabela.replanejar(campeonatos)
+        if repetidas:
+            print(f"🔁 {repetidas} temporadas concluídas voltaram para a fila (atual, incompleta ou sem arquivo).")
+        resultado = raspar_fila(tabela, [c['nome_arquivo_base'] for c in campeonatos],
+                                trabalhadores=trabalhadores, **opcoes_pool)
+        imprimir_status(tabela)
+    finally:
+        tabela.fechar()
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Raspagem dos campeonatos de dados/campeonatos.csv.")
+    parser.add_argument('--trabalhadores', type=int, default=4)
+    parser.add_argument('--apenas', nargs='+', help="só estes campeonatos (nome_arquivo_base)")
+    parser.add_argument('--status', action='store_true', help="só mostra a tabela de tarefas")
+    parser.add_argument('--sem-selenium', action='store_true')
+    args = parser.parse_args()
+
+    if args.status:
+        tabela = TabelaTarefas()
+        imprimir_status(tabela)
+        tabela.fechar()
+    else:
+        executar(args.trabalhadores, args.apenas, usar_selenium=not args.sem_selenium)
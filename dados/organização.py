@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from dados.concursos_loteca import ARQUIVO_RASPAGEM, carregar_concursos, salvar_classificacao
+
 def classificar_campeonato(row):
     mandante = str(row['Mandante']).upper().strip()
     visitante = str(row['Visitante']).upper().strip()
@@ -83,24 +85,24 @@ def classificar_campeonato(row):
     return 'Futebol Nacional (Outros)'
 
 def executar_classificacao():
-    print("Carregando o dataset original...")
+    print("Carregando os concursos da Loteca...")
     try:
-        df = pd.read_csv('dataset_loteca_2006_presente.csv')
+        df = carregar_concursos()
         print(f"Dataset carregado com {len(df)} jogos. Iniciando classificação exata...")
         
         # Aplica o algoritmo
         df['Torneio_Exato'] = df.apply(classificar_campeonato, axis=1)
         
-        # Salva o novo arquivo
-        df.to_csv('dataset_loteca_classificado_ia.csv', index=False, encoding='utf-8')
-        print("\nPronto! Arquivo 'dataset_loteca_classificado_ia.csv' gerado com sucesso.")
+        # Salva só (Concurso, Jogo_Num, Torneio_Exato) como nova versão da tabela lateral
+        versao = salvar_classificacao(df, 'Torneio_Exato')
+        print(f"\nPronto! Classificação 'Torneio_Exato' v{versao} gerada com sucesso.")
         
         # Mostra um resumo do que ele encontrou
         print("\nDistribuição dos torneios encontrados:")
         print(df['Torneio_Exato'].value_counts())
         
     except FileNotFoundError:
-        print("Erro: O arquivo 'dataset_loteca_2006_presente.csv' não foi encontrado na mesma pasta.")
+        print(f"Erro: O arquivo '{ARQUIVO_RASPAGEM}' não foi encontrado.")
 
 if __name__ == "__main__":
     executar_classificacao()
\ No newline at end of file
@@ -2,6 +2,9 @@ import pandas as pd
 import os
 import glob
 import re
+import sys
+
+from dados.manifesto import arquivos_alterados, carregar_manifesto, descrever_arquivo, salvar_manifesto
 
 # 1. MAPEAMENTO DE ESTADOS (Para preencher a coluna 'região' automaticamente)
 MAPA_REGIOES = {
@@ -83,73 +86,177 @@ MAPA_REGIOES = {
 }
 
 # 2. DICIONÁRIO DE NORMALIZAÇÃO (Corrige nomes cortados ou variações)
+# Nome que COMEÇA com a chave vira o valor; se mais de uma chave servir, vale a
+# primeira da tabela.
+SUBSTITUICOES = {
+    'Internaciona': 'Internacional', 'Sampaio Corr': 'Sampaio Corrêa',
+    'Atletico-GO': 'Atlético-GO', 'Atlético-MG': 'Atlético-MG',
+    'Athletico-PR': 'Athletico-PR', 'Athletico Paranaens': 'Athletico-PR',
+    'Ceará SC': 'Ceará', 'Sport Recife': 'Sport', 'Vasco da Gama': 'Vasco',
+    'América Mineiro': 'América-MG', 'Red Bull Bragantino': 'Bragantino',
+    'Grêmio Novorizontino': 'Novorizontino', 'Cuiabá Saf': 'Cuiabá'
+}
+
+_FIM = ''  # chave do nó da trie que guarda (ordem na tabela, nome canônico)
+
+
+class NormalizadorNomes:
+    """
+    Trie de prefixos montada uma vez a partir da tabela de apelidos.
+
+    `normalizar(nome)` dá o mesmo resultado que percorrer a tabela com
+    startswith, mas anda só pelos caracteres do nome (não pela tabela toda).
+    """
+
+    def __init__(self, substituicoes=SUBSTITUICOES):
+        self.raiz = {}
+        for ordem, (curto, completo) in enumerate(substituicoes.items()):
+            no = self.raiz
+            for letra in curto:
+                no = no.setdefault(letra, {})
+            no.setdefault(_FIM, (ordem, completo))
+
+    def normalizar(self, nome):
+        nome = str(nome).strip()
+        no = self.raiz
+        achado = no.get(_FIM)
+        for letra in nome:
+            no = no.get(letra)
+            if no is None:
+                break
+            if _FIM in no and (achado is None or no[_FIM][0] < achado[0]):
+                achado = no[_FIM]
+        return achado[1] if achado else nome
+
+    def normalizar_serie(self, serie):
+        """
+        Normaliza uma coluna aplicando a trie só aos valores únicos e propagando
+        de volta pelos códigos. Devolve uma coluna categórica (NaN continua NaN).
+        """
+        codigos, unicos = pd.factorize(serie)
+        if not len(unicos):
+            # Coluna toda vazia: categórica só com NaN
+            return pd.Series(pd.Categorical.from_codes(codigos, categories=pd.Index([], dtype=object)),
+                             index=serie.index, name=serie.name)
+        ausentes = codigos < 0
+        # Apelidos diferentes podem cair no mesmo canônico: fatora de novo
+        codigos_canonicos, categorias = pd.factorize(pd.Index([self.normalizar(u) for u in unicos], dtype=object))
+        codigos = codigos_canonicos[codigos]
+        codigos[ausentes] = -1
+        return pd.Series(pd.Categorical.from_codes(codigos, categories=categorias), index=serie.index, name=serie.name)
+
+
+NORMALIZADOR = NormalizadorNomes()
+
+
 def normalizar_nome(nome):
-    nome = str(nome).strip()
-    substituicoes = {
-        'Internaciona': 'Internacional', 'Sampaio Corr': 'Sampaio Corrêa',
-        'Atletico-GO': 'Atlético-GO', 'Atlético-MG': 'Atlético-MG',
-        'Athletico-PR': 'Athletico-PR', 'Athletico Paranaens': 'Athletico-PR',
-        'Ceará SC': 'Ceará', 'Sport Recife': 'Sport', 'Vasco da Gama': 'Vasco',
-        'América Mineiro': 'América-MG', 'Red Bull Bragantino': 'Bragantino',
-        'Grêmio Novorizontino': 'Novorizontino', 'Cuiabá Saf': 'Cuiabá'
+    return NORMALIZADOR.normalizar(nome)
+
+
+def normalizar_serie(serie):
+    """Coluna de times normalizada (categórica), com a tabela SUBSTITUICOES."""
+    return NORMALIZADOR.normalizar_serie(serie)
+
+# 3. PASTAS PADRONIZADAS (caminhos reais da árvore dados/)
+PASTAS_PADRONIZAR = {
+    'brasileiraoA': os.path.join('dados', 'brasil', 'brasileiraoA'),
+    'brasileiraoB': os.path.join('dados', 'brasil', 'brasileiraoB'),
+    'copadobrasil': os.path.join('dados', 'brasil', 'copadobrasil'),
+    'libertadores': os.path.join('dados', 'internacional', 'libertadores'),
+    'sudamericana': os.path.join('dados', 'internacional', 'sudamericana'),
+}
+PASTA_TIMES = os.path.join('dados', 'brasil', 'times')
+
+def padronizar_base(completo=False):
+    """
+    Padroniza os nomes nos CSVs e gera as listas anuais de times em dados/brasil/times.
+
+    Incremental: só relê/regrava os arquivos cujo conteúdo mudou desde a última
+    padronização (manifesto 'padronizar') e só regenera times{ano}.csv dos anos
+    cujas séries A/B mudaram. Use completo=True para reprocessar tudo.
+    """
+    # 4. LOOP PRINCIPAL DE PROCESSAMENTO
+    times_por_ano = {} # Dicionário para guardar conjuntos de times: {2006: {set of teams}}
+    manifesto = {} if completo else carregar_manifesto('padronizar')
+
+    arquivos_por_pasta = {
+        pasta: sorted(glob.glob(os.path.join(caminho_pasta, '*.csv')))
+        for pasta, caminho_pasta in PASTAS_PADRONIZAR.items()
     }
-    for curto, completo in substituicoes.items():
-        if nome.startswith(curto): return completo
-    return nome
-
-# 3. LOOP PRINCIPAL DE PROCESSAMENTO
-pastas = ['brasileiraoA', 'brasileiraoB', 'copadobrasil', 'libertadores', 'sudamericana']
-times_por_ano = {} # Dicionário para guardar conjuntos de times: {2006: {set of teams}}
-
-print("🚀 Iniciando saneamento dos dados...")
-
-for pasta in pastas:
-    caminho_pasta = f'dados/{pasta}'
-    arquivos = glob.glob(os.path.join(caminho_pasta, '*.csv'))
-    
-    for arquivo in arquivos:
-        # Extrai o ano do nome do arquivo (ex: brasileiraoA2020.csv -> 2020)
-        ano_match = re.search(r'(\d{4})', os.path.basename(arquivo))
-        if not ano_match: continue
-        ano = int(ano_match.group(1))
-        
-        df = pd.read_csv(arquivo)
-        
-        # Padroniza nomes nas colunas de jogos
-        df['Time da Casa'] = df['Time da Casa'].apply(normalizar_nome)
-        df['Time Visitante'] = df['Time Visitante'].apply(normalizar_nome)
-        
-        # Salva o arquivo padronizado (sobrescreve o original para limpar a base)
-        df.to_csv(arquivo, index=False)
-        
-        # Coleta times para a lista anual (apenas de ligas A e B para evitar inflar com times estrangeiros)
-        if pasta in ['brasileiraoA', 'brasileiraoB']:
-            if ano not in times_por_ano: times_por_ano[ano] = []
-            
-            # Identifica a série
-            serie = 'A' if 'brasileiraoA' in pasta else 'B'
-            
-            # Adiciona mandantes e visitantes ao set do ano
-            for t in df['Time da Casa'].unique():
-                times_por_ano[ano].append({'time': t, 'serie': serie})
-            for t in df['Time Visitante'].unique():
-                times_por_ano[ano].append({'time': t, 'serie': serie})
-
-# 4. GERAÇÃO DOS ARQUIVOS NA PASTA TIMES
-print("📂 Gerando listas de times por ano...")
-os.makedirs('dados/times', exist_ok=True)
-
-for ano, lista in times_por_ano.items():
-    df_ano = pd.DataFrame(lista).drop_duplicates(subset=['time'])
-    
-    # Adiciona a região baseada no dicionário MAPA_REGIOES
-    df_ano['região'] = df_ano['time'].map(MAPA_REGIOES).fillna('OUTRO')
-    
-    # Reordena colunas para o formato pedido: time,região,serie
-    df_ano = df_ano[['time', 'região', 'serie']]
-    
-    caminho_time = f'dados/times/times{ano}.csv'
-    df_ano.to_csv(caminho_time, index=False)
-    print(f"✅ Arquivo {caminho_time} gerado com {len(df_ano)} times.")
-
-print("\n✨ Processo finalizado! Base de dados higienizada.")
\ No newline at end of file
+    todos = [arq for lista in arquivos_por_pasta.values() for arq in lista]
+    alterados, _, atuais = arquivos_alterados(todos, manifesto)
+    alterados = set(alterados)
+
+    print(f"🚀 Iniciando saneamento dos dados... ({len(alterados)} de {len(todos)} arquivos alterados)")
+
+    # Anos cuja lista de times precisa ser refeita (A ou B mudou)
+    anos_alterados = set()
+    for pasta in ['brasileiraoA', 'brasileiraoB']:
+        for arquivo in arquivos_por_pasta[pasta]:
+            ano_match = re.search(r'(\d{4})', os.path.basename(arquivo))
+            if ano_match and arquivo in alterados:
+                anos_alterados.add(int(ano_match.group(1)))
+
+    for pasta, arquivos in arquivos_por_pasta.items():
+        for arquivo in arquivos:
+            # Extrai o ano do nome do arquivo (ex: brasileiraoA2020.csv -> 2020)
+            ano_match = re.search(r'(\d{4})', os.path.basename(arquivo))
+            if not ano_match: continue
+            ano = int(ano_match.group(1))
+
+            precisa_times = pasta in ['brasileiraoA', 'brasileiraoB'] and ano in anos_alterados
+            if arquivo not in alterados and not precisa_times:
+                continue
+
+            try:
+                df = pd.read_csv(arquivo)
+            except pd.errors.EmptyDataError:
+                continue
+
+            if arquivo in alterados:
+                # Padroniza nomes nas colunas de jogos
+                df['Time da Casa'] = normalizar_serie(df['Time da Casa'])
+                df['Time Visitante'] = normalizar_serie(df['Time Visitante'])
+
+                # Salva o arquivo padronizado (sobrescreve o original para limpar a base)
+                df.to_csv(arquivo, index=False)
+                # O manifesto guarda o estado JÁ padronizado, senão a próxima execução reprocessaria
+                atuais[os.path.normpath(arquivo)] = descrever_arquivo(arquivo)
+
+            # Coleta times para a lista anual (apenas de ligas A e B para evitar inflar com times estrangeiros)
+            if precisa_times:
+                if ano not in times_por_ano: times_por_ano[ano] = []
+
+                # Identifica a série
+                serie = 'A' if 'brasileiraoA' in pasta else 'B'
+
+                # Adiciona mandantes e visitantes ao set do ano
+                for t in df['Time da Casa'].unique():
+                    times_por_ano[ano].append({'time': t, 'serie': serie})
+                for t in df['Time Visitante'].unique():
+                    times_por_ano[ano].append({'time': t, 'serie': serie})
+
+    salvar_manifesto(atuais, 'padronizar')
+
+    # 5. GERAÇÃO DOS ARQUIVOS NA PASTA TIMES
+    print("📂 Gerando listas de times por ano...")
+    os.makedirs(PASTA_TIMES, exist_ok=True)
+
+    for ano, lista in sorted(times_por_ano.items()):
+        df_ano = pd.DataFrame(lista).drop_duplicates(subset=['time'])
+
+        # Adiciona a região baseada no dicionário MAPA_REGIOES
+        df_ano['região'] = df_ano['time'].map(MAPA_REGIOES).fillna('OUTRO')
+
+        # Reordena colunas para o formato pedido: time,região,serie
+        df_ano = df_ano[['time', 'região', 'serie']]
+
+        caminho_time = os.path.join(PASTA_TIMES, f'times{ano}.csv')
+        df_ano.to_csv(caminho_time, index=False)
+        print(f"✅ Arquivo {caminho_time} gerado com {len(df_ano)} times.")
+
+    print("\n✨ Processo finalizado! Base de dados higienizada.")
+
+
+if __name__ == "__main__":
+    padronizar_base(completo='--completo' in sys.argv)
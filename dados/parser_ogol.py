@@ -0,0 +1,231 @@
+import argparse
+import glob
+import gzip
+import os
+import re
+import time
+from datetime import datetime
+from html import unescape
+from urllib.parse import urljoin, urlparse, urlunparse
+
+import lxml.html
+
+# ============================================================================
+# PARSER SELETIVO DA TABELA DE RESULTADOS DO OGOL
+# ----------------------------------------------------------------------------
+# O BeautifulSoup com 'html.parser' monta a árvore da página inteira em
+# Python e depois faz um `find` por célula. Aqui:
+#   1. recortamos do HTML só o trecho <table class="zztable stats">...</table>
+#      (e a barra de números / a seta de temporada), com buscas de string;
+#   2. só esse trecho passa pelo lxml (parser em C);
+#   3. as células saem direto em colunas (fase, data, casa, placar, fora).
+# Se o recorte falhar (marcação inesperada), cai para o lxml na página toda.
+#
+#   python -m dados.parser_ogol                   -> benchmark no cache HTTP
+#   python -m dados.parser_ogol --corpus <pasta>  -> benchmark em *.html(.gz)
+# ============================================================================
+
+COLUNAS = ['fase', 'data', 'casa', 'placar', 'fora']
+
+_CLASSE_TABELA = re.compile(r'<table[^>]*class=["\']zztable stats["\']')
+_CLASSE_NUMEROS = re.compile(r'<div[^>]*class=["\']numbers["\']')
+_SETA_TEMPORADA = re.compile(r'<a\b[^>]*class=["\'][^"\']*\bzz-combo-arrow-right\b[^"\']*["\'][^>]*>')
+_HREF = re.compile(r'href=["\']([^"\']*)["\']')
+
+_DATAS = {}
+_MARCAS = {}  # tag -> regex de abertura/fechamento, para _recortar
+
+
+def _recortar(html, padrao, tag):
+    """
+    Trecho <tag ...>...</tag> que começa no primeiro match de `padrao` (None se não há).
+    Conta a profundidade: uma <tag> aninhada não encerra o recorte no seu </tag>.
+    """
+    achado = padrao.search(html)
+    if not achado:
+        return None
+    if tag not in _MARCAS:
+        _MARCAS[tag] = re.compile(rf'<(/?){tag}\b[^>]*>', re.IGNORECASE)
+    profundidade = 1
+    for marca in _MARCAS[tag].finditer(html, achado.end()):
+        profundidade += -1 if marca.group(1) else 1
+        if profundidade == 0:
+            return html[achado.start():marca.end()]
+    return None
+
+
+def _formatar_data(data_raw):
+    if data_raw not in _DATAS:
+        try:
+            _DATAS[data_raw] = datetime.strptime(data_raw, "%Y-%m-%d").strftime("%d/%m/%y")
+        except ValueError:
+            _DATAS[data_raw] = data_raw
+    return _DATAS[data_raw]
+
+
+def _tabela(html):
+    trecho = _recortar(html, _CLASSE_TABELA, 'table')
+    if trecho is not None:
+        return lxml.html.fragment_fromstring(trecho)
+    # Plano B: página inteira
+    encontradas = lxml.html.fromstring(html).xpath("//table[@class='zztable stats']")
+    return encontradas[0] if encontradas else None
+
+
+def extrair_colunas(html):
+    """
+    Colunas {'fase', 'data', 'casa', 'placar', 'fora'} da tabela de resultados,
+    ou None se a página não tem a tabela. Mesmas regras do parser antigo:
+    linhas sem mandante são ignoradas, 'R12' vira '12' e datas ISO viram dd/mm/aa.
+    """
+    tabela = _tabela(html)
+    if tabela is None or not tabela.xpath('./tbody'):
+        return None
+
+    colunas = {nome: [] for nome in COLUNAS}
+    for linha in tabela.xpath('./tbody/tr'):
+        celulas = {}
+        for td in linha.iterchildren('td'):
+            classe = td.get('class', '')
+            if classe in ('text home', 'text away'):
+                celulas.setdefault(classe, td)
+            else:
+                for nome in ('phase', 'date', 'result'):
+                    if nome in classe.split():
+                        celulas.setdefault(nome, td)
+        if len(celulas) < 5:
+            continue
+        casa = celulas['text home'].text_content().strip()
+        if not casa:
+            continue
+
+        fase = celulas['phase'].text_content().strip()
+        colunas['fase'].append(fase.replace('R', '') if 'R' in fase else fase)
+        colunas['data'].append(_formatar_data(celulas['date'].text_content().strip()))
+        colunas['casa'].append(casa)
+        colunas['placar'].append(celulas['result'].text_content().strip())
+        colunas['fora'].append(celulas['text away'].text_content().strip())
+    return colunas
+
+
+def colunas_em_linhas(colunas):
+    """[Rodada, Data, Time da Casa, Placar, Time Visitante] por jogo, para o csv.writer."""
+    return [list(jogo) for jogo in zip(*(colunas[nome] for nome in COLUNAS))]
+
+
+def links_da_barra(html):
+    """{texto: href} dos links da barra de números de página."""
+    trecho = _recortar(html, _CLASSE_NUMEROS, 'div')
+    if trecho is None:
+        return {}
+    barra = lxml.html.fragment_fromstring(trecho)
+    return {a.text_content().strip(): a.get('href') or '' for a in barra.iter('a')}
+
+
+def href_proxima_temporada(html, url_atual):
+    """Calendário da edição seguinte, a partir da seta `a.zz-combo-arrow-right` (None se não há)."""
+    achado = _SETA_TEMPORADA.search(html)
+    href = _HREF.search(achado.group(0)) if achado else None
+    if not href or not href.group(1):
+        return None
+    partes = urlparse(urljoin(url_atual, unescape(href.group(1))))
+    caminho = partes.path.rstrip('/')
+    if not caminho.endswith('/calendario'):
+        caminho += '/calendario'
+    return urlunparse(partes._replace(path=caminho, query='', fragment=''))
+
+
+# ============================================================================
+# BENCHMARK (corpus de páginas salvas)
+# ============================================================================
+
+def _extrair_bs4(html):
+    """O parser antigo (BeautifulSoup na página inteira + find por célula), só para comparação."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    tabela = soup.find('table', class_='zztable stats')
+    if not tabela or not tabela.find('tbody'):
+        return None
+    jogos = []
+    for linha in tabela.find('tbody').find_all('tr'):
+        try:
+            fase_raw = linha.find('td', class_='phase').text.strip()
+            data_raw = linha.find('td', class_='date').text.strip()
+            time_casa = linha.find('td', class_='text home').text.strip()
+            placar = linha.find('td', class_='result').text.strip()
+            time_fora = linha.find('td', class_='text away').text.strip()
+        except AttributeError:
+            continue
+        if not time_casa:
+            continue
+        rodada = fase_raw.replace('R', '') if 'R' in fase_raw else fase_raw
+        try:
+            data_formatada = datetime.strptime(data_raw, "%Y-%m-%d").strftime("%d/%m/%y")
+        except ValueError:
+            data_formatada = data_raw
+        jogos.append([rodada, data_formatada, time_casa, placar, time_fora])
+    return jogos
+
+
+def carregar_corpus(pasta=None):
+    """
+    Páginas HTML para o benchmark: arquivos *.html / *.html.gz de `pasta` ou,
+    sem pasta, os corpos do cache HTTP que contêm a tabela do ogol.
+    """
+    if pasta:
+        paginas = []
+        for caminho in sorted(glob.glob(os.path.join(pasta, '*.html*'))):
+            abrir = gzip.open if caminho.endswith('.gz') else open
+            with abrir(caminho, 'rb') as arquivo:
+                paginas.append(arquivo.read().decode('utf-8', errors='replace'))
+        return paginas
+
+    from dados.cache_http import PASTA_CACHE_HTTP
+    paginas = []
+    for caminho in glob.glob(os.path.join(PASTA_CACHE_HTTP, 'corpos', '*', '*.gz')):
+        with gzip.open(caminho, 'rb') as arquivo:
+            html = arquivo.read().decode('utf-8', errors='replace')
+        if 'zztable stats' in html:
+            paginas.append(html)
+    return paginas
+
+
+def _extrair_lxml(html):
+    colunas = extrair_colunas(html)
+    return None if colunas is None else colunas_em_linhas(colunas)
+
+
+def comparar_parsers(paginas, repeticoes=3):
+    """Páginas/s do parser antigo (bs4) e do seletivo (lxml) no mesmo corpus; confere se as saídas batem."""
+    resultado = {}
+    for nome, funcao in (('bs4', _extrair_bs4), ('lxml', _extrair_lxml)):
+        inicio = time.perf_counter()
+        for _ in range(repeticoes):
+            saidas = [funcao(html) for html in paginas]
+        duracao = max(time.perf_counter() - inicio, 1e-9)
+        resultado[nome] = {'paginas_por_s': round(len(paginas) * repeticoes / duracao, 1),
+                           'ms_por_pagina': round(duracao / (len(paginas) * repeticoes) * 1000, 3)}
+        resultado[nome]['saidas'] = saidas
+
+    iguais = all(a == b for a, b in zip(resultado['bs4'].pop('saidas'), resultado['lxml'].pop('saidas')))
+    print(f"📄 {len(paginas)} páginas x {repeticoes}")
+    for nome in ('bs4', 'lxml'):
+        print(f"   {nome:<5} {resultado[nome]['paginas_por_s']:>10} páginas/s  {resultado[nome]['ms_por_pagina']:>8} ms/página")
+    print(f"⚡ {resultado['bs4']['ms_por_pagina'] / max(resultado['lxml']['ms_por_pagina'], 1e-9):.1f}x mais rápido "
+          f"({'saídas idênticas' if iguais else '⚠️ saídas diferentes'})")
+    resultado['iguais'] = iguais
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark do parser da tabela do ogol.")
+    parser.add_argument('--corpus', help="pasta com páginas *.html ou *.html.gz (padrão: cache HTTP)")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    paginas = carregar_corpus(args.corpus)
+    if not paginas:
+        print("❌ Nenhuma página com a tabela 'zztable stats' no corpus.")
+    else:
+        comparar_parsers(paginas, args.repeticoes)
@@ -0,0 +1,172 @@
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from dados.metricas_raspagem import FONTE_OGOL_HTTP, FONTE_OGOL_SELENIUM, MetricasRaspagem, painel
+from dados.motor_raspagem import caminho_temporada, eh_temporada_atual, verificar_temporada
+from dados.raspagem_http import (TabelaNaoEncontrada, _gravar_temporada, descobrir_proxima_temporada,
+                                 raspar_temporada_http, raspar_temporada_selenium)
+from dados.sessao_navegador import SessaoNavegador
+
+# ============================================================================
+# POOL DE TRABALHADORES PARA A FILA DE CAMPEONATOS
+# ----------------------------------------------------------------------------
+# Em vez de um único Chrome passando pelos campeonatos um depois do outro,
+# N trabalhadores (threads), cada um com a sua sessão HTTP e o seu próprio
+# navegador headless isolado (criado só se a busca direta falhar), puxam
+# tarefas da tabela de tarefas do motor (dados/motor_raspagem.py). Cada
+# tarefa é UMA temporada; ao terminar, a temporada seguinte do mesmo
+# campeonato entra na tabela, então campeonatos diferentes andam em paralelo.
+#
+# - Recuperação: se o navegador/rede cair, o trabalhador descarta o navegador,
+#   devolve a temporada para 'pending' e segue; após MAX_TENTATIVAS ela fica
+#   'failed' (e é retomada na próxima execução do motor).
+# - Memória: o navegador de cada trabalhador é reciclado por nº de páginas ou
+#   RSS (dados/sessao_navegador.py); o pico por trabalhador sai no resumo.
+# - Educação: no máximo uma requisição a cada `intervalo` segundos por domínio,
+#   somando todos os trabalhadores (páginas vindas do cache não contam).
+# - Métricas: todos os trabalhadores somam num MetricasRaspagem
+#   (dados/metricas_raspagem.py), com linha de resumo ao vivo e relatório
+#   JSON/CSV no fim.
+#
+#   python -m dados.motor_raspagem --trabalhadores 4
+# ============================================================================
+
+MAX_TENTATIVAS = 3
+INTERVALO_POR_DOMINIO = 0.5
+ESPERA_FILA_VAZIA = 0.2
+
+
+class LimitadorDominio:
+    """Espaça as requisições por domínio (thread-safe): uma a cada `intervalo` segundos."""
+
+    def __init__(self, intervalo=INTERVALO_POR_DOMINIO):
+        self.intervalo = intervalo
+        self._proxima = {}
+        self._trava = threading.Lock()
+
+    def aguardar(self, url):
+        dominio = urlparse(url).netloc
+        with self._trava:
+            agora = time.monotonic()
+            horario = max(agora, self._proxima.get(dominio, agora))
+            self._proxima[dominio] = horario + self.intervalo
+        if horario > agora:
+            time.sleep(horario - agora)
+
+
+def _trabalhador(numero, tabela, campeonatos, limitador, resultado, trava, usar_selenium, metricas):
+    sessao = requests.Session()
+    navegador = SessaoNavegador(nome=f"T{numero}")
+    try:
+        while True:
+            tarefa = tabela.pegar(campeonatos)
+            if tarefa is None:
+                # Outra thread ainda pode enfileirar a temporada seguinte
+                if tabela.em_andamento(campeonatos) == 0:
+                    return
+                time.sleep(ESPERA_FILA_VAZIA)
+                continue
+
+            nome = f"{tarefa['nome_arquivo_base']}{tarefa['ano']}"
+            caminho = caminho_temporada(tarefa['pasta_destino'], tarefa['nome_arquivo_base'], tarefa['ano'])
+            fonte = FONTE_OGOL_HTTP
+            try:
+                situacao = verificar_temporada(caminho, tabela.jogos_vistos(tarefa))
+                # Última edição conhecida de um campeonato passado: a página 1 está no cache para sempre,
+                # então a seta para a edição seguinte tem de ser conferida na rede
+                conferir_proxima = tabela.ultima_do_campeonato(tarefa) and not eh_temporada_atual(tarefa['ano'])
+                if situacao['completa'] and not eh_temporada_atual(tarefa['ano']):
+                    # Temporada passada já completa no disco: só descobre a próxima edição
+                    proxima = descobrir_proxima_temporada(tarefa['url'], tarefa['ano'], sessao, limitador, metricas,
+                                                          usar_cache=not conferir_proxima)
+                    tabela.concluir(tarefa, situacao['jogos'], proxima)
+                    with trava:
+                        resultado['puladas'] += 1
+                    print(f"[T{numero}] ⏭️ {nome}: completa no disco ({situacao['jogos']} jogos)")
+                    continue
+
+                try:
+                    jogos, proxima, _ = raspar_temporada_http(tarefa['url'], tarefa['ano'], sessao,
+                                                              limitador=limitador, metricas=metricas)
+                except TabelaNaoEncontrada as e:
+                    if not usar_selenium:
+                        raise
+                    metricas.retentativa(FONTE_OGOL_HTTP, e)
+                    fonte = FONTE_OGOL_SELENIUM
+                    jogos, proxima, paginas = raspar_temporada_selenium(navegador.obter(), tarefa['url'],
+                                                                        tarefa['ano'], limitador=limitador,
+                                                                        metricas=metricas)
+                    navegador.registrar(paginas)
+                if not proxima and conferir_proxima:
+                    proxima = descobrir_proxima_temporada(tarefa['url'], tarefa['ano'], sessao, limitador, metricas,
+                                                          usar_cache=False)
+
+                os.makedirs(tarefa['pasta_destino'], exist_ok=True)
+                _gravar_temporada(jogos, caminho)
+                metricas.linhas(fonte, len(jogos))
+                tabela.concluir(tarefa, len(jogos), proxima)
+                with trava:
+                    resultado['temporadas'] += 1
+                    resultado['jogos'] += len(jogos)
+                print(f"[T{numero}] ✅ {nome}: {len(jogos)} jogos")
+                if not proxima:
+                    print(f"[T{numero}] 🏁 Fim do campeonato {tarefa['nome_arquivo_base'].upper()}")
+
+            except Exception as e:
+                # Navegador travado/morto ou rede instável: recomeça do zero só este trabalhador
+                navegador.descartar()
+                sessao = requests.Session()
+                metricas.retentativa(fonte, e)
+
+                if tabela.falhar(tarefa, e, MAX_TENTATIVAS) == 'failed':
+                    print(f"[T{numero}] ❌ {nome} falhou {MAX_TENTATIVAS} vezes: {e}")
+                    with trava:
+                        resultado['falhas'] += 1
+                else:
+                    print(f"[T{numero}] ⚠️ {nome} falhou ({e}). Voltou para a fila.")
+    finally:
+        navegador.descartar()
+        with trava:
+            resultado['memoria'][f"T{numero}"] = navegador.relatorio()
+
+
+def raspar_fila(tabela, campeonatos=None, trabalhadores=4, intervalo=INTERVALO_POR_DOMINIO, usar_selenium=True,
+                metricas=None, exportar_metricas=True):
+    """
+    Roda `trabalhadores` em paralelo sobre as tarefas pendentes da `tabela`
+    (TabelaTarefas), limitadas aos nomes em `campeonatos` se informado.
+
+    Retorna {'temporadas', 'puladas', 'jogos', 'falhas', 'memoria', 'metricas', 'segundos'}
+    desta execução ('metricas' é o resumo do MetricasRaspagem).
+    """
+    inicio = time.perf_counter()
+    metricas = metricas or MetricasRaspagem('ogol')
+    limitador = LimitadorDominio(intervalo)
+    resultado = {'temporadas': 0, 'puladas': 0, 'jogos': 0, 'falhas': 0, 'memoria': {}}
+    trava = threading.Lock()
+    threads = [threading.Thread(target=_trabalhador,
+                                args=(i + 1, tabela, campeonatos, limitador, resultado, trava, usar_selenium,
+                                      metricas),
+                                daemon=True)
+               for i in range(trabalhadores)]
+    print(f"🤖 {trabalhadores} trabalhadores, {intervalo}s entre requisições por domínio")
+    with painel(metricas):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    resultado['metricas'] = metricas.resumo()
+    if exportar_metricas:
+        metricas.exportar()
+    resultado['segundos'] = round(time.perf_counter() - inicio, 1)
+    print(f"\n🚀 {resultado['temporadas']} temporadas / {resultado['jogos']} jogos em {resultado['segundos']}s "
+          f"({resultado['puladas']} já completas, {resultado['falhas']} falhas)")
+    for nome, memoria in sorted(resultado['memoria'].items()):
+        if memoria['pico_mb']:
+            print(f"   {nome}: pico de {memoria['pico_mb']} MB, {memoria['reciclagens']} reciclagens do navegador")
+    return resultado
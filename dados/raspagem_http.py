@@ -0,0 +1,451 @@
+import argparse
+import csv
+import os
+import time
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+
+import requests
+
+from dados.cache_http import buscar, gravar_cache, ler_cache, texto, validade_temporada
+from dados.metricas_raspagem import FONTE_OGOL_HTTP, FONTE_OGOL_SELENIUM, MetricasRaspagem, painel
+from dados.parser_ogol import colunas_em_linhas, extrair_colunas, href_proxima_temporada, links_da_barra
+
+# ============================================================================
+# RASPAGEM DO OGOL SEM NAVEGADOR
+# ----------------------------------------------------------------------------
+# As páginas de calendário do ogol já vêm com a tabela `zztable stats` no HTML,
+# então dá para pedir as URLs direto por HTTP (sessão requests com keep-alive,
+# respostas no cache de dados/cache_http.py) em vez de abrir o Chrome, clicar
+# nos números e esperar com time.sleep. O Selenium fica só como plano B,
+# quando a busca direta não traz a tabela (bloqueio, página montada via JS).
+#
+#   python -m dados.raspagem_http --url <calendario> --nome goiano --ano 1944
+#   python -m dados.raspagem_http --url <calendario> --ano 1944 --benchmark
+# ============================================================================
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "pt-BR,pt;q=0.9",
+}
+
+CABECALHO_CSV = ['Rodada', 'Data', 'Time da Casa', 'Placar', 'Time Visitante']
+
+PAUSA_ENTRE_PAGINAS = 0.5  # educação com o servidor; páginas vindas do cache não esperam
+LIMITE_PAGINAS = 60
+
+
+class TabelaNaoEncontrada(Exception):
+    """A busca direta não trouxe a tabela de jogos (usar o Selenium)."""
+
+
+# ============================================================================
+# PARSER (o mesmo para HTML vindo do requests ou do page_source do Selenium)
+# ============================================================================
+
+def extrair_jogos_tabela(html):
+    """Linhas [Rodada, Data, Time da Casa, Placar, Time Visitante] da tabela, ou None se não há tabela."""
+    colunas = extrair_colunas(html)
+    return None if colunas is None else colunas_em_linhas(colunas)
+
+
+def _url_com_pagina(url, numero):
+    partes = urlparse(url)
+    consulta = parse_qs(partes.query)
+    consulta['page'] = [str(numero)]
+    return urlunparse(partes._replace(query=urlencode(consulta, doseq=True)))
+
+
+def url_proxima_pagina(html, url_atual, pagina_atual):
+    """URL do número de página seguinte na barra `div.numbers` (None se é a última)."""
+    href = links_da_barra(html).get(str(pagina_atual + 1))
+    if href is None:
+        return None
+    if href and not href.startswith(('#', 'javascript')):
+        return urljoin(url_atual, href)
+    return _url_com_pagina(url_atual, pagina_atual + 1)
+
+
+def url_proxima_temporada(html, url_atual):
+    """Calendário da edição seguinte, a partir da seta `a.zz-combo-arrow-right` (None se não há)."""
+    return href_proxima_temporada(html, url_atual)
+
+
+# ============================================================================
+# CAMINHO DIRETO (HTTP)
+# ============================================================================
+
+def _baixar_html(url, temporada, sessao, usar_cache=True, limitador=None, metricas=None):
+    """Retorna (html, veio_do_cache). `limitador` (ver pool_raspagem) só é consultado se for à rede."""
+    metricas = metricas or MetricasRaspagem()
+    if usar_cache:
+        guardada = ler_cache(url)
+        if guardada is not None:
+            metricas.cache(FONTE_OGOL_HTTP)
+            return texto(guardada), True
+    if limitador is not None:
+        limitador.aguardar(url)
+
+    antes = time.perf_counter()
+    try:
+        if usar_cache:
+            resposta = buscar(url, validade=validade_temporada(temporada), sessao=sessao,
+                              headers=HEADERS, timeout=30)
+            status, html, do_cache = resposta['status'], texto(resposta), resposta['do_cache']
+        else:
+            resposta = sessao.get(url, headers=HEADERS, timeout=30)
+            status, html, do_cache = resposta.status_code, resposta.text, False
+    except requests.RequestException:
+        metricas.requisicao(FONTE_OGOL_HTTP, time.perf_counter() - antes)
+        raise
+    if do_cache:
+        metricas.cache(FONTE_OGOL_HTTP)
+    else:
+        metricas.requisicao(FONTE_OGOL_HTTP, time.perf_counter() - antes, len(html.encode('utf-8')), status)
+
+    if status != 200:
+        raise TabelaNaoEncontrada(f"HTTP {status} em {url}")
+    return html, do_cache
+
+
+def raspar_temporada_http(url_calendario, temporada, sessao=None, usar_cache=True, limitador=None, metricas=None):
+    """
+    Todas as páginas do calendário de uma edição, sem navegador.
+
+    Retorna (jogos, url_proxima_temporada, paginas). Levanta TabelaNaoEncontrada
+    se a primeira página não traz a tabela.
+    """
+    sessao = sessao or requests.Session()
+    metricas = metricas or MetricasRaspagem()
+    jogos = []
+    url = url_calendario
+    pagina_atual = 1
+    html_primeira = None
+    assinatura_anterior = None
+
+    while url and pagina_atual <= LIMITE_PAGINAS:
+        html, do_cache = _baixar_html(url, temporada, sessao, usar_cache, limitador, metricas)
+        antes_parse = time.perf_counter()
+        jogos_pagina = extrair_jogos_tabela(html)
+        metricas.parse(FONTE_OGOL_HTTP, time.perf_counter() - antes_parse)
+        if jogos_pagina is None:
+            if pagina_atual == 1:
+                raise TabelaNaoEncontrada(f"Tabela não encontrada em {url}")
+            break
+
+        # Se o parâmetro de página for ignorado, a mesma página volta repetida
+        assinatura = tuple(map(tuple, jogos_pagina[:3]))
+        if assinatura == assinatura_anterior:
+            break
+        assinatura_anterior = assinatura
+
+        html_primeira = html_primeira or html
+        jogos.extend(jogos_pagina)
+        print(f"--- Página {pagina_atual}: {len(jogos_pagina)} jogos{' (cache)' if do_cache else ''} ---")
+
+        url = url_proxima_pagina(html, url, pagina_atual)
+        pagina_atual += 1
+        if url and not do_cache and limitador is None:
+            time.sleep(PAUSA_ENTRE_PAGINAS)
+
+    return jogos, url_proxima_temporada(html_primeira, url_calendario), pagina_atual - 1
+
+
+def descobrir_proxima_temporada(url_calendario, temporada, sessao=None, limitador=None, metricas=None,
+                                usar_cache=True):
+    """
+    Só a URL da edição seguinte, lendo a primeira página (normalmente do cache).
+
+    Na última edição conhecida de um campeonato use `usar_cache=False`: a
+    página de uma temporada passada fica no cache com NUNCA_EXPIRA e nunca
+    mostraria a seta para uma edição nova.
+    """
+    html, _ = _baixar_html(url_calendario, temporada, sessao or requests.Session(), usar_cache,
+                           limitador, metricas)
+    return url_proxima_temporada(html, url_calendario)
+
+
+# ============================================================================
+# PLANO B (SELENIUM)
+# ----------------------------------------------------------------------------
+# Sem time.sleep fixo: depois de abrir a página ou clicar num número, espera
+# até a tabela de resultados existir e ter conteúdo DIFERENTE do anterior
+# (ou o elemento antigo ficar obsoleto), com TEMPO_MAXIMO_ESPERA de teto.
+# Anúncios, rastreadores, fontes, CSS e imagens são bloqueados pelo
+# DevTools (Network.setBlockedURLs). O tempo de espera de cada página é
+# impresso e somado em `tempos_espera`, para comparar com os sleeps antigos.
+# ============================================================================
+
+TEMPO_MAXIMO_ESPERA = 15
+SLEEPS_FIXOS_ANTIGOS = {'abertura': 3, 'pagina': 2, 'clique': 3}  # raspagemgol: 3s ao abrir, 2s por página, 3s por clique
+
+URLS_BLOQUEADAS = [
+    '*.css', '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*', '*google-analytics.com*',
+    '*googletagservices.com*', '*adservice.google*', '*amazon-adsystem.com*', '*facebook.net*',
+    '*criteo*', '*taboola*', '*outbrain*', '*scorecardresearch*', '*hotjar*', '*fonts.googleapis.com*',
+]
+
+_JS_ASSINATURA_TABELA = """
+const corpo = document.querySelector('table.zztable.stats tbody');
+return corpo ? corpo.innerText.slice(0, 500) : null;
+"""
+
+
+def criar_navegador(bloquear_recursos=True):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    opcoes = Options()
+    opcoes.page_load_strategy = 'eager'
+    opcoes.add_argument("--disable-notifications")
+    opcoes.add_argument("--blink-settings=imagesEnabled=false")
+    opcoes.add_argument("--headless=new")
+    opcoes.add_argument("--window-size=1920,1080")
+    opcoes.add_argument("--disable-gpu")
+    opcoes.add_argument(f"user-agent={HEADERS['User-Agent']}")
+    opcoes.add_argument("--disable-dev-shm-usage")
+
+    pagina = webdriver.Chrome(options=opcoes)
+    pagina.set_page_load_timeout(30)
+    if bloquear_recursos:
+        pagina.execute_cdp_cmd('Network.enable', {})
+        pagina.execute_cdp_cmd('Network.setBlockedURLs', {'urls': URLS_BLOQUEADAS})
+    return pagina
+
+
+def _assinatura_tabela(pagina):
+    try:
+        return pagina.execute_script(_JS_ASSINATURA_TABELA)
+    except Exception:
+        return None
+
+
+def _esperar_tabela(pagina, assinatura_anterior=None, elemento_anterior=None):
+    """
+    Espera a tabela aparecer com conteúdo novo. Retorna (assinatura, segundos)
+    — assinatura None se estourou TEMPO_MAXIMO_ESPERA sem tabela nova.
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # Devolve (assinatura,): o until só para com retorno verdadeiro, e uma tabela
+    # presente mas vazia tem assinatura '' — sem a tupla, esperaria o tempo todo
+    def tabela_nova(driver):
+        assinatura = _assinatura_tabela(driver)
+        if assinatura is None:
+            return False
+        if assinatura != assinatura_anterior:
+            return (assinatura,)
+        # Mesmo texto mas elemento recriado (página com jogos idênticos, ou vazia de novo): também conta
+        if elemento_anterior is not None and EC.staleness_of(elemento_anterior)(driver):
+            return (assinatura,)
+        return False
+
+    inicio = time.perf_counter()
+    try:
+        (assinatura,) = WebDriverWait(pagina, TEMPO_MAXIMO_ESPERA, poll_frequency=0.1).until(tabela_nova)
+    except TimeoutException:
+        assinatura = None
+    return assinatura, time.perf_counter() - inicio
+
+
+def _corpo_tabela(pagina):
+    from selenium.webdriver.common.by import By
+
+    elementos = pagina.find_elements(By.CSS_SELECTOR, 'table.zztable.stats tbody')
+    return elementos[0] if elementos else None
+
+
+def _fechar_popup(pagina):
+    """Fecha o anúncio (z-index: 1000) se ele estiver na tela, sem esperar por ele; retorna os segundos gastos."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    inicio = time.perf_counter()
+    try:
+        botoes = pagina.find_elements(By.XPATH, "//button[contains(@style, 'z-index: 1000')]")
+        if botoes and botoes[0].is_displayed():
+            abas_antes = len(pagina.window_handles)
+            pagina.execute_script("arguments[0].click();", botoes[0])
+            try:
+                # Só até a aba pirata abrir (ou 3s, se ela nunca abrir)
+                WebDriverWait(pagina, 3, poll_frequency=0.1).until(lambda d: len(d.window_handles) > abas_antes)
+            except Exception:
+                pass
+            if len(pagina.window_handles) > 1:
+                aba_velha = pagina.window_handles[0]
+                aba_nova = pagina.window_handles[-1]
+                pagina.switch_to.window(aba_velha)
+                pagina.close()
+                pagina.switch_to.window(aba_nova)
+    except Exception:
+        pass
+    return time.perf_counter() - inicio
+
+
+def raspar_temporada_selenium(pagina, url_calendario, temporada, limitador=None, tempos_espera=None,
+                              metricas=None):
+    """
+    Mesma saída de raspar_temporada_http, clicando nos números como o raspador antigo.
+
+    `tempos_espera`, se for uma lista, recebe os segundos de espera de cada página.
+    Em `metricas`, cada página conta como uma requisição cuja latência é a
+    abertura/clique + espera pela tabela. O HTML de cada página vai para o
+    cache HTTP com a chave `<url>#pagina=N`.
+    """
+    from selenium.webdriver.common.by import By
+
+    metricas = metricas or MetricasRaspagem()
+    if limitador is not None:
+        limitador.aguardar(url_calendario)
+    antes = time.perf_counter()
+    pagina.get(url_calendario)
+    assinatura, espera = _esperar_tabela(pagina)
+
+    jogos = []
+    paginas = 0
+    html_primeira = None
+    while assinatura is not None:
+        espera += _fechar_popup(pagina)
+        html = pagina.page_source
+        metricas.requisicao(FONTE_OGOL_SELENIUM, time.perf_counter() - antes, len(html.encode('utf-8')), 200)
+        # Guarda o HTML bruto: mudanças no parser não exigem nova raspagem (e a gravação entra no replay)
+        gravar_cache(f"{url_calendario}#pagina={paginas + 1}", 200, {}, html,
+                     validade=validade_temporada(temporada))
+        antes_parse = time.perf_counter()
+        jogos_pagina = extrair_jogos_tabela(html)
+        metricas.parse(FONTE_OGOL_SELENIUM, time.perf_counter() - antes_parse)
+        if jogos_pagina is None:
+            break
+        paginas += 1
+        html_primeira = html_primeira or html
+        jogos.extend(jogos_pagina)
+        if tempos_espera is not None:
+            tempos_espera.append(espera)
+        print(f"--- Página {paginas} (Selenium): {len(jogos_pagina)} jogos, espera {espera:.2f}s ---")
+
+        botoes = pagina.find_elements(By.XPATH, f"//div[@class='numbers']//a[text()='{paginas + 1}']")
+        if not botoes:
+            break
+        if limitador is not None:
+            limitador.aguardar(url_calendario)
+        elemento_anterior = _corpo_tabela(pagina)
+        antes = time.perf_counter()
+        pagina.execute_script("arguments[0].click();", botoes[0])
+        assinatura, espera = _esperar_tabela(pagina, assinatura, elemento_anterior)
+
+    proxima = url_proxima_temporada(html_primeira, url_calendario) if html_primeira else None
+    return jogos, proxima, paginas
+
+
+def espera_fixa_antiga(paginas):
+    """Segundos que os sleeps fixos do raspador antigo gastariam para `paginas` páginas."""
+    if paginas == 0:
+        return 0
+    return (SLEEPS_FIXOS_ANTIGOS['abertura'] + paginas * SLEEPS_FIXOS_ANTIGOS['pagina']
+            + (paginas - 1) * SLEEPS_FIXOS_ANTIGOS['clique'])
+
+
+# ============================================================================
+# CAMPEONATO INTEIRO (HTTP com plano B)
+# ============================================================================
+
+def _gravar_temporada(jogos, caminho):
+    with open(caminho, mode='w', newline='', encoding='utf-8') as arquivo_csv:
+        escritor = csv.writer(arquivo_csv)
+        escritor.writerow(CABECALHO_CSV)
+        escritor.writerows(jogos)
+
+
+def raspar_campeonato(nome_arquivo_base, ano_inicial, url_inicial, pasta_destino, usar_selenium_se_falhar=True,
+                      metricas=None):
+    """
+    Percorre as edições a partir de `url_inicial`, gravando `<nome><ano>.csv`
+    em `pasta_destino`. Aceita os mesmos campos da fila_de_campeonatos.
+    """
+    os.makedirs(pasta_destino, exist_ok=True)
+    print(f"\n🏆 INICIANDO RASPAGEM: {nome_arquivo_base.upper()} -> {os.path.abspath(pasta_destino)}")
+
+    from dados.sessao_navegador import SessaoNavegador
+
+    sessao = requests.Session()
+    metricas = metricas or MetricasRaspagem(nome_arquivo_base)
+    navegador = SessaoNavegador(nome=nome_arquivo_base)
+    temporada_atual = ano_inicial
+    url = url_inicial
+    try:
+        while url:
+            print(f"\n[{nome_arquivo_base}{temporada_atual}.csv] Iniciando extração da temporada...")
+            try:
+                jogos, proxima, _ = raspar_temporada_http(url, temporada_atual, sessao, metricas=metricas)
+                fonte = FONTE_OGOL_HTTP
+            except (TabelaNaoEncontrada, requests.RequestException) as e:
+                if not usar_selenium_se_falhar:
+                    raise
+                metricas.retentativa(FONTE_OGOL_HTTP, e)
+                print(f"⚠️ Busca direta falhou ({e}). Usando o Selenium nesta temporada.")
+                jogos, proxima, paginas = raspar_temporada_selenium(navegador.obter(), url, temporada_atual,
+                                                                    metricas=metricas)
+                navegador.registrar(paginas)
+                fonte = FONTE_OGOL_SELENIUM
+
+            _gravar_temporada(jogos, os.path.join(pasta_destino, f'{nome_arquivo_base}{temporada_atual}.csv'))
+            metricas.linhas(fonte, len(jogos))
+            url = proxima
+            temporada_atual += 1
+    finally:
+        navegador.descartar()
+    print(f"\n✅ Finalizamos o campeonato: {nome_arquivo_base.upper()}!")
+
+
+def comparar_modos(url_calendario, temporada):
+    """Benchmark: páginas/minuto da busca direta (sem cache) contra o Selenium na mesma edição."""
+    resultado = {}
+
+    inicio = time.perf_counter()
+    _, _, paginas = raspar_temporada_http(url_calendario, temporada, requests.Session(), usar_cache=False)
+    resultado['http'] = paginas / (time.perf_counter() - inicio) * 60
+
+    navegador = criar_navegador()
+    tempos_espera = []
+    try:
+        inicio = time.perf_counter()
+        _, _, paginas = raspar_temporada_selenium(navegador, url_calendario, temporada,
+                                                  tempos_espera=tempos_espera)
+        resultado['selenium'] = paginas / (time.perf_counter() - inicio) * 60
+    finally:
+        navegador.quit()
+    resultado['espera_selenium'] = sum(tempos_espera)
+    resultado['espera_fixa_antiga'] = espera_fixa_antiga(paginas)
+
+    print(f"\n⚡ HTTP: {resultado['http']:.1f} páginas/min | Selenium: {resultado['selenium']:.1f} páginas/min "
+          f"-> {resultado['http'] / max(resultado['selenium'], 1e-9):.1f}x")
+    print(f"⏱️ Espera no Selenium: {resultado['espera_selenium']:.1f}s "
+          f"(os sleeps fixos antigos somariam {resultado['espera_fixa_antiga']}s)")
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Raspagem do calendário do ogol via HTTP direto.")
+    parser.add_argument('--url', required=True, help="URL do calendário da primeira edição")
+    parser.add_argument('--ano', type=int, required=True, help="ano da primeira edição")
+    parser.add_argument('--nome', help="prefixo dos CSVs (ex.: goiano)")
+    parser.add_argument('--pasta', help="pasta de destino (padrão: dados/brasil/estaduais/<nome>)")
+    parser.add_argument('--benchmark', action='store_true', help="compara páginas/min HTTP x Selenium")
+    parser.add_argument('--sem-selenium', action='store_true', help="não usa o navegador como plano B")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        comparar_modos(args.url, args.ano)
+    else:
+        if not args.nome:
+            parser.error("--nome é obrigatório para raspar")
+        pasta = args.pasta or os.path.join('dados', 'brasil', 'estaduais', args.nome)
+        metricas = MetricasRaspagem(args.nome)
+        with painel(metricas):
+            raspar_campeonato(args.nome, args.ano, args.url, pasta, usar_selenium_se_falhar=not args.sem_selenium,
+                              metricas=metricas)
+        metricas.exportar()
@@ -1,59 +1,108 @@
+import argparse
+import asyncio
+import json
 import requests
 import pandas as pd
 import urllib3
 import time
 import os
+import shutil
+
+import aiohttp
+
+from dados.cache_http import NUNCA_EXPIRA, buscar, como_json, gravar_cache, ler_cache
+from dados.concursos_loteca import ARQUIVO_BRUTOS, gravar_brutos
+from dados.metricas_raspagem import FONTE_CAIXA, MetricasRaspagem, painel
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-def raspar_loteca_resiliente():
-    concurso_atual = 195
-    arquivo_csv = 'dataset_loteca_2006_presente.csv'
+URL_BASE = "https://servicebus2.caixa.gov.br/portaldeloterias/api/loteca"
+ARQUIVO_CSV = os.path.join('dados', 'loteca', 'dataset_loteca_2006_presente.csv')
+CONCURSO_INICIAL = 195
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
+}
+
+COLUNAS_CSV = ['Concurso', 'Data', 'Jogo_Num', 'Mandante', 'Gols_Mandante',
+               'Visitante', 'Gols_Visitante', 'Campeonato', 'Dia_Semana']
+
+VALIDADE_CONCURSO_ABERTO = 30 * 60  # concurso ainda sem todos os placares: rebusca em 30 min
+
+
+def extrair_linhas_concurso(json_dados):
+    """Converte o JSON de um concurso nas linhas (uma por jogo) do CSV da Loteca."""
+    data_apuracao = json_dados.get('dataApuracao')
+    dados_concurso = []
+    for jogo in json_dados.get('listaResultadoEquipeEsportiva', []) or []:
+        linha = {
+            'Concurso': json_dados.get('numero'),
+            'Data': data_apuracao,
+            'Jogo_Num': jogo.get('nuSequencial'),
+            'Mandante': jogo.get('nomeEquipeUm'),
+            'Gols_Mandante': jogo.get('nuGolEquipeUm'),
+            'Visitante': jogo.get('nomeEquipeDois'),
+            'Gols_Visitante': jogo.get('nuGolEquipeDois'),
+            'Campeonato': jogo.get('nomeCampeonato'),
+            'Dia_Semana': jogo.get('diaSemana')
+        }
+        dados_concurso.append(linha)
+    return dados_concurso
+
+
+def validade_concurso(json_dados):
+    """Concurso com todos os placares apurados nunca muda; sem placares, expira logo."""
+    jogos = json_dados.get('listaResultadoEquipeEsportiva') or []
+    apurado = bool(jogos) and all(j.get('nuGolEquipeUm') is not None and j.get('nuGolEquipeDois') is not None
+                                  for j in jogos)
+    return NUNCA_EXPIRA if apurado else VALIDADE_CONCURSO_ABERTO
+
+
+def raspar_loteca_resiliente(url_base=URL_BASE, arquivo_csv=ARQUIVO_CSV, arquivo_brutos=ARQUIVO_BRUTOS,
+                             metricas=None, tamanho_lote=50):
+    concurso_atual = CONCURSO_INICIAL
+    metricas = metricas or MetricasRaspagem('loteca')
+    brutos = []  # JSONs completos, gravados em lotes (gravar_brutos reescreve o arquivo sem repetir concurso)
     
     # Se o arquivo já existir de uma execução anterior, vamos apagá-loc para começar limpo
     if os.path.exists(arquivo_csv):
         os.remove(arquivo_csv)
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36"
-    }
-
     print("Iniciando extração robusta para o projeto Loteca...")
     
     while True:
-        url = f"https://servicebus2.caixa.gov.br/portaldeloterias/api/loteca/{concurso_atual}"
+        url = f"{url_base}/{concurso_atual}"
         sucesso_no_concurso = False
         
         # Sistema de repetição: tenta até 5 vezes se der timeout
         for tentativa in range(1, 6):
             try:
-                resposta = requests.get(url, headers=headers, verify=False, timeout=20)
+                antes = time.perf_counter()
+                resposta = buscar(url, validade=lambda r: validade_concurso(como_json(r)),
+                                  headers=HEADERS, verify=False, timeout=20)
+                if resposta['do_cache']:
+                    metricas.cache(FONTE_CAIXA)
+                else:
+                    metricas.requisicao(FONTE_CAIXA, time.perf_counter() - antes, len(resposta['corpo']),
+                                        resposta['status'])
                 
-                if resposta.status_code != 200:
+                if resposta['status'] != 200:
                     print(f"Fim dos dados ou erro na rota. Parando no concurso {concurso_atual - 1}.")
+                    gravar_brutos(brutos, arquivo_brutos)
                     return # Encerra a função
                     
-                json_dados = resposta.json()
+                antes_parse = time.perf_counter()
+                json_dados = como_json(resposta)
                 data_apuracao = json_dados.get('dataApuracao')
                 
                 print(f"Baixando Concurso {concurso_atual} - {data_apuracao} (Tentativa {tentativa})")
                 
-                lista_jogos = json_dados.get('listaResultadoEquipeEsportiva', [])
-                dados_concurso = []
-                
-                for jogo in lista_jogos:
-                    linha = {
-                        'Concurso': json_dados.get('numero'),
-                        'Data': data_apuracao,
-                        'Jogo_Num': jogo.get('nuSequencial'),
-                        'Mandante': jogo.get('nomeEquipeUm'),
-                        'Gols_Mandante': jogo.get('nuGolEquipeUm'),
-                        'Visitante': jogo.get('nomeEquipeDois'),
-                        'Gols_Visitante': jogo.get('nuGolEquipeDois'),
-                        'Campeonato': jogo.get('nomeCampeonato'),
-                        'Dia_Semana': jogo.get('diaSemana')
-                    }
-                    dados_concurso.append(linha)
+                dados_concurso = extrair_linhas_concurso(json_dados)
+                metricas.parse(FONTE_CAIXA, time.perf_counter() - antes_parse)
+                brutos.append(json_dados)
+                if len(brutos) >= tamanho_lote:
+                    gravar_brutos(brutos, arquivo_brutos)
+                    brutos = []
                 
                 if dados_concurso:
                     df_temp = pd.DataFrame(dados_concurso)
@@ -62,23 +111,309 @@ def raspar_loteca_resiliente():
                     # Salva no CSV imediatamente. Se for o primeiro, escreve o cabeçalho.
                     incluir_cabecalho = not os.path.exists(arquivo_csv)
                     df_temp.to_csv(arquivo_csv, mode='a', index=False, encoding='utf-8', header=incluir_cabecalho)
+                    metricas.linhas(FONTE_CAIXA, len(df_temp))
                 
                 sucesso_no_concurso = True
                 concurso_atual += 1
-                time.sleep(0.5)
+                if not resposta['do_cache']:
+                    time.sleep(0.5)
                 break # Sai do loop de tentativas pois deu certo
                 
-            except requests.exceptions.Timeout:
+            except requests.exceptions.Timeout as e:
+                metricas.requisicao(FONTE_CAIXA, time.perf_counter() - antes)
+                metricas.retentativa(FONTE_CAIXA, e)
                 print(f"Timeout no concurso {concurso_atual}. Aguardando 3 segundos... (Tentativa {tentativa}/5)")
                 time.sleep(3)
             except Exception as e:
+                if isinstance(e, requests.exceptions.RequestException):
+                    # Também sem resposta (conexão recusada, DNS...)
+                    metricas.requisicao(FONTE_CAIXA, time.perf_counter() - antes)
+                metricas.retentativa(FONTE_CAIXA, e)
                 print(f"Erro inesperado no concurso {concurso_atual}: {e}. (Tentativa {tentativa}/5)")
                 time.sleep(3)
                 
         # Se esgotou as 5 tentativas e não teve sucesso, aborta a execução para não ficar em loop infinito
         if not sucesso_no_concurso:
             print(f"Falha definitiva ao baixar o concurso {concurso_atual}. Script interrompido.")
+            gravar_brutos(brutos, arquivo_brutos)
             break
 
+
+# ============================================================================
+# VERSÃO ASSÍNCRONA (conexões reaproveitadas, concorrência limitada)
+# ============================================================================
+
+class LimitadorTaxa:
+    """Token bucket assíncrono: no máximo `taxa` requisições/s, com rajadas até `capacidade`."""
+
+    def __init__(self, taxa, capacidade=None):
+        self.taxa = float(taxa)
+        self.capacidade = float(capacidade or max(1.0, taxa))
+        self.tokens = self.capacidade
+        self.ultimo = time.monotonic()
+        self._trava = asyncio.Lock()
+
+    async def aguardar(self):
+        async with self._trava:
+            while True:
+                agora = time.monotonic()
+                self.tokens = min(self.capacidade, self.tokens + (agora - self.ultimo) * self.taxa)
+                self.ultimo = agora
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.taxa)
+
+
+async def _baixar_concurso(sessao, url_base, numero, limitador, estatisticas, metricas, tentativas=5):
+    """Busca um concurso. Retorna (numero, json) ou (numero, None) se a API respondeu != 200."""
+    url = f"{url_base}/{numero}"
+    guardada = ler_cache(url)
+    if guardada is not None:
+        estatisticas['cache'] += 1
+        metricas.cache(FONTE_CAIXA)
+        return numero, como_json(guardada)
+
+    for tentativa in range(1, tentativas + 1):
+        await limitador.aguardar()
+        antes = time.perf_counter()
+        try:
+            async with sessao.get(url) as resposta:
+                corpo = await resposta.read()
+                segundos = time.perf_counter() - antes
+                estatisticas['requisicoes'] += 1
+                estatisticas['latencias'].append(segundos)
+                metricas.requisicao(FONTE_CAIXA, segundos, len(corpo), resposta.status)
+                if resposta.status >= 500:
+                    raise aiohttp.ClientResponseError(resposta.request_info, resposta.history,
+                                                      status=resposta.status, message='erro no servidor')
+                if resposta.status != 200:
+                    return numero, None
+                antes_parse = time.perf_counter()
+                json_dados = json.loads(corpo)
+                metricas.parse(FONTE_CAIXA, time.perf_counter() - antes_parse, paginas=0)
+                gravar_cache(url, resposta.status, resposta.headers, corpo, validade=validade_concurso(json_dados))
+                return numero, json_dados
+        except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+            estatisticas['retentativas'] += 1
+            metricas.retentativa(FONTE_CAIXA, e)
+            if not isinstance(e, aiohttp.ClientResponseError):
+                # Sem resposta (timeout, conexão): a tentativa entra na latência com o tempo perdido
+                segundos = time.perf_counter() - antes
+                estatisticas['requisicoes'] += 1
+                estatisticas['latencias'].append(segundos)
+                metricas.requisicao(FONTE_CAIXA, segundos)
+            print(f"Falha no concurso {numero}: {e or type(e).__name__}. (Tentativa {tentativa}/{tentativas})")
+            await asyncio.sleep(min(2 ** (tentativa - 1), 10))
+    raise RuntimeError(f"Falha definitiva ao baixar o concurso {numero}.")
+
+
+def ultimo_concurso_salvo(arquivo_csv=ARQUIVO_CSV):
+    """Maior Concurso já gravado no CSV (None se o arquivo não existe ou está vazio)."""
+    if not os.path.exists(arquivo_csv) or os.path.getsize(arquivo_csv) == 0:
+        return None
+    concursos = pd.read_csv(arquivo_csv, usecols=['Concurso'])['Concurso']
+    return int(concursos.max()) if len(concursos) else None
+
+
+def _gravar_lote(linhas, arquivo_csv):
+    """
+    Acrescenta um lote de linhas ao CSV de forma atômica: copia o arquivo atual
+    para um temporário, anexa o lote e troca com os.replace. Se o processo cair
+    no meio, o CSV continua com o último lote completo.
+    """
+    if not linhas:
+        return 0
+    df_lote = pd.DataFrame(linhas, columns=COLUNAS_CSV)
+    df_lote = df_lote.dropna(subset=['Gols_Mandante', 'Gols_Visitante'])
+
+    temporario = arquivo_csv + '.tmp'
+    existe = os.path.exists(arquivo_csv) and os.path.getsize(arquivo_csv) > 0
+    if existe:
+        shutil.copyfile(arquivo_csv, temporario)
+    else:
+        os.makedirs(os.path.dirname(arquivo_csv) or '.', exist_ok=True)
+    df_lote.to_csv(temporario, mode='a' if existe else 'w', index=False, encoding='utf-8', header=not existe)
+    os.replace(temporario, arquivo_csv)
+    return len(df_lote)
+
+
+async def raspar_loteca_async(inicio=None, fim=None, concorrencia=8, taxa_por_segundo=10,
+                              url_base=URL_BASE, arquivo_csv=ARQUIVO_CSV, timeout=20, verificar_ssl=False,
+                              tamanho_lote=50, arquivo_brutos=ARQUIVO_BRUTOS, metricas=None):
+    """
+    Baixa os concursos de `inicio` até `fim` (ou até a API responder != 200).
+
+    Sem `inicio`, retoma do concurso seguinte ao último já gravado no CSV
+    (ou de CONCURSO_INICIAL se o CSV não existe). Ao retomar, a janela de
+    concursos em voo começa em 1 e dobra a cada concurso baixado: sem
+    concurso novo custa uma requisição, com um concurso novo, três. As linhas ficam em memória e vão para o
+    disco em lotes de `tamanho_lote` concursos, cada lote gravado atomicamente.
+    O JSON completo de cada concurso (rateio, acumulado...) vai no mesmo lote
+    para `arquivo_brutos` (ver dados/concursos_loteca.py).
+    `metricas` (MetricasRaspagem) recebe requisições, latências, retentativas
+    por causa, tempo de parser e linhas gravadas.
+
+    Até `concorrencia` concursos ficam em voo ao mesmo tempo, numa única sessão
+    HTTP com pool de conexões, e o token bucket limita a taxa total. As respostas
+    chegam fora de ordem, mas são reordenadas por número antes de ir para o CSV.
+    `url_base` pode apontar para um servidor local que serve JSONs gravados.
+    """
+    retomando = False
+    if inicio is None:
+        ultimo_salvo = ultimo_concurso_salvo(arquivo_csv)
+        inicio = CONCURSO_INICIAL if ultimo_salvo is None else ultimo_salvo + 1
+        retomando = ultimo_salvo is not None
+
+    inicio_tempo = time.perf_counter()
+    limitador = LimitadorTaxa(taxa_por_segundo, capacidade=concorrencia)
+    metricas = metricas or MetricasRaspagem('loteca')
+    estatisticas = {'requisicoes': 0, 'retentativas': 0, 'cache': 0, 'concursos': 0, 'jogos': 0,
+                    'latencias': []}  # segundos por tentativa que foi à rede (inclui as que falharam)
+
+    conector = aiohttp.TCPConnector(limit=concorrencia, ssl=None if verificar_ssl else False)
+    tempo_limite = aiohttp.ClientTimeout(total=timeout)
+
+    proximo_agendar = inicio
+    proximo_gravar = inicio
+    ultimo = fim            # descoberto quando a API responde != 200
+    prontos = {}            # numero -> json, aguardando a vez de ser gravado
+    lote = []               # linhas já em ordem, aguardando o próximo commit em disco
+    brutos = []             # JSONs completos dos concursos do lote
+    concursos_no_lote = 0
+    em_voo = set()
+    falha = None            # exceção do concurso que esgotou as tentativas (interrompe a raspagem)
+    # Retomando, quase sempre só há um ou dois concursos novos: a janela começa
+    # em 1 e dobra a cada concurso baixado, em vez de disparar `concorrencia`
+    # sondagens além do fim
+    janela = 1 if retomando else concorrencia
+
+    async with aiohttp.ClientSession(connector=conector, timeout=tempo_limite, headers=HEADERS) as sessao:
+        print(f"🚀 Extração assíncrona da Loteca a partir do concurso {inicio} (concorrência {concorrencia})...")
+        while True:
+            # Mantém a janela de concursos em voo cheia
+            while len(em_voo) < janela and (ultimo is None or proximo_agendar <= ultimo):
+                em_voo.add(asyncio.create_task(
+                    _baixar_concurso(sessao, url_base, proximo_agendar, limitador, estatisticas, metricas)))
+                proximo_agendar += 1
+
+            if not em_voo:
+                break
+
+            concluidas, em_voo = await asyncio.wait(em_voo, return_when=asyncio.FIRST_COMPLETED)
+            for tarefa in concluidas:
+                try:
+                    numero, json_dados = tarefa.result()
+                except Exception as e:
+                    falha = falha or e
+                    continue
+                if json_dados is None:
+                    # Passou do último concurso publicado
+                    ultimo = numero - 1 if ultimo is None else min(ultimo, numero - 1)
+                else:
+                    prontos[numero] = json_dados
+                    janela = min(concorrencia, janela * 2)
+
+            # Re-sequencia: junta ao lote tudo o que já está contíguo
+            while proximo_gravar in prontos:
+                json_dados = prontos.pop(proximo_gravar)
+                antes_parse = time.perf_counter()
+                lote.extend(extrair_linhas_concurso(json_dados))
+                metricas.parse(FONTE_CAIXA, time.perf_counter() - antes_parse)
+                brutos.append(json_dados)
+                concursos_no_lote += 1
+                print(f"Concurso {proximo_gravar} - {json_dados.get('dataApuracao')} baixado")
+                proximo_gravar += 1
+
+            if falha is not None:
+                # Um concurso esgotou as tentativas: para as outras tarefas e grava o que já está em ordem
+                for tarefa in em_voo:
+                    tarefa.cancel()
+                await asyncio.gather(*em_voo, return_exceptions=True)
+                break
+
+            if concursos_no_lote >= tamanho_lote:
+                # Bruto antes do CSV: o CSV marca de onde a próxima execução retoma
+                gravar_brutos(brutos, arquivo_brutos)
+                gravados = _gravar_lote(lote, arquivo_csv)
+                estatisticas['jogos'] += gravados
+                metricas.linhas(FONTE_CAIXA, gravados)
+                estatisticas['concursos'] += concursos_no_lote
+                print(f"💾 Lote gravado até o concurso {proximo_gravar - 1}")
+                lote, brutos, concursos_no_lote = [], [], 0
+
+            # Descarta o que foi baixado além do fim descoberto
+            if ultimo is not None:
+                for numero in [n for n in prontos if n > ultimo]:
+                    prontos.pop(numero)
+
+    gravar_brutos(brutos, arquivo_brutos)
+    gravados = _gravar_lote(lote, arquivo_csv)
+    estatisticas['jogos'] += gravados
+    metricas.linhas(FONTE_CAIXA, gravados)
+    estatisticas['concursos'] += concursos_no_lote
+
+    if falha is not None:
+        print(f"❌ Parado no concurso {proximo_gravar - 1} ({estatisticas['concursos']} concursos gravados).")
+        raise falha
+    if estatisticas['concursos'] == 0:
+        print(f"Nada novo: o CSV já está no concurso {inicio - 1}.")
+    estatisticas['segundos'] = round(time.perf_counter() - inicio_tempo, 2)
+    print(f"✅ {estatisticas['concursos']} concursos / {estatisticas['jogos']} jogos em "
+          f"{estatisticas['segundos']}s ({estatisticas['retentativas']} retentativas, "
+          f"{estatisticas['cache']} do cache).")
+    return estatisticas
+
+
+def reprocessar_do_cache(inicio=CONCURSO_INICIAL, url_base=URL_BASE, arquivo_csv=ARQUIVO_CSV,
+                         arquivo_brutos=ARQUIVO_BRUTOS):
+    """
+    Refaz o CSV inteiro (e o arquivo de JSONs brutos) só com as respostas
+    guardadas, sem tocar na rede.
+
+    Para rodar depois de mudar extrair_linhas_concurso, ou para preencher o
+    rateio dos concursos antigos: para no primeiro concurso que não está no cache.
+    """
+    inicio_tempo = time.perf_counter()
+    linhas = []
+    brutos = []
+    numero = inicio
+    while (guardada := buscar(f"{url_base}/{numero}", offline=True)) is not None:
+        json_dados = como_json(guardada)
+        linhas.extend(extrair_linhas_concurso(json_dados))
+        brutos.append(json_dados)
+        numero += 1
+
+    for arquivo in (arquivo_csv, arquivo_brutos):
+        if brutos and os.path.exists(arquivo):
+            os.remove(arquivo)
+    gravar_brutos(brutos, arquivo_brutos)
+    jogos = _gravar_lote(linhas, arquivo_csv)
+    print(f"♻️ {numero - inicio} concursos / {jogos} jogos reprocessados do cache em "
+          f"{time.perf_counter() - inicio_tempo:.2f}s.")
+    return jogos
+
+
 if __name__ == "__main__":
-    raspar_loteca_resiliente()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Raspagem dos concursos da Loteca (API da Caixa).")
+    parser.add_argument('--sequencial', action='store_true', help="usa o raspador antigo, um concurso por vez")
+    parser.add_argument('--concorrencia', type=int, default=8)
+    parser.add_argument('--taxa', type=float, default=10, help="requisições por segundo")
+    parser.add_argument('--url-base', default=URL_BASE)
+    parser.add_argument('--completo', action='store_true', help="apaga o CSV e baixa tudo desde o concurso inicial")
+    parser.add_argument('--offline', action='store_true', help="refaz o CSV só a partir do cache HTTP")
+    args = parser.parse_args()
+
+    if args.offline:
+        reprocessar_do_cache(url_base=args.url_base)
+    else:
+        metricas = MetricasRaspagem('loteca')
+        with painel(metricas):
+            if args.sequencial:
+                raspar_loteca_resiliente(url_base=args.url_base, metricas=metricas)
+            else:
+                if args.completo and os.path.exists(ARQUIVO_CSV):
+                    os.remove(ARQUIVO_CSV)
+                asyncio.run(raspar_loteca_async(concorrencia=args.concorrencia, taxa_por_segundo=args.taxa,
+                                                url_base=args.url_base, metricas=metricas))
+        metricas.exportar()
@@ -0,0 +1,100 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from dados.padronizar import MAPA_REGIOES, normalizar_serie
+
+# ============================================================================
+# REGISTRO GLOBAL DE TIMES (ID inteiro estável por time canônico)
+# ----------------------------------------------------------------------------
+# O registro é append-only: um time recebe o próximo ID livre na primeira vez
+# que aparece e nunca muda de ID. Assim, arrays NumPy indexados por ID
+# (classificação, H2H, estatísticas) continuam válidos entre execuções.
+# ============================================================================
+
+ARQUIVO_REGISTRO = os.path.join('dados', 'registro_times.csv')
+
+COLUNAS_TIMES = ('Time da Casa', 'Time Visitante')
+COLUNAS_ID = {'Time da Casa': 'Id_Mandante', 'Time Visitante': 'Id_Visitante'}
+
+
+def carregar_registro(caminho=ARQUIVO_REGISTRO):
+    """Lê o registro do disco (id, time, região). Retorna vazio se ainda não existir."""
+    if not os.path.exists(caminho):
+        return pd.DataFrame({
+            'id': pd.Series(dtype='int32'),
+            'time': pd.Series(dtype='str'),
+            'região': pd.Series(dtype='str'),
+        })
+    registro = pd.read_csv(caminho, dtype={'id': 'int32', 'time': 'str', 'região': 'str'})
+    return registro.sort_values('id').reset_index(drop=True)
+
+
+def salvar_registro(registro, caminho=ARQUIVO_REGISTRO):
+    """Grava o registro de forma atômica (arquivo temporário + rename)."""
+    caminho_tmp = caminho + '.tmp'
+    registro.to_csv(caminho_tmp, index=False)
+    os.replace(caminho_tmp, caminho)
+
+
+def registrar_times(nomes, registro=None, caminho=ARQUIVO_REGISTRO, salvar=True):
+    """Normaliza os nomes e adiciona ao registro os times ainda sem ID."""
+    if registro is None:
+        registro = carregar_registro(caminho)
+
+    canonicos = normalizar_serie(pd.Series(nomes).dropna()).cat.categories
+    conhecidos = set(registro['time'])
+    novos = [t for t in canonicos if t not in conhecidos and t != 'nan']
+
+    if novos:
+        proximo_id = int(registro['id'].max()) + 1 if len(registro) else 0
+        df_novos = pd.DataFrame({
+            'id': np.arange(proximo_id, proximo_id + len(novos), dtype='int32'),
+            'time': novos,
+            'região': [MAPA_REGIOES.get(t, 'OUTRO') for t in novos],
+        })
+        registro = pd.concat([registro, df_novos], ignore_index=True)
+        if salvar:
+            salvar_registro(registro, caminho)
+        print(f"🆕 {len(novos)} times novos registrados (total: {len(registro)}).")
+
+    return registro
+
+
+def codificar_times(df, registro=None, colunas=COLUNAS_TIMES, caminho=ARQUIVO_REGISTRO):
+    """
+    Converte as colunas de times em categóricas cujas categorias seguem a ordem dos IDs
+    do registro, e adiciona as colunas int32 'Id_Mandante' / 'Id_Visitante'.
+
+    Como categoria e ID coincidem, `df['Id_Mandante']` pode indexar diretamente
+    arrays NumPy de tamanho `len(registro)`.
+    """
+    nomes = pd.concat([df[c] for c in colunas if c in df.columns], ignore_index=True)
+    registro = registrar_times(nomes, registro=registro, caminho=caminho)
+    categorias = pd.Index(registro['time'])
+
+    for coluna in colunas:
+        if coluna not in df.columns:
+            continue
+        # Normaliza só os valores únicos; os códigos da categórica viram IDs do registro
+        normalizados = normalizar_serie(df[coluna]).cat
+        ids_unicos = categorias.get_indexer(normalizados.categories).astype('int32')
+        codigos = normalizados.codes.to_numpy()
+        # Indexa só os códigos válidos: numa coluna toda NaN `ids_unicos` é vazio
+        ids = np.full(len(codigos), -1, dtype='int32')
+        presentes = codigos >= 0
+        ids[presentes] = ids_unicos[codigos[presentes]]
+
+        df[coluna] = pd.Categorical.from_codes(ids, categories=categorias)
+        df[COLUNAS_ID.get(coluna, f'Id_{coluna}')] = ids
+
+    return df
+
+
+if __name__ == "__main__":
+    from dados.armazem import carregar_partidas
+
+    df_partidas = carregar_partidas(colunas=list(COLUNAS_TIMES))
+    registro = registrar_times(pd.concat([df_partidas[c] for c in COLUNAS_TIMES]))
+    print(f"✅ Registro em '{ARQUIVO_REGISTRO}' com {len(registro)} times.")
@@ -0,0 +1,261 @@
+import argparse
+import asyncio
+import base64
+import contextlib
+import gzip
+import io
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from aiohttp import web
+
+from dados.cache_http import entradas_cache, sem_cache
+from dados.parser_ogol import extrair_colunas
+from dados.raspagemloteca import extrair_linhas_concurso, raspar_loteca_async
+
+# ============================================================================
+# GRAVAÇÃO / REPLAY DAS RASPAGENS E BENCHMARK OFFLINE
+# ----------------------------------------------------------------------------
+# Os raspadores (Loteca e ogol) já guardam cada resposta no cache HTTP
+# (dados/cache_http.py). Este módulo:
+#   - gravar:    empacota essas trocas num arquivo único e compactado
+#                (dados/armazem/replay/<nome>.jsonl.gz), portátil entre máquinas;
+#   - servir:    sobe um servidor local que responde a partir do arquivo,
+#                casando por caminho + query (o host é ignorado), com latência
+#                e falhas (5xx / timeouts) injetadas;
+#   - benchmark: sobe o servidor, roda os raspadores contra ele com o cache
+#                desligado e mede requisições/s, tempo de parser por página e
+#                linhas/s de ponta a ponta.
+#
+#   python -m dados.replay gravar --nome base --dominio servicebus2.caixa.gov.br www.ogol.com.br
+#   python -m dados.replay servir --nome base --porta 8000 --latencia 0.1 --taxa-erro 0.05
+#   python -m dados.replay benchmark --nome base --latencia 0.05
+#
+# Com o servidor no ar, os raspadores apontam para ele pela URL base:
+#   python -m dados.raspagemloteca --url-base http://127.0.0.1:8000/portaldeloterias/api/loteca
+# ============================================================================
+
+PASTA_REPLAY = os.path.join('dados', 'armazem', 'replay')
+
+HEADERS_REPASSADOS = ('Content-Type',)
+
+
+def _caminho_arquivo(nome, pasta=PASTA_REPLAY):
+    return os.path.join(pasta, f'{nome}.jsonl.gz')
+
+
+def chave_local(url):
+    """Caminho + query de uma URL: é assim que o servidor de replay encontra a troca."""
+    partes = urlparse(url)
+    return partes.path + (f'?{partes.query}' if partes.query else '')
+
+
+def gravar_arquivo(nome, dominios=None, pasta=PASTA_REPLAY):
+    """Empacota as respostas do cache HTTP (só dos `dominios`, se informados). Retorna o nº de trocas."""
+    os.makedirs(pasta, exist_ok=True)
+    destino = _caminho_arquivo(nome, pasta)
+    total = 0
+    with gzip.open(destino + '.tmp', 'wt', encoding='utf-8') as arquivo:
+        for entrada, corpo in entradas_cache():
+            if dominios and urlparse(entrada['url']).netloc not in dominios:
+                continue
+            arquivo.write(json.dumps({
+                'url': entrada['url'],
+                'status': entrada['status'],
+                'headers': {k: v for k, v in entrada['headers'].items() if k in HEADERS_REPASSADOS},
+                'buscado_em': entrada['buscado_em'],
+                'corpo': base64.b64encode(corpo).decode('ascii'),
+            }, ensure_ascii=False) + '\n')
+            total += 1
+    os.replace(destino + '.tmp', destino)
+    print(f"📼 {total} trocas gravadas em '{destino}' ({os.path.getsize(destino) / 1e6:.1f} MB).")
+    return total
+
+
+def carregar_arquivo(nome, pasta=PASTA_REPLAY):
+    """{caminho?query: {'url', 'status', 'headers', 'corpo'}} de um arquivo gravado."""
+    trocas = {}
+    with gzip.open(_caminho_arquivo(nome, pasta), 'rt', encoding='utf-8') as arquivo:
+        for linha in arquivo:
+            troca = json.loads(linha)
+            troca['corpo'] = base64.b64decode(troca['corpo'])
+            trocas[chave_local(troca['url'])] = troca
+    return trocas
+
+
+# ============================================================================
+# SERVIDOR DE REPLAY
+# ============================================================================
+
+def criar_app(trocas, latencia=0.0, variacao=0.0, taxa_erro=0.0, taxa_timeout=0.0, atraso_timeout=30.0):
+    """
+    App aiohttp que serve as `trocas`. Cada resposta espera `latencia` ± `variacao`
+    segundos; `taxa_erro` das requisições recebem 503 e `taxa_timeout` ficam
+    penduradas por `atraso_timeout` segundos. Caminho desconhecido -> 404.
+    """
+    async def responder(requisicao):
+        await asyncio.sleep(max(0.0, latencia + random.uniform(-variacao, variacao)))
+        sorteio = random.random()
+        if sorteio < taxa_timeout:
+            await asyncio.sleep(atraso_timeout)
+        elif sorteio < taxa_timeout + taxa_erro:
+            return web.Response(status=503, text='erro injetado')
+
+        troca = trocas.get(requisicao.path_qs)
+        if troca is None:
+            return web.Response(status=404)
+        return web.Response(status=troca['status'], body=troca['corpo'], headers=troca['headers'])
+
+    app = web.Application()
+    app.router.add_get('/{caminho:.*}', responder)
+    return app
+
+
+class ServidorReplay:
+    """Servidor de replay numa thread de fundo: `with ServidorReplay(trocas) as base_url: ...`."""
+
+    def __init__(self, trocas, porta=0, fabrica=criar_app, **opcoes):
+        self.trocas = trocas
+        self.porta = porta
+        self.fabrica = fabrica  # função(trocas, **opcoes) -> web.Application
+        self.opcoes = opcoes
+        self._loop = asyncio.new_event_loop()
+        self._thread = None
+
+    def _rodar(self, pronto):
+        asyncio.set_event_loop(self._loop)
+        executor = web.AppRunner(self.fabrica(self.trocas, **self.opcoes))
+        self._loop.run_until_complete(executor.setup())
+        site = web.TCPSite(executor, '127.0.0.1', self.porta)
+        self._loop.run_until_complete(site.start())
+        self.porta = executor.addresses[0][1]
+        pronto.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(executor.cleanup())
+        self._loop.close()
+
+    def __enter__(self):
+        pronto = threading.Event()
+        self._thread = threading.Thread(target=self._rodar, args=(pronto,), daemon=True)
+        self._thread.start()
+        pronto.wait()
+        return f"http://127.0.0.1:{self.porta}"
+
+    def __exit__(self, *_):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _benchmark_loteca(trocas, base_url, concorrencia):
+    caminhos = sorted((c for c in trocas if '/api/loteca/' in c), key=lambda c: int(c.rsplit('/', 1)[1]))
+    if not caminhos:
+        return None
+    prefixo, primeiro = caminhos[0].rsplit('/', 1)
+
+    inicio = time.perf_counter()
+    for caminho in caminhos:
+        extrair_linhas_concurso(json.loads(trocas[caminho]['corpo']))
+    parse_ms = (time.perf_counter() - inicio) / len(caminhos) * 1000
+
+    with tempfile.TemporaryDirectory() as pasta, contextlib.redirect_stdout(io.StringIO()):
+        estatisticas = asyncio.run(raspar_loteca_async(
+            inicio=int(primeiro), url_base=base_url + prefixo, arquivo_csv=os.path.join(pasta, 'loteca.csv'),
+            arquivo_brutos=os.path.join(pasta, 'brutos.jsonl.gz'), concorrencia=concorrencia,
+            taxa_por_segundo=10_000))
+    segundos = max(estatisticas['segundos'], 1e-9)
+    return {
+        'paginas': estatisticas['concursos'],
+        'requisicoes_por_s': round(estatisticas['requisicoes'] / segundos, 1),
+        'parse_ms_por_pagina': round(parse_ms, 3),
+        'linhas_por_s': round(estatisticas['jogos'] / segundos, 1),
+        'retentativas': estatisticas['retentativas'],
+    }
+
+
+def _benchmark_ogol(trocas, base_url):
+    caminhos = [c for c, t in trocas.items() if b'zztable stats' in t['corpo']]
+    if not caminhos:
+        return None
+
+    sessao = requests.Session()
+    requisicoes = linhas = 0
+    tempo_parser = 0.0
+    inicio = time.perf_counter()
+    for caminho in caminhos:
+        resposta = sessao.get(base_url + caminho, timeout=30)
+        requisicoes += 1
+        if resposta.status_code != 200:
+            continue
+        antes = time.perf_counter()
+        colunas = extrair_colunas(resposta.text)
+        tempo_parser += time.perf_counter() - antes
+        linhas += len(colunas['casa']) if colunas else 0
+    segundos = max(time.perf_counter() - inicio, 1e-9)
+    return {
+        'paginas': len(caminhos),
+        'requisicoes_por_s': round(requisicoes / segundos, 1),
+        'parse_ms_por_pagina': round(tempo_parser / len(caminhos) * 1000, 3),
+        'linhas_por_s': round(linhas / segundos, 1),
+    }
+
+
+def benchmark(nome, concorrencia=8, **opcoes_servidor):
+    """Roda os raspadores contra o replay (cache desligado) e imprime/retorna as métricas."""
+    trocas = carregar_arquivo(nome)
+    resultado = {}
+    with ServidorReplay(trocas, **opcoes_servidor) as base_url, sem_cache():
+        resultado['loteca'] = _benchmark_loteca(trocas, base_url, concorrencia)
+        resultado['ogol'] = _benchmark_ogol(trocas, base_url)
+
+    print(f"🏁 Benchmark sobre '{nome}' ({len(trocas)} trocas, opções {opcoes_servidor or 'padrão'})")
+    for fonte, metricas in resultado.items():
+        if metricas is None:
+            print(f"   {fonte:<7} sem páginas no arquivo")
+            continue
+        print(f"   {fonte:<7} {metricas['paginas']:>6} páginas | {metricas['requisicoes_por_s']:>8} req/s | "
+              f"{metricas['parse_ms_por_pagina']:>7} ms de parser/página | {metricas['linhas_por_s']:>9} linhas/s")
+    return resultado
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gravação/replay das raspagens e benchmark offline.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_gravar = sub.add_parser('gravar', help="empacota o cache HTTP num arquivo de replay")
+    p_gravar.add_argument('--nome', default='base')
+    p_gravar.add_argument('--dominio', nargs='*', help="só estes domínios")
+
+    for nome_comando in ('servir', 'benchmark'):
+        p = sub.add_parser(nome_comando)
+        p.add_argument('--nome', default='base')
+        p.add_argument('--latencia', type=float, default=0.0, help="segundos por resposta")
+        p.add_argument('--variacao', type=float, default=0.0, help="± segundos sobre a latência")
+        p.add_argument('--taxa-erro', type=float, default=0.0, help="fração de respostas 503")
+        p.add_argument('--taxa-timeout', type=float, default=0.0, help="fração de respostas penduradas")
+        if nome_comando == 'servir':
+            p.add_argument('--porta', type=int, default=8000)
+        else:
+            p.add_argument('--concorrencia', type=int, default=8)
+
+    args = parser.parse_args()
+    if args.comando == 'gravar':
+        gravar_arquivo(args.nome, args.dominio)
+    else:
+        opcoes = {'latencia': args.latencia, 'variacao': args.variacao,
+                  'taxa_erro': args.taxa_erro, 'taxa_timeout': args.taxa_timeout}
+        if args.comando == 'servir':
+            trocas = carregar_arquivo(args.nome)
+            print(f"📡 Servindo {len(trocas)} trocas de '{args.nome}' em http://127.0.0.1:{args.porta}")
+            web.run_app(criar_app(trocas, **opcoes), host='127.0.0.1', port=args.porta, print=None)
+        else:
+            benchmark(args.nome, args.concorrencia, **opcoes)
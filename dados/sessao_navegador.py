@@ -0,0 +1,133 @@
+import os
+
+from dados.raspagem_http import criar_navegador
+
+# ============================================================================
+# SESSÃO DE NAVEGADOR COM MEMÓRIA LIMITADA
+# ----------------------------------------------------------------------------
+# Um Chrome vivo por horas (todas as temporadas de todos os campeonatos)
+# acumula abas de anúncio e memória. A sessão:
+#   - cria o navegador só quando alguém precisa dele;
+#   - fecha abas extras que sobraram depois de cada temporada;
+#   - recicla (quit + novo navegador) a cada `max_paginas` páginas ou quando o
+#     RSS do chromedriver + processos do Chrome passa de `max_rss_mb`;
+#   - guarda o pico de memória e quantas reciclagens houve.
+# A reciclagem acontece entre temporadas: a posição vem do checkpoint da
+# tabela de tarefas (dados/motor_raspagem.py), que já sabe qual temporada é
+# a próxima, então nada é perdido nem refeito.
+# ============================================================================
+
+MAX_PAGINAS_POR_SESSAO = 150
+MAX_RSS_MB = 1500
+
+
+def _rss_processos_linux(pid):
+    """RSS (bytes) de `pid` e descendentes lendo /proc; 0 se não for possível."""
+    total = 0
+    pendentes = [pid]
+    while pendentes:
+        atual = pendentes.pop()
+        try:
+            with open(f'/proc/{atual}/status') as arquivo:
+                for linha in arquivo:
+                    if linha.startswith('VmRSS:'):
+                        total += int(linha.split()[1]) * 1024
+                        break
+            for tarefa in os.listdir(f'/proc/{atual}/task'):
+                with open(f'/proc/{atual}/task/{tarefa}/children') as arquivo:
+                    pendentes.extend(int(filho) for filho in arquivo.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+def rss_arvore(pid):
+    """Memória residente (MB) de um processo e de todos os seus filhos."""
+    try:
+        import psutil
+    except ImportError:
+        return _rss_processos_linux(pid) / 1e6
+
+    try:
+        processo = psutil.Process(pid)
+        processos = [processo] + processo.children(recursive=True)
+    except psutil.Error:
+        return 0.0
+    total = 0
+    for p in processos:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / 1e6
+
+
+class SessaoNavegador:
+    """Navegador reciclado por nº de páginas ou por memória. Use `obter()` e depois `registrar(paginas)`."""
+
+    def __init__(self, max_paginas=MAX_PAGINAS_POR_SESSAO, max_rss_mb=MAX_RSS_MB, nome=''):
+        self.max_paginas = max_paginas
+        self.max_rss_mb = max_rss_mb
+        self.nome = nome
+        self.navegador = None
+        self.paginas = 0
+        self.pico_mb = 0.0
+        self.reciclagens = 0
+
+    def obter(self):
+        if self.navegador is None:
+            self.navegador = criar_navegador()
+            self.paginas = 0
+        return self.navegador
+
+    def rss_mb(self):
+        if self.navegador is None:
+            return 0.0
+        processo = getattr(getattr(self.navegador, 'service', None), 'process', None)
+        return rss_arvore(processo.pid) if processo is not None else 0.0
+
+    def _fechar_abas_extras(self):
+        abas = self.navegador.window_handles
+        if len(abas) <= 1:
+            return
+        principal = self.navegador.current_window_handle
+        for aba in abas:
+            if aba != principal:
+                self.navegador.switch_to.window(aba)
+                self.navegador.close()
+        self.navegador.switch_to.window(principal)
+
+    def registrar(self, paginas):
+        """Contabiliza as páginas da temporada que acabou e recicla se passou de algum limite."""
+        if self.navegador is None:
+            return
+        self.paginas += paginas
+        try:
+            self._fechar_abas_extras()
+        except Exception:
+            pass
+
+        memoria = self.rss_mb()
+        self.pico_mb = max(self.pico_mb, memoria)
+        if self.paginas >= self.max_paginas:
+            self.reciclar(f"{self.paginas} páginas")
+        elif memoria >= self.max_rss_mb:
+            self.reciclar(f"RSS {memoria:.0f} MB")
+
+    def reciclar(self, motivo=''):
+        print(f"[{self.nome}] ♻️ Reciclando o navegador ({motivo}).")
+        self.descartar()
+        self.reciclagens += 1
+
+    def descartar(self):
+        """Fecha o navegador (também usado depois de um travamento); o próximo obter() cria outro."""
+        if self.navegador is not None:
+            try:
+                self.pico_mb = max(self.pico_mb, self.rss_mb())
+                self.navegador.quit()
+            except Exception:
+                pass
+            self.navegador = None
+
+    def relatorio(self):
+        return {'pico_mb': round(self.pico_mb, 1), 'reciclagens': self.reciclagens}
@@ -1,64 +1,113 @@
 import pandas as pd
 import os
 
-def gerar_csv_por_anos(arquivo_principal):
+# Mapeamento de Normalização (Padronizando conforme a sua lista)
+MAPA_NOMES = {
+    'Vasco': 'Vasco da Gama', 'Gremio': 'Grêmio', 'Goias': 'Goiás',
+    'Criciuma': 'Criciúma', 'Sao Paulo': 'São Paulo', 'Vitoria': 'EC Vitória',
+    'Atletico-MG': 'Atlético-MG', 'Parana': 'Paraná', 'Sao Caetano': 'São Caetano',
+    'Botafogo-RJ': 'Botafogo', 'Athletico-PR': 'Athletico-PR', 'Atletico-PR': 'Athletico-PR',
+    'Ceara': 'Ceará SC', 'America-MG': 'América-MG', 'Sport': 'Sport Recife'
+}
+
+# Colunas de origem -> colunas do formato final (Rodada, Data, Time da Casa, Placar, Time Visitante)
+COLUNAS_BASE = {
+    'rodada': 'rodata', 'data': 'data', 'mandante': 'mandante', 'visitante': 'visitante',
+    'gols_mandante': 'mandante_Placar', 'gols_visitante': 'visitante_Placar',
+}
+
+# Colunas opcionais que podem ser carregadas junto (ex: {'arena': 'Arena', 'tecnico_mandante': 'Tecnico_Mandante'})
+COLUNAS_EXTRAS_PADRAO = {}
+
+
+def normalizar_unicos(serie, mapa_nomes, cache):
+    """Aplica o mapa de nomes só nos valores ainda não vistos e propaga pelo dicionário de cache."""
+    for nome in serie.dropna().unique():
+        if nome not in cache:
+            cache[nome] = mapa_nomes.get(nome, nome)
+    return serie.map(cache)
+
+
+def gerar_csv_por_anos(arquivo_principal, output_dir="anos_processados", prefixo="brasileiraoA",
+                       mapa_nomes=MAPA_NOMES, colunas=COLUNAS_BASE, colunas_extras=COLUNAS_EXTRAS_PADRAO,
+                       tamanho_bloco=200_000):
+    """
+    Divide um dump histórico em um CSV por ano numa única passada em blocos.
+
+    O arquivo é lido em pedaços de `tamanho_bloco` linhas (não precisa caber na
+    memória), cada bloco é agrupado por ano e anexado ao arquivo do ano, que
+    fica aberto até o fim da varredura.
+    """
     print(f"📂 Abrindo arquivo: {arquivo_principal}...")
-    
-    # 1. Carrega o dataset completo
-    try:
-        df = pd.read_csv(arquivo_principal)
-    except FileNotFoundError:
-        print("❌ Erro: Arquivo 'campeonato-brasileiro-full.csv' não encontrado!")
-        return
 
-    # 2. Converte a coluna de data para o formato datetime do Python
-    # O formato no seu CSV é dia/mês/ano (ex: 29/3/2003)
-    df['data_dt'] = pd.to_datetime(df['data'], dayfirst=True, errors='coerce')
-    
-    # Remove linhas onde a data é inválida
-    df = df.dropna(subset=['data_dt'])
-    
-    # 3. Mapeamento de Normalização (Padronizando conforme a sua lista)
-    mapa_nomes = {
-        'Vasco': 'Vasco da Gama', 'Gremio': 'Grêmio', 'Goias': 'Goiás',
-        'Criciuma': 'Criciúma', 'Sao Paulo': 'São Paulo', 'Vitoria': 'EC Vitória',
-        'Atletico-MG': 'Atlético-MG', 'Parana': 'Paraná', 'Sao Caetano': 'São Caetano',
-        'Botafogo-RJ': 'Botafogo', 'Athletico-PR': 'Athletico-PR', 'Atletico-PR': 'Athletico-PR',
-        'Ceara': 'Ceará SC', 'America-MG': 'América-MG', 'Sport': 'Sport Recife'
-    }
+    if not os.path.exists(arquivo_principal):
+        print(f"❌ Erro: Arquivo '{arquivo_principal}' não encontrado!")
+        return
 
     # Pasta para salvar os anos
-    output_dir = "anos_processados"
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
 
-    # 4. Loop por cada ano presente no arquivo
-    anos = sorted(df['data_dt'].dt.year.unique())
-    
-    print(f"📊 Anos encontrados: {anos}")
-
-    for ano in anos:
-        df_ano = df[df['data_dt'].dt.year == ano].copy()
-        
-        # Normaliza nomes de mandante e visitante
-        df_ano['mandante'] = df_ano['mandante'].replace(mapa_nomes)
-        df_ano['visitante'] = df_ano['visitante'].replace(mapa_nomes)
-        
-        # Cria a estrutura final que definimos
-        df_final = pd.DataFrame()
-        df_final['Rodada'] = df_ano['rodata']
-        df_final['Data'] = df_ano['data_dt'].dt.strftime('%d/%m/%y')
-        df_final['Time da Casa'] = df_ano['mandante']
-        # Converte placar para o formato 3-0 (removendo o .0 se houver)
-        df_final['Placar'] = df_ano['mandante_Placar'].astype(int).astype(str) + "-" + df_ano['visitante_Placar'].astype(int).astype(str)
-        df_final['Time Visitante'] = df_ano['visitante']
-        
-        # Salva o arquivo individual
-        nome_arquivo = os.path.join(output_dir, f"brasileiraoA{int(ano)}.csv")
-        df_final.to_csv(nome_arquivo, index=False, encoding='utf-8-sig')
-        print(f"✅ Gerado: {nome_arquivo} ({len(df_final)} jogos)")
+    usecols = list(colunas.values()) + list(colunas_extras)
+    cache_nomes = {}
+    arquivos_ano = {}   # ano -> arquivo aberto
+    jogos_por_ano = {}  # ano -> quantidade de jogos escritos
+    descartadas = 0
+
+    try:
+        for bloco in pd.read_csv(arquivo_principal, usecols=usecols, dtype=str, chunksize=tamanho_bloco):
+            # O formato no CSV é dia/mês/ano (ex: 29/3/2003): formato fixo (rápido). O que falhar nele
+            # tenta ISO (2004-05-01) e, só o que ainda sobrar, a leitura tolerante do script original
+            # (dayfirst, formatos misturados) — ISO não pode ir para o dayfirst, que troca dia e mês
+            datas = bloco[colunas['data']]
+            data_dt = pd.to_datetime(datas, format='%d/%m/%Y', errors='coerce')
+            falhas = data_dt.isna() & datas.notna()
+            if falhas.any():
+                data_dt[falhas] = pd.to_datetime(datas[falhas], format='ISO8601', errors='coerce')
+                falhas = data_dt.isna() & datas.notna() & ~datas.str.match(r'^\s*\d{4}-', na=False)
+            if falhas.any():
+                data_dt[falhas] = pd.to_datetime(datas[falhas], format='mixed', dayfirst=True, errors='coerce')
+
+            # Remove linhas onde a data é inválida
+            validas = data_dt.notna()
+            descartadas += int((~validas).sum())
+            bloco, data_dt = bloco[validas], data_dt[validas]
+
+            # Cria a estrutura final que definimos
+            df_final = pd.DataFrame(index=bloco.index)
+            df_final['Rodada'] = bloco[colunas['rodada']]
+            df_final['Data'] = data_dt.dt.strftime('%d/%m/%y')
+            df_final['Time da Casa'] = normalizar_unicos(bloco[colunas['mandante']], mapa_nomes, cache_nomes)
+            # Converte placar para o formato 3-0 (removendo o .0 se houver)
+            gols_m = pd.to_numeric(bloco[colunas['gols_mandante']], errors='coerce').astype('Int64').astype(str)
+            gols_v = pd.to_numeric(bloco[colunas['gols_visitante']], errors='coerce').astype('Int64').astype(str)
+            df_final['Placar'] = (gols_m + "-" + gols_v).where(gols_m.ne('<NA>') & gols_v.ne('<NA>'), '')
+            df_final['Time Visitante'] = normalizar_unicos(bloco[colunas['visitante']], mapa_nomes, cache_nomes)
+            for origem, destino in colunas_extras.items():
+                df_final[destino] = bloco[origem].str.strip()
+
+            # Um único groupby por bloco: cada ano vai direto para o seu arquivo
+            for ano, df_ano in df_final.groupby(data_dt.dt.year.to_numpy()):
+                ano = int(ano)
+                novo = ano not in arquivos_ano
+                if novo:
+                    nome_arquivo = os.path.join(output_dir, f"{prefixo}{ano}.csv")
+                    arquivos_ano[ano] = open(nome_arquivo, 'w', newline='', encoding='utf-8-sig')
+                df_ano.to_csv(arquivos_ano[ano], index=False, header=novo)
+                jogos_por_ano[ano] = jogos_por_ano.get(ano, 0) + len(df_ano)
+    finally:
+        for arquivo in arquivos_ano.values():
+            arquivo.close()
+
+    print(f"📊 Anos encontrados: {sorted(jogos_por_ano)}")
+    for ano in sorted(jogos_por_ano):
+        print(f"✅ Gerado: {os.path.join(output_dir, f'{prefixo}{ano}.csv')} ({jogos_por_ano[ano]} jogos)")
+    if descartadas:
+        print(f"⚠️ {descartadas} linhas descartadas por data inválida.")
 
     print(f"\n🚀 Tudo pronto! Seus arquivos estão na pasta '{output_dir}'.")
 
+
 # Executa o script
-gerar_csv_por_anos('campeonato-brasileiro-full.csv')
\ No newline at end of file
+if __name__ == "__main__":
+    gerar_csv_por_anos('campeonato-brasileiro-full.csv')
@@ -0,0 +1,38 @@
+import os
+
+from dados.concursos_loteca import carregar_concursos, carregar_premios, gravar_brutos
+
+CABECALHO = 'Concurso,Data,Jogo_Num,Mandante,Gols_Mandante,Visitante,Gols_Visitante,Campeonato,Dia_Semana\n'
+
+
+def _envelhecer(caminho, segundos=10):
+    """Recua o mtime, para o teste não depender da resolução do relógio do sistema de arquivos."""
+    instante = os.path.getmtime(caminho) - segundos
+    os.utime(caminho, (instante, instante))
+
+
+def test_concursos_regerados_quando_o_csv_do_raspador_muda(tmp_path):
+    origem = tmp_path / 'dataset_loteca.csv'
+    destino = str(tmp_path / 'concursos.parquet')
+    origem.write_text(CABECALHO + '195,09/01/2006,1,VILA NOVA,3,GOIAS,0,,Domingo\n', encoding='utf-8')
+
+    assert carregar_concursos(caminho=destino, origem=str(origem))['Concurso'].tolist() == [195]
+    _envelhecer(destino)
+
+    with open(origem, 'a', encoding='utf-8') as arquivo:
+        arquivo.write('196,16/01/2006,1,SPORT,1,NAUTICO,1,,Domingo\n')
+
+    assert carregar_concursos(caminho=destino, origem=str(origem))['Concurso'].tolist() == [195, 196]
+
+
+def test_premios_regerados_quando_o_arquivo_bruto_muda(tmp_path):
+    brutos = str(tmp_path / 'concursos_brutos.jsonl.gz')
+    destino = str(tmp_path / 'premios.parquet')
+    gravar_brutos([{'numero': 195, 'dataApuracao': '09/01/2006', 'acumulado': False}], brutos)
+
+    assert carregar_premios(destino, brutos)['Concurso'].tolist() == [195]
+    _envelhecer(destino)
+
+    gravar_brutos([{'numero': 196, 'dataApuracao': '16/01/2006', 'acumulado': True}], brutos)
+
+    assert carregar_premios(destino, brutos)['Concurso'].tolist() == [195, 196]
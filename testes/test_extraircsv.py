@@ -0,0 +1,24 @@
+import pandas as pd
+
+from testes.extraircsv import gerar_csv_por_anos
+
+CABECALHO = 'rodata,data,mandante,visitante,mandante_Placar,visitante_Placar\n'
+
+
+def test_datas_dia_mes_e_iso_no_mesmo_arquivo(tmp_path):
+    origem = tmp_path / 'full.csv'
+    origem.write_text(CABECALHO
+                      + '1,29/3/2003,Vasco,Gremio,1,0\n'
+                      + '2,2004-05-01,Goias,Sport,2,2\n'
+                      + '3,2004-05-01 16:00:00,Vasco,Sport,0,1\n'
+                      + '4,05/04/04,Goias,Gremio,1,1\n'
+                      + '5,lixo,Goias,Gremio,3,1\n', encoding='utf-8')
+
+    gerar_csv_por_anos(str(origem), output_dir=str(tmp_path / 'anos'))
+
+    df_2003 = pd.read_csv(tmp_path / 'anos' / 'brasileiraoA2003.csv', dtype=str, encoding='utf-8-sig')
+    df_2004 = pd.read_csv(tmp_path / 'anos' / 'brasileiraoA2004.csv', dtype=str, encoding='utf-8-sig')
+    assert df_2003['Data'].tolist() == ['29/03/03']
+    # ISO é ano-mês-dia: 1º de maio, não 5 de janeiro
+    assert df_2004['Data'].tolist() == ['01/05/04', '01/05/04', '05/04/04']
+    assert not (tmp_path / 'anos' / 'brasileiraoA2005.csv').exists()
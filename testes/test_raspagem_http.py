@@ -0,0 +1,54 @@
+import time
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+
+from dados import raspagem_http
+from dados.raspagem_http import _esperar_tabela
+
+
+class PaginaFalsa:
+    """Só o execute_script que _assinatura_tabela usa: devolve o texto do tbody (None = sem tabela)."""
+
+    def __init__(self, texto):
+        self.texto = texto
+
+    def execute_script(self, script, *args):
+        return self.texto
+
+
+class ElementoRemovido:
+    def is_enabled(self):
+        raise StaleElementReferenceException('elemento recriado')
+
+
+class ElementoVivo:
+    def is_enabled(self):
+        return True
+
+
+@pytest.fixture(autouse=True)
+def espera_curta(monkeypatch):
+    monkeypatch.setattr(raspagem_http, 'TEMPO_MAXIMO_ESPERA', 1)
+
+
+def test_tabela_vazia_conta_como_pronta():
+    inicio = time.perf_counter()
+    assinatura, _ = _esperar_tabela(PaginaFalsa(''))
+    assert assinatura == ''
+    assert time.perf_counter() - inicio < 0.5
+
+
+def test_tabela_vazia_depois_de_uma_pagina_com_jogos():
+    assinatura, _ = _esperar_tabela(PaginaFalsa(''), 'Flamengo 2-1 Vasco', ElementoVivo())
+    assert assinatura == ''
+
+
+def test_mesma_assinatura_com_elemento_recriado():
+    assinatura, _ = _esperar_tabela(PaginaFalsa(''), '', ElementoRemovido())
+    assert assinatura == ''
+
+
+def test_sem_tabela_ou_sem_mudanca_estoura_o_tempo():
+    assert _esperar_tabela(PaginaFalsa(None))[0] is None
+    assert _esperar_tabela(PaginaFalsa('Flamengo 2-1 Vasco'), 'Flamengo 2-1 Vasco', ElementoVivo())[0] is None